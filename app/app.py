@@ -1,4 +1,6 @@
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
+
+import importlib
 
 from flet import (
     AlertDialog,
@@ -13,16 +15,20 @@ from flet import (
 
 from auth.view import ProfileScreen, SplashScreen
 from contracts.view import ContractEditorScreen, ViewContractScreen
-from core.abstractions import TView, TViewParams
+from core.abstractions import SQLModelDataSourceMixin, TView, TViewParams
 from core.client_storage_impl import ClientStorageImpl
 from core.database_storage_impl import DatabaseStorageImpl
 from core.models import RouteView
 from core.utils import AlertDialogControls
 from core.views import THeading
+from core.warmup import (
+    DATABASE_WARM_UP,
+    RENDERING_WARM_UP,
+    VIEWS_WARM_UP,
+    WarmUp,
+)
 from error_views.page_not_found_screen import Error404Screen
-from home.view import HomeScreen
 from loguru import logger
-from pandas import DataFrame
 from preferences.intent import PreferencesIntent
 from preferences.model import PreferencesStorageKeys
 from preferences.view import PreferencesScreen
@@ -41,7 +47,11 @@ from res.res_utils import (
     SPLASH_SCREEN_ROUTE,
 )
 from res.theme import APP_THEME, THEME_MODES, get_theme_mode_from_value
-from timetracking.intent import TimeTrackingIntent
+
+from tuttle.model import Client, Contact, Contract, Invoice, Project, User
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 class TuttleApp:
@@ -63,6 +73,8 @@ class TuttleApp:
             store_demo_timetracking_dataframe=self.store_demo_timetracking_dataframe,
             debug_mode=self.debug_mode,
         )
+        # if database does not exist, create it
+        self.db.ensure_database()
         preferences = PreferencesIntent(self.client_storage)
         preferences_result = preferences.get_preference_by_key(
             PreferencesStorageKeys.theme_mode_key
@@ -88,6 +100,14 @@ class TuttleApp:
         self.route_parser = TuttleRoutes(self)
         self.current_route_view: Optional[RouteView] = None
         self.page.on_resize = self.page_resize
+        self.warm_up = WarmUp()
+        self.warm_up.start(
+            [
+                (DATABASE_WARM_UP, warm_up_database),
+                (VIEWS_WARM_UP, warm_up_views),
+                (RENDERING_WARM_UP, warm_up_rendering),
+            ]
+        )
 
     def page_resize(self, e):
         if self.current_route_view:
@@ -239,8 +259,10 @@ class TuttleApp:
             self.page.window_width, self.page.window_height
         )
 
-    def store_demo_timetracking_dataframe(self, time_tracking_data: DataFrame):
+    def store_demo_timetracking_dataframe(self, time_tracking_data: "DataFrame"):
         """Caches the time tracking dataframe created from a demo installation"""
+        from timetracking.intent import TimeTrackingIntent
+
         self.timetracking_intent = TimeTrackingIntent(
             client_storage=self.client_storage
         )
@@ -253,8 +275,15 @@ class TuttleApp:
         """Closes the application."""
         self.page.window_close()
 
+    def install_demo_data(self):
+        """Replaces the database with demo data."""
+        # the database warm-up must not query the database while it is replaced
+        self.warm_up.wait(DATABASE_WARM_UP)
+        self.db.install_demo_data()
+
     def reset_and_quit(self):
         """Resets the application and quits."""
+        self.warm_up.wait(DATABASE_WARM_UP)
         self.db.reset_database()
         self.close()
 
@@ -266,7 +295,7 @@ class TuttleRoutes:
         # init callbacks for some views
         self.on_theme_changed = app.on_theme_mode_changed
         self.on_reset_and_quit = app.reset_and_quit
-        self.on_install_demo_data = app.db.install_demo_data
+        self.on_install_demo_data = app.install_demo_data
         # init common params for views
         self.tuttle_view_params = TViewParams(
             navigate_to_route=app.change_route,
@@ -311,6 +340,10 @@ class TuttleRoutes:
                 on_install_demo_data=self.on_install_demo_data,
             )
         elif routePath.match(HOME_SCREEN_ROUTE):
+            # the home screen holds all feature views and with them pandas, the
+            # tuttle core and matplotlib, so it is only imported once it is shown
+            from home.view import HomeScreen
+
             screen = HomeScreen(
                 params=self.tuttle_view_params,
             )
@@ -358,6 +391,25 @@ class TuttleRoutes:
         return self.get_page_route_view(routePath.route, view=screen)
 
 
+def warm_up_database():
+    """Loads the entities the first views display into the entity cache"""
+    data_source = SQLModelDataSourceMixin()
+    for entity_type in (User, Project, Contract, Client, Contact, Invoice):
+        data_source.query(entity_type)
+
+
+def warm_up_views():
+    """Imports the views of the home screen, and with them pandas and the tuttle core"""
+    importlib.import_module("home.view")
+
+
+def warm_up_rendering():
+    """Prepares the rendering of invoices and timesheets"""
+    from tuttle import rendering
+
+    rendering.preload()
+
+
 def get_assets_uploads_url(with_parent_dir: bool = False):
     uploads_parent_dir = "assets"
     uploads_dir = "uploads"
@@ -369,10 +421,6 @@ def get_assets_uploads_url(with_parent_dir: bool = False):
 def main(page: Page):
     """Entry point of the app"""
     app = TuttleApp(page)
-
-    # if database does not exist, create it
-    app.db.ensure_database()
-
     app.build()
 
 
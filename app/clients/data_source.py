@@ -1,6 +1,6 @@
-from typing import List, Optional, Type, Union
+from typing import List, Optional, Tuple, Type, Union
 
-from core.abstractions import SQLModelDataSourceMixin
+from core.abstractions import EntityPage, SQLModelDataSourceMixin
 from core.intent_result import IntentResult
 
 from tuttle.model import Client
@@ -32,6 +32,35 @@ class ClientDataSource(SQLModelDataSourceMixin):
                 exception=e,
             )
 
+    def get_clients_page(
+        self,
+        after: Optional[Tuple] = None,
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Fetches one page of clients, ordered by id
+
+        Args:
+            after : the cursor of the previous page, or None to fetch the first page
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  EntityPage of Client if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            page = self.query_page(
+                Client,
+                after=after,
+            )
+            return IntentResult(was_intent_successful=True, data=page)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"An exception was raised @ClientDataSource.get_clients_page {e.__class__.__name__}",
+                exception=e,
+            )
+
     def save_client(self, client: Client) -> IntentResult[Union[Type[Client], None]]:
         """Stores a client in the database. Used for creating or updating a client's information
 
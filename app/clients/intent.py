@@ -1,8 +1,8 @@
-from typing import Mapping, Type, Union
+from typing import Mapping, Optional, Tuple, Type, Union
 
 from contacts.intent import ContactsIntent
 from core.intent_result import IntentResult
-from core.abstractions import Intent
+from core.abstractions import EntityPage, Intent
 
 from tuttle.model import Client, Contact
 
@@ -39,6 +39,23 @@ class ClientsIntent(Intent):
             result.log_message_if_any()
         return {}
 
+    def get_clients_page(
+        self, after: Optional[Tuple] = None
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Get the next page of clients
+
+        Args:
+            after : the next_cursor of the previously loaded page, None for the first page
+
+        Returns:
+            IntentResult[EntityPage]: the page of clients and the cursor to the following page
+        """
+        result: IntentResult = self._data_source.get_clients_page(after=after)
+        if not result.was_intent_successful:
+            result.error_msg = "Failed to load the clients. Please retry"
+            result.log_message_if_any()
+        return result
+
     def save_client(
         self,
         client: Client = None,
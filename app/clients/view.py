@@ -11,12 +11,13 @@ from flet import (
     Row,
     UserControl,
     border_radius,
+    icons,
     padding,
 )
 
 from clients.intent import ClientsIntent
 from core import utils, views
-from core.abstractions import DialogHandler, TView, TViewParams
+from core.abstractions import DialogHandler, EntityCache, TView, TViewParams
 from core.intent_result import IntentResult
 from res import colors, dimens, fonts, res_utils
 
@@ -381,6 +382,8 @@ class ClientEditorPopUp(DialogHandler, UserControl):
         self.invoicing_contact.address = self.address
         self.client.invoicing_contact = self.invoicing_contact
         if not self.is_valid():
+            # the client was changed in place, the cached clients must not keep the unsaved changes
+            EntityCache().invalidate(Client)
             self.toggle_form_error()
             return
         self.close_dialog()
@@ -439,7 +442,14 @@ class ClientsListView(TView, UserControl):
             ]
         )
         self.clients_container = views.THomeGrid()
+        self.load_more_button = views.TSecondaryButton(
+            label="Load more",
+            icon=icons.EXPAND_MORE,
+            on_click=self.on_load_more_clicked,
+        )
+        self.load_more_button.visible = False
         self.clients_to_display = {}
+        self.next_page_cursor = None
         self.contacts = {}
         self.editor = None
 
@@ -463,9 +473,36 @@ class ClientsListView(TView, UserControl):
             # Reload all data for the view
             self.reload_all_data()
 
-    def load_all_clients(self):
-        """Loads all clients from the store"""
-        self.clients_to_display = self.intent.get_all_clients_as_map()
+    def load_first_page_of_clients(self):
+        """Loads the first page of clients from the store"""
+        self.clients_to_display = {}
+        self.next_page_cursor = None
+        self.clients_container.controls.clear()
+        self.load_next_page()
+
+    def load_next_page(self) -> bool:
+        """Loads the next page of clients and appends their cards, returns False on failure"""
+        result: IntentResult = self.intent.get_clients_page(after=self.next_page_cursor)
+        if not result.was_intent_successful:
+            self.show_snack(result.error_msg, True)
+            return False
+        for client in result.data.entities:
+            if client.id in self.clients_to_display:
+                # saved while an earlier page was displayed
+                continue
+            self.clients_to_display[client.id] = client
+            self.add_client_card(client)
+        self.next_page_cursor = result.data.next_cursor
+        self.load_more_button.visible = self.next_page_cursor is not None
+        return True
+
+    def on_load_more_clicked(self, e):
+        """Called when the user asks for more clients"""
+        self.loading_indicator.visible = True
+        self.update_self()
+        self.load_next_page()
+        self.loading_indicator.visible = False
+        self.update_self()
 
     def load_all_contacts(self):
         """Loads all contacts from the store"""
@@ -475,13 +512,16 @@ class ClientsListView(TView, UserControl):
         """Refreshes the clients list"""
         self.clients_container.controls.clear()
         for key in self.clients_to_display:
-            client = self.clients_to_display[key]
-            clientCard = ClientCard(
-                client=client,
-                on_edit=self.on_edit_client_clicked,
-                on_delete=self.on_delete_client_clicked,
-            )
-            self.clients_container.controls.append(clientCard)
+            self.add_client_card(self.clients_to_display[key])
+
+    def add_client_card(self, client: Client):
+        """Appends a card for the given client to the clients list"""
+        clientCard = ClientCard(
+            client=client,
+            on_edit=self.on_edit_client_clicked,
+            on_delete=self.on_delete_client_clicked,
+        )
+        self.clients_container.controls.append(clientCard)
 
     def on_edit_client_clicked(self, client: Client):
         """Handles the edit button click event"""
@@ -556,15 +596,10 @@ class ClientsListView(TView, UserControl):
         """Reloads all data for the view when the view is mounted or a reload-intent is received"""
         self.mounted = True
         self.loading_indicator.visible = True
-        self.load_all_clients()
+        self.load_first_page_of_clients()
         count = len(self.clients_to_display)
         self.loading_indicator.visible = False
-        if count == 0:
-            self.no_clients_control.visible = True
-            self.clients_container.controls.clear()
-        else:
-            self.no_clients_control.visible = False
-            self.refresh_clients()
+        self.no_clients_control.visible = count == 0
         self.load_all_contacts()
         self.update_self()
 
@@ -575,6 +610,7 @@ class ClientsListView(TView, UserControl):
                 self.title_control,
                 views.Spacer(md_space=True),
                 Container(self.clients_container, expand=True),
+                self.load_more_button,
             ],
         )
         return view
@@ -1,6 +1,6 @@
-from typing import List, Union
+from typing import List, Optional, Tuple, Union
 
-from core.abstractions import SQLModelDataSourceMixin
+from core.abstractions import EntityPage, SQLModelDataSourceMixin
 from core.intent_result import IntentResult
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
@@ -60,6 +60,35 @@ class ContactDataSource(SQLModelDataSourceMixin):
                 exception=e,
             )
 
+    def get_contacts_page(
+        self,
+        after: Optional[Tuple] = None,
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Fetches one page of contacts, ordered by id
+
+        Args:
+            after : the cursor of the previous page, or None to fetch the first page
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  EntityPage of Contact if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            page = self.query_page(
+                Contact,
+                after=after,
+            )
+            return IntentResult(was_intent_successful=True, data=page)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"An exception was raised @ContactDataSource.get_contacts_page {e.__class__.__name__}",
+                exception=e,
+            )
+
     def save_contact(self, contact: Contact) -> IntentResult[Union[Contact, None]]:
         """Store a contact in the data source.
 
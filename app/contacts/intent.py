@@ -1,14 +1,14 @@
-from typing import Mapping, Union
+from typing import Mapping, Optional, Tuple, Union
 
 from core.intent_result import IntentResult
-from core.abstractions import Intent
+from core.abstractions import EntityPage, Intent
 
 from tuttle.model import Contact
 
 from .data_source import ContactDataSource
 
 
-class ContactsIntent:
+class ContactsIntent(Intent):
     """Handles Contact C_R_U_D intents"""
 
     def __init__(
@@ -37,6 +37,23 @@ class ContactsIntent:
             result.log_message_if_any()
             return {}
 
+    def get_contacts_page(
+        self, after: Optional[Tuple] = None
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Get the next page of contacts
+
+        Args:
+            after : the next_cursor of the previously loaded page, None for the first page
+
+        Returns:
+            IntentResult[EntityPage]: the page of contacts and the cursor to the following page
+        """
+        result: IntentResult = self._data_source.get_contacts_page(after=after)
+        if not result.was_intent_successful:
+            result.error_msg = "Retrieving contacts failed. Please retry"
+            result.log_message_if_any()
+        return result
+
     def get_contact_by_id(self, contact_id) -> IntentResult[Contact]:
         """
         Args:
@@ -98,31 +115,33 @@ class ContactsIntent:
                 exception : Exception if an exception occurs
         """
         # contact can only be deleted if it is not invoicing contact of any client
-        query_result: IntentResult[Contact] = self.get_contact_by_id(contact_id)
-        if query_result.was_intent_successful:
-            contact: Contact = query_result.data
-            if len(contact.invoicing_contact_of) > 0:
-                return IntentResult(
-                    was_intent_successful=False,
-                    error_msg=f"Contact {contact.name} cannot be deleted because it is invoicing contact of clients: {','.join([client.name for client in contact.invoicing_contact_of])}",
-                )
-            else:
-                # contact can be deleted
-                delete_result: IntentResult[
-                    None
-                ] = self._data_source.delete_contact_by_id(contact_id)
-                if delete_result.was_intent_successful:
-                    return IntentResult(was_intent_successful=True)
-                else:
+        # check and delete within one unit of work
+        with self._data_source.unit_of_work():
+            query_result: IntentResult[Contact] = self.get_contact_by_id(contact_id)
+            if query_result.was_intent_successful:
+                contact: Contact = query_result.data
+                if len(contact.invoicing_contact_of) > 0:
                     return IntentResult(
                         was_intent_successful=False,
-                        error_msg=delete_result.error_msg,
-                        log_message=delete_result.log_message,
+                        error_msg=f"Contact {contact.name} cannot be deleted because it is invoicing contact of clients: {','.join([client.name for client in contact.invoicing_contact_of])}",
                     )
-        else:
-            return IntentResult(
-                was_intent_successful=False,
-                error_msg=query_result.error_msg,
-                log_message=query_result.log_message,
-                exception=query_result.exception,
-            )
+                else:
+                    # contact can be deleted
+                    delete_result: IntentResult[
+                        None
+                    ] = self._data_source.delete_contact_by_id(contact_id)
+                    if delete_result.was_intent_successful:
+                        return IntentResult(was_intent_successful=True)
+                    else:
+                        return IntentResult(
+                            was_intent_successful=False,
+                            error_msg=delete_result.error_msg,
+                            log_message=delete_result.log_message,
+                        )
+            else:
+                return IntentResult(
+                    was_intent_successful=False,
+                    error_msg=query_result.error_msg,
+                    log_message=query_result.log_message,
+                    exception=query_result.exception,
+                )
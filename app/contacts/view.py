@@ -11,12 +11,13 @@ from flet import (
     Row,
     UserControl,
     border_radius,
+    icons,
     padding,
 )
 
 from contacts.intent import ContactsIntent
 from core import utils, views
-from core.abstractions import DialogHandler, TView, TViewParams
+from core.abstractions import DialogHandler, EntityCache, TView, TViewParams
 from core.intent_result import IntentResult
 from res import colors, dimens, fonts, res_utils
 
@@ -254,14 +255,20 @@ class ContactEditorPopUp(DialogHandler):
         self.address.country = country if country else self.contact.address.country
         self.contact.address = self.address
         if self.contact.address.is_empty:
+            self.discard_changes()
             self.on_error_callback("Address cannot be empty")
             return
         if not self.contact.first_name or not self.contact.last_name:
+            self.discard_changes()
             self.on_error_callback("First and last name cannot be empty")
             return
         self.close_dialog()
         self.on_submit_callback(self.contact)
 
+    def discard_changes(self):
+        """The contact was changed in place, the cached contacts must not keep the unsaved changes"""
+        EntityCache().invalidate(Contact)
+
 
 class ContactsListView(TView, UserControl):
     """The view for the contacts list page"""
@@ -288,7 +295,14 @@ class ContactsListView(TView, UserControl):
             ]
         )
         self.contacts_container = views.THomeGrid()
+        self.load_more_button = views.TSecondaryButton(
+            label="Load more",
+            icon=icons.EXPAND_MORE,
+            on_click=self.on_load_more_clicked,
+        )
+        self.load_more_button.visible = False
         self.contacts_to_display = {}
+        self.next_page_cursor = None
         self.editor = None
 
     def parent_intent_listener(self, intent: str, data: any):
@@ -322,21 +336,53 @@ class ContactsListView(TView, UserControl):
         self.loading_indicator.visible = False
         self.update_self()
 
-    def load_all_contacts(self):
+    def load_first_page_of_contacts(self):
+        """Loads the first page of contacts from the store"""
+        self.contacts_to_display = {}
+        self.next_page_cursor = None
+        self.contacts_container.controls.clear()
+        self.load_next_page()
 
-        self.contacts_to_display = self.intent.get_all_contacts_as_map()
+    def load_next_page(self) -> bool:
+        """Loads the next page of contacts and appends their cards, returns False on failure"""
+        result: IntentResult = self.intent.get_contacts_page(
+            after=self.next_page_cursor
+        )
+        if not result.was_intent_successful:
+            self.show_snack(result.error_msg, True)
+            return False
+        for contact in result.data.entities:
+            if contact.id in self.contacts_to_display:
+                # saved while an earlier page was displayed
+                continue
+            self.contacts_to_display[contact.id] = contact
+            self.add_contact_card(contact)
+        self.next_page_cursor = result.data.next_cursor
+        self.load_more_button.visible = self.next_page_cursor is not None
+        return True
+
+    def on_load_more_clicked(self, e):
+        """Called when the user asks for more contacts"""
+        self.loading_indicator.visible = True
+        self.update_self()
+        self.load_next_page()
+        self.loading_indicator.visible = False
+        self.update_self()
 
     def refresh_list(self):
         """Refreshes the displayed list of contacts"""
         self.contacts_container.controls.clear()
         for key in self.contacts_to_display:
-            contact = self.contacts_to_display[key]
-            contactCard = ContactCard(
-                contact=contact,
-                on_edit_clicked=self.on_edit_contact_clicked,
-                on_deleted_clicked=self.on_delete_contact_clicked,
-            )
-            self.contacts_container.controls.append(contactCard)
+            self.add_contact_card(self.contacts_to_display[key])
+
+    def add_contact_card(self, contact: Contact):
+        """Appends a card for the given contact to the displayed list"""
+        contactCard = ContactCard(
+            contact=contact,
+            on_edit_clicked=self.on_edit_contact_clicked,
+            on_deleted_clicked=self.on_delete_contact_clicked,
+        )
+        self.contacts_container.controls.append(contactCard)
 
     def on_edit_contact_clicked(self, contact: Contact):
         """Called when the edit button is clicked"""
@@ -407,15 +453,10 @@ class ContactsListView(TView, UserControl):
         """Reloads all the data when view is mounted or parent view passes a reload intent"""
         self.mounted = True
         self.loading_indicator.visible = True
-        self.load_all_contacts()
+        self.load_first_page_of_contacts()
         count = len(self.contacts_to_display)
         self.loading_indicator.visible = False
-        if count == 0:
-            self.no_contacts_control.visible = True
-            self.contacts_container.controls.clear()
-        else:
-            self.no_contacts_control.visible = False
-            self.refresh_list()
+        self.no_contacts_control.visible = count == 0
         self.update_self()
 
     def build(self):
@@ -425,6 +466,7 @@ class ContactsListView(TView, UserControl):
                 self.title_control,
                 views.Spacer(md_space=True),
                 Container(self.contacts_container, expand=True),
+                self.load_more_button,
             ]
         )
 
@@ -1,8 +1,10 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import datetime
 
-from core.abstractions import SQLModelDataSourceMixin
+import sqlmodel
+
+from core.abstractions import EntityPage, SQLModelDataSourceMixin
 from core.intent_result import IntentResult
 
 from tuttle.model import Client, Contract
@@ -35,6 +37,102 @@ class ContractDataSource(SQLModelDataSourceMixin):
                 exception=e,
             )
 
+    def get_contracts_page(
+        self,
+        after: Optional[Tuple] = None,
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Fetches one page of contracts, ordered by id
+
+        Args:
+            after : the cursor of the previous page, or None to fetch the first page
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  EntityPage of Contract if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            page = self.query_page(
+                Contract,
+                after=after,
+            )
+            return IntentResult(was_intent_successful=True, data=page)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"An exception was raised @ContractDataSource.get_contracts_page {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_active_contracts(self) -> IntentResult[Union[List[Contract], None]]:
+        """Fetches the contracts that are not completed, have started and have not ended yet
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  list[Contract] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            today = datetime.date.today()
+            contracts = self.query_filtered(
+                Contract,
+                sqlmodel.not_(Contract.is_completed),
+                Contract.start_date <= today,
+                sqlmodel.or_(Contract.end_date == None, Contract.end_date > today),
+            )
+            return IntentResult(was_intent_successful=True, data=contracts)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"An exception was raised @ContractDataSource.get_active_contracts {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_completed_contracts(self) -> IntentResult[Union[List[Contract], None]]:
+        """Fetches the contracts that are marked as completed
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  list[Contract] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            contracts = self.query_filtered(Contract, Contract.is_completed)
+            return IntentResult(was_intent_successful=True, data=contracts)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"An exception was raised @ContractDataSource.get_completed_contracts {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_upcoming_contracts(self) -> IntentResult[Union[List[Contract], None]]:
+        """Fetches the contracts that are scheduled to start in the future
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  list[Contract] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            today = datetime.date.today()
+            contracts = self.query_filtered(Contract, Contract.start_date > today)
+            return IntentResult(was_intent_successful=True, data=contracts)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"An exception was raised @ContractDataSource.get_upcoming_contracts {e.__class__.__name__}",
+                exception=e,
+            )
+
     def get_contract_by_id(self, contract_id) -> IntentResult[Union[Contract, None]]:
         """Fetches a contract with the contract id if one exists
 
@@ -1,10 +1,10 @@
-from typing import Mapping, Optional
+from typing import Mapping, Optional, Tuple
 
 import datetime
 
 from clients.intent import ClientsIntent
 from contacts.intent import ContactsIntent
-from core.abstractions import ClientStorage, Intent
+from core.abstractions import ClientStorage, EntityPage, Intent
 from core.intent_result import IntentResult
 from preferences.intent import PreferencesIntent
 from preferences.model import PreferencesStorageKeys
@@ -15,7 +15,7 @@ from tuttle.time import Cycle, TimeUnit
 from .data_source import ContractDataSource
 
 
-class ContractsIntent:
+class ContractsIntent(Intent):
     """Handles Contract C_R_U_D intents"""
 
     def __init__(self):
@@ -145,62 +145,70 @@ class ContractsIntent:
         contract.term_of_payment = term_of_payment
         contract.billing_cycle = billing_cycle
         contract.is_completed = is_completed
-        result: IntentResult = self._data_source.save_contract(
-            contract=contract,
-        )
-        if not result.was_intent_successful:
-            if is_updating:
-                # recover old contract state
-                old_contract_result: IntentResult = self.get_contract_by_id(contract.id)
-                result.data = (
-                    old_contract_result.data
-                    if old_contract_result.was_intent_successful
-                    else None
+        # save and, on failure, reload within one unit of work
+        with self._data_source.unit_of_work():
+            result: IntentResult = self._data_source.save_contract(
+                contract=contract,
+            )
+            if not result.was_intent_successful:
+                if is_updating:
+                    # recover old contract state
+                    old_contract_result: IntentResult = self.get_contract_by_id(
+                        contract.id
+                    )
+                    result.data = (
+                        old_contract_result.data
+                        if old_contract_result.was_intent_successful
+                        else None
+                    )
+                result.error_msg = (
+                    "Failed to save the contract. Verify the info and retry."
                 )
-            result.error_msg = "Failed to save the contract. Verify the info and retry."
-            result.log_message_if_any()
+                result.log_message_if_any()
         return result
 
     def get_all_contracts_as_map(self) -> Mapping[int, Contract]:
-        """Retrieves all completed contracts as a map"""
-        result = self._data_source.get_all_contracts()
+        """Retrieves all contracts as a map"""
+        return self._contracts_result_as_map(self._data_source.get_all_contracts())
+
+    def _contracts_result_as_map(self, result: IntentResult) -> Mapping[int, Contract]:
+        """Converts the result of a contracts query to a map of contract_id to contract"""
         if result.was_intent_successful:
-            contracts = result.data
-            contracts_map = {contract.id: contract for contract in contracts}
-            return contracts_map
+            return {contract.id: contract for contract in result.data}
         else:
             result.log_message_if_any()
             return {}
 
+    def get_contracts_page(
+        self, after: Optional[Tuple] = None
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Get the next page of contracts
+
+        Args:
+            after : the next_cursor of the previously loaded page, None for the first page
+
+        Returns:
+            IntentResult[EntityPage]: the page of contracts and the cursor to the following page
+        """
+        result: IntentResult = self._data_source.get_contracts_page(after=after)
+        if not result.was_intent_successful:
+            result.error_msg = "Failed to load the contracts. Please retry"
+            result.log_message_if_any()
+        return result
+
     def get_completed_contracts(self) -> Mapping[int, Contract]:
         """Retrieves all completed contracts as a map"""
-        _all_contracts = self.get_all_contracts_as_map()
-        _completed_contracts = {}
-        for key in _all_contracts:
-            c = _all_contracts[key]
-            if c.is_completed:
-                _completed_contracts[key] = c
-        return _completed_contracts
-
-    def get_active_contracts(self):
+        return self._contracts_result_as_map(
+            self._data_source.get_completed_contracts()
+        )
+
+    def get_active_contracts(self) -> Mapping[int, Contract]:
         """Retrieves all active contracts as a map"""
-        _all_contracts = self.get_all_contracts_as_map()
-        _active_contracts = {}
-        for key in _all_contracts:
-            c = _all_contracts[key]
-            if c.is_active():
-                _active_contracts[key] = c
-        return _active_contracts
-
-    def get_upcoming_contracts(self):
+        return self._contracts_result_as_map(self._data_source.get_active_contracts())
+
+    def get_upcoming_contracts(self) -> Mapping[int, Contract]:
         """Retrieves all upcoming contracts as a map"""
-        _all_contracts = self.get_all_contracts_as_map()
-        _upcoming_contracts = {}
-        for key in _all_contracts:
-            c = _all_contracts[key]
-            if c.is_upcoming():
-                _upcoming_contracts[key] = c
-        return _upcoming_contracts
+        return self._contracts_result_as_map(self._data_source.get_upcoming_contracts())
 
     def delete_contract_by_id(self, contract_id: str):
         """Deletes the contract with the given id"""
@@ -637,21 +637,63 @@ class ContractsListView(TView, UserControl):
             ]
         )
         self.contracts_container = views.THomeGrid()
+        self.load_more_button = views.TSecondaryButton(
+            label="Load more",
+            icon=icons.EXPAND_MORE,
+            on_click=self.on_load_more_clicked,
+        )
+        self.load_more_button.visible = False
         self.contracts_to_display = {}
+        self.next_page_cursor = None
         self.pop_up_handler = None
 
     def display_currently_filtered_contracts(self):
         """Display the contracts that match the current filter."""
         self.contracts_container.controls.clear()
         for key in self.contracts_to_display:
-            contract = self.contracts_to_display[key]
-            contractCard = ContractCard(
-                contract=contract,
-                on_click_view=self.on_view_contract_clicked,
-                on_click_edit=self.on_edit_contract_clicked,
-                on_click_delete=self.on_delete_contract_clicked,
-            )
-            self.contracts_container.controls.append(contractCard)
+            self.add_contract_card(self.contracts_to_display[key])
+
+    def add_contract_card(self, contract: Contract):
+        """Appends a card for the given contract to the displayed contracts."""
+        contractCard = ContractCard(
+            contract=contract,
+            on_click_view=self.on_view_contract_clicked,
+            on_click_edit=self.on_edit_contract_clicked,
+            on_click_delete=self.on_delete_contract_clicked,
+        )
+        self.contracts_container.controls.append(contractCard)
+
+    def load_next_page(self) -> bool:
+        """Loads the next page of contracts and appends their cards. Returns False on failure."""
+        result: IntentResult = self.intent.get_contracts_page(
+            after=self.next_page_cursor
+        )
+        if not result.was_intent_successful:
+            self.show_snack(result.error_msg, True)
+            return False
+        for contract in result.data.entities:
+            if contract.id in self.contracts_to_display:
+                # saved while an earlier page was displayed
+                continue
+            self.contracts_to_display[contract.id] = contract
+            self.add_contract_card(contract)
+        self.next_page_cursor = result.data.next_cursor
+        self.load_more_button.visible = self.next_page_cursor is not None
+        return True
+
+    def reset_pages(self):
+        """Clears the displayed contracts so that paging starts over with the first page."""
+        self.contracts_to_display = {}
+        self.next_page_cursor = None
+        self.contracts_container.controls.clear()
+
+    def on_load_more_clicked(self, e):
+        """Called when the user asks for more contracts."""
+        self.loading_indicator.visible = True
+        self.update_self()
+        self.load_next_page()
+        self.loading_indicator.visible = False
+        self.update_self()
 
     def on_view_contract_clicked(self, contract_id: str):
         """Called when the user clicks on the view button for a contract. Redirects to the contract details screen."""
@@ -698,6 +740,7 @@ class ContractsListView(TView, UserControl):
 
     def on_filter_contracts(self, filterByState: ContractStates):
         """Called when the user changes the filter for the contracts. Reloads the list of contracts."""
+        self.load_more_button.visible = False
         if filterByState.value == ContractStates.ACTIVE.value:
             self.contracts_to_display = self.intent.get_active_contracts()
         elif filterByState.value == ContractStates.UPCOMING.value:
@@ -705,7 +748,11 @@ class ContractsListView(TView, UserControl):
         elif filterByState.value == ContractStates.COMPLETED.value:
             self.contracts_to_display = self.intent.get_completed_contracts()
         else:
-            self.contracts_to_display = self.intent.get_all_contracts_as_map()
+            # all contracts are paged
+            self.reset_pages()
+            self.load_next_page()
+            self.update_self()
+            return
         self.display_currently_filtered_contracts()
         self.update_self()
 
@@ -725,15 +772,11 @@ class ContractsListView(TView, UserControl):
         self.loading_indicator.visible = True
         self.update_self()
 
-        # fetch contracts
-        self.contracts_to_display = self.intent.get_all_contracts_as_map()
+        # fetch the first page of contracts
+        self.reset_pages()
+        self.load_next_page()
         count = len(self.contracts_to_display)
-        if count == 0:
-            self.no_contracts_control.visible = True
-            self.contracts_container.controls.clear()
-        else:
-            self.no_contracts_control.visible = False
-            self.display_currently_filtered_contracts()
+        self.no_contracts_control.visible = count == 0
         self.loading_indicator.visible = False
         self.update_self()
 
@@ -746,6 +789,7 @@ class ContractsListView(TView, UserControl):
                 ContractFiltersView(onStateChanged=self.on_filter_contracts),
                 views.Spacer(md_space=True),
                 Container(self.contracts_container, expand=True),
+                self.load_more_button,
             ]
         )
         return view
@@ -1,17 +1,25 @@
-from typing import Any, Callable, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
 import functools
+import threading
 
 from flet import AlertDialog, file_picker
 
+import sqlalchemy
 import sqlmodel
 from sqlmodel import pool
 
 from loguru import logger
 
+from tuttle import tracing
+from tuttle.dev import singleton
+
+from . import instrumentation
 from .utils import AUTO_SCROLL, START_ALIGNMENT, AlertDialogControls
 
 
@@ -177,6 +185,200 @@ class DialogHandler(ABC):
             self.close_dialog()
 
 
+DEFAULT_PAGE_SIZE = 50
+
+
+@dataclass
+class EntityPage:
+    """A page of entities returned by a keyset-paginated query
+
+    Params:
+        entities - the entities on this page, in query order
+        next_cursor - pass as `after` to fetch the following page, None if this is the last page
+    """
+
+    entities: List
+    next_cursor: Optional[Tuple] = None
+
+
+class UnitOfWork:
+    """Spans the database work of one user action
+
+    While a unit of work is active, all data source calls made in the same context share
+    its session, and with it one identity map and one transaction. Changes are flushed as
+    they happen and committed once when the unit of work ends, or rolled back if it ends
+    with an exception. Units of work do not nest: entering one while another is active
+    joins the outer one, which remains responsible for the commit.
+
+    The entity cache is invalidated as writes are flushed, and again for the written
+    types once the unit of work ends, since other threads may have cached rows that
+    were not yet committed or were rolled back.
+    """
+
+    def __init__(self, db_engine):
+        self.db_engine = db_engine
+        self.session: Optional[sqlmodel.Session] = None
+        self.written_types: Set[Type[sqlmodel.SQLModel]] = set()
+        self._token = None
+
+    def __enter__(self) -> "UnitOfWork":
+        if _current_unit_of_work.get() is not None:
+            # join the active unit of work
+            return _current_unit_of_work.get()
+        self.session = sqlmodel.Session(
+            self.db_engine,
+            expire_on_commit=False,
+        )
+        self._token = _current_unit_of_work.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._token is None:
+            return False
+        try:
+            if exc_type is None:
+                self.session.commit()
+            else:
+                logger.debug(f"rolling back unit of work after {exc_type.__name__}")
+                self.session.rollback()
+        finally:
+            self.session.close()
+            _current_unit_of_work.reset(self._token)
+            self._token = None
+            for entity_type in self.written_types:
+                EntityCache().invalidate(entity_type)
+            self.written_types.clear()
+        return False
+
+
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar(
+    "tuttle_unit_of_work", default=None
+)
+
+
+@functools.lru_cache(maxsize=None)
+def related_entity_types(
+    entity_type: Type[sqlmodel.SQLModel],
+) -> Set[Type[sqlmodel.SQLModel]]:
+    """Returns the entity type and all types reachable from it through relationships, in either direction"""
+    related = {entity_type}
+    to_visit = [entity_type]
+    while to_visit:
+        mapper = sqlalchemy.inspect(to_visit.pop())
+        for relationship in mapper.relationships:
+            other = relationship.mapper.class_
+            if other not in related:
+                related.add(other)
+                to_visit.append(other)
+    return related
+
+
+@singleton
+class EntityCache:
+    """Process-wide cache of entities keyed by (type, id)
+
+    Once all entities of a type have been queried they are served from memory until a
+    write invalidates them. Writing an entity invalidates its own type and every type
+    related to it, because saving cascades into related entities and cached entities
+    carry their related entities along.
+
+    Every invalidation bumps the version of the types it drops. A query reads the version
+    before it starts and passes it to put_all, which ignores the result if a write has
+    invalidated the type in the meantime, on this thread or another.
+
+    The cached entities are shared by all callers. Code that changes an entity and then
+    abandons the change without saving it must invalidate the entity's type.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.RLock()
+        self._entities: Dict[Type[sqlmodel.SQLModel], Dict[int, Any]] = {}
+        self._versions: Dict[Type[sqlmodel.SQLModel], int] = {}
+        # bumped by clear, which drops every type
+        self._generation = 0
+        self._listeners: List[Callable[[Optional[Type[sqlmodel.SQLModel]]], None]] = []
+
+    def get_all(self, entity_type: Type[sqlmodel.SQLModel]) -> Optional[List]:
+        """Returns all entities of the type, or None if they are not cached"""
+        with self._lock:
+            entities = self._entities.get(entity_type)
+            return None if entities is None else list(entities.values())
+
+    def get(
+        self, entity_type: Type[sqlmodel.SQLModel], entity_id: int
+    ) -> Optional[Any]:
+        """Returns the entity of the type with the given id, or None if it is not cached"""
+        with self._lock:
+            return self._entities.get(entity_type, {}).get(entity_id)
+
+    def version(self, entity_type: Type[sqlmodel.SQLModel]) -> Tuple[int, int]:
+        """The version of the cached entities of the type, read before querying them"""
+        with self._lock:
+            return self._generation, self._versions.get(entity_type, 0)
+
+    def put_all(
+        self,
+        entity_type: Type[sqlmodel.SQLModel],
+        entities: List,
+        version: Tuple[int, int],
+    ):
+        """Caches the complete set of entities of the type, unless the type was invalidated since the version was read"""
+        with self._lock:
+            if version != self.version(entity_type):
+                return
+            self._entities[entity_type] = {entity.id: entity for entity in entities}
+
+    def invalidate(self, entity_type: Type[sqlmodel.SQLModel]):
+        """Drops the cached entities of the type and of all related types"""
+        with self._lock:
+            for related_type in related_entity_types(entity_type):
+                self._entities.pop(related_type, None)
+                self._versions[related_type] = self._versions.get(related_type, 0) + 1
+        self._notify(entity_type)
+
+    def clear(self):
+        """Drops all cached entities, e.g. after the database has been replaced"""
+        with self._lock:
+            self._entities.clear()
+            self._generation += 1
+        self._notify(None)
+
+    def add_invalidation_listener(
+        self, listener: Callable[[Optional[Type[sqlmodel.SQLModel]]], None]
+    ):
+        """Registers a callback for writes, called with the written entity type or None if everything was cleared"""
+        self._listeners.append(listener)
+
+    def _notify(self, entity_type: Optional[Type[sqlmodel.SQLModel]]):
+        for listener in self._listeners:
+            listener(entity_type)
+
+
+def _count_sql_statement(*args):
+    tracing.count("sql_statements")
+
+
+def traced_query(method):
+    """Records the calls of a data source method as tracing spans named after the data source"""
+
+    @functools.wraps(method)
+    def wrapper(self, entity_or_type, *args, **kwargs):
+        if not tracing.is_enabled():
+            return method(self, entity_or_type, *args, **kwargs)
+        entity_type = (
+            entity_or_type if isinstance(entity_or_type, type) else type(entity_or_type)
+        )
+        with tracing.span(
+            f"{self.__class__.__name__}.{method.__name__}",
+            category="db",
+            entity=entity_type.__name__,
+        ):
+            return method(self, entity_or_type, *args, **kwargs)
+
+    return wrapper
+
+
 class SQLModelDataSourceMixin:
     """Implements common methods for data sources that interact with SQLModel"""
 
@@ -192,6 +394,10 @@ class SQLModelDataSourceMixin:
             connect_args={"check_same_thread": False},
             poolclass=pool.StaticPool,
         )
+        sqlalchemy.event.listen(
+            self.db_engine, "before_cursor_execute", _count_sql_statement
+        )
+        self.entity_cache = EntityCache()
 
     def create_session(self):
         return sqlmodel.Session(
@@ -199,25 +405,83 @@ class SQLModelDataSourceMixin:
             expire_on_commit=False,
         )
 
+    def unit_of_work(self) -> UnitOfWork:
+        """Returns a unit of work that makes all data source calls within it share one session and commit once
+
+        Usage:
+            with data_source.unit_of_work():
+                data_source.store(entity)
+                ...
+        """
+        return UnitOfWork(self.db_engine)
+
+    @contextmanager
+    def session_scope(self):
+        """Provides the session of the active unit of work, or else a short-lived session of its own
+
+        If an operation fails within a unit of work, its session is rolled back so that the
+        caller can keep using it, e.g. to reload the entity it failed to store.
+        """
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is None:
+            with self.create_session() as session:
+                yield session
+        else:
+            try:
+                yield unit_of_work.session
+            except Exception:
+                unit_of_work.session.rollback()
+                raise
+
+    def invalidate_cache(self, entity_type: Type[sqlmodel.SQLModel]):
+        """Invalidates the cached entities of the written type, again when the active unit of work ends"""
+        self.entity_cache.invalidate(entity_type)
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is not None:
+            unit_of_work.written_types.add(entity_type)
+
+    def commit(self, session: sqlmodel.Session):
+        """Commits the session, or only flushes it if the commit is left to the active unit of work"""
+        if _current_unit_of_work.get() is None:
+            session.commit()
+        else:
+            session.flush()
+
+    @traced_query
     def query(self, entity_type: Type[sqlmodel.SQLModel]) -> List:
         """Queries the database for all instances of the given entity type"""
+        use_cache = _current_unit_of_work.get() is None
+        if use_cache:
+            entities = self.entity_cache.get_all(entity_type)
+            if entities is not None:
+                logger.debug(f"serving {len(entities)} {entity_type} from cache")
+                return entities
         logger.debug(f"querying {entity_type}")
-        with self.create_session() as session:
+        version = self.entity_cache.version(entity_type)
+        with self.session_scope() as session:
             entities = session.exec(sqlmodel.select(entity_type)).all()
+        if use_cache:
+            self.entity_cache.put_all(entity_type, entities, version)
         if len(entities) == 0:
             logger.warning(f"No instances of {entity_type} found")
         else:
             logger.debug(f"Found {len(entities)} instances of {entity_type}")
         return entities
 
+    @traced_query
     def query_by_id(
         self,
         entity_type: Type[sqlmodel.SQLModel],
         entity_id: int,
     ) -> Optional[sqlmodel.SQLModel]:
         """Queries the database for an instance of the given entity type with the given id"""
+        if _current_unit_of_work.get() is None:
+            entity = self.entity_cache.get(entity_type, entity_id)
+            if entity is not None:
+                logger.debug(f"serving {entity_type} with id={entity_id} from cache")
+                return entity
         logger.debug(f"querying {entity_type} by id={entity_id}")
-        with self.create_session() as session:
+        with self.session_scope() as session:
             entity = session.exec(
                 sqlmodel.select(entity_type).where(entity_type.id == entity_id)
             ).one()
@@ -227,6 +491,7 @@ class SQLModelDataSourceMixin:
             logger.info(f"Found instance of {entity_type} with id={entity_id}")
         return entity
 
+    @traced_query
     def query_where(
         self,
         entity_type: Type[sqlmodel.SQLModel],
@@ -235,7 +500,7 @@ class SQLModelDataSourceMixin:
     ) -> List:
         """Queries the database for all instances of the given entity type that have the given field value"""
         logger.debug(f"querying {entity_type} by {field_name}={field_value}")
-        with self.create_session() as session:
+        with self.session_scope() as session:
             entities = session.exec(
                 sqlmodel.select(entity_type).where(
                     getattr(entity_type, field_name) == field_value
@@ -247,6 +512,75 @@ class SQLModelDataSourceMixin:
             logger.info(f"Found {len(entities)} instances of {entity_type}")
         return entities
 
+    @traced_query
+    def query_filtered(
+        self,
+        entity_type: Type[sqlmodel.SQLModel],
+        *where_clauses: Any,
+    ) -> List:
+        """Queries the database for all instances of the given entity type that satisfy all of the given where clauses"""
+        logger.debug(f"querying {entity_type} filtered by {len(where_clauses)} clauses")
+        with self.session_scope() as session:
+            entities = session.exec(
+                sqlmodel.select(entity_type).where(*where_clauses)
+            ).all()
+        if len(entities) == 0:
+            logger.warning(f"No matching instances of {entity_type} found")
+        else:
+            logger.info(f"Found {len(entities)} matching instances of {entity_type}")
+        return entities
+
+    @traced_query
+    def query_page(
+        self,
+        entity_type: Type[sqlmodel.SQLModel],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        after: Optional[Tuple] = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> EntityPage:
+        """Queries one page of instances of the given entity type using keyset pagination
+
+        Entities are ordered by the given field with the id as tie-breaker. Instead of an
+        OFFSET, each page continues after the (order value, id) cursor of the previous page,
+        so fetching a page costs the same no matter how deep into the table it is.
+        """
+        logger.debug(f"querying page of {entity_type} after {after}")
+        order_column = getattr(entity_type, order_by)
+        id_column = entity_type.id
+        statement = sqlmodel.select(entity_type)
+        if after is not None:
+            last_value, last_id = after
+            if descending:
+                statement = statement.where(
+                    sqlmodel.or_(
+                        order_column < last_value,
+                        sqlmodel.and_(order_column == last_value, id_column < last_id),
+                    )
+                )
+            else:
+                statement = statement.where(
+                    sqlmodel.or_(
+                        order_column > last_value,
+                        sqlmodel.and_(order_column == last_value, id_column > last_id),
+                    )
+                )
+        if descending:
+            statement = statement.order_by(order_column.desc(), id_column.desc())
+        else:
+            statement = statement.order_by(order_column, id_column)
+        # fetch one extra row to find out whether there is a next page
+        statement = statement.limit(page_size + 1)
+        with self.session_scope() as session:
+            entities = session.exec(statement).all()
+        next_cursor = None
+        if len(entities) > page_size:
+            entities = entities[:page_size]
+            last = entities[-1]
+            next_cursor = (getattr(last, order_by), last.id)
+        logger.debug(f"Found {len(entities)} instances of {entity_type} on page")
+        return EntityPage(entities=entities, next_cursor=next_cursor)
+
     def query_the_only(self, entity_type: Type[sqlmodel.SQLModel]) -> sqlmodel.SQLModel:
         """Queries the database for the only instance of the given entity type. Raises an error if there are more than one"""
         entities = self.query(entity_type)
@@ -257,41 +591,38 @@ class SQLModelDataSourceMixin:
         else:
             return None
 
+    @traced_query
     def store(self, entity: sqlmodel.SQLModel):
         """Stores the given entity in the database"""
         # logger.debug(f"storing {entity}")
-        with self.create_session() as session:
-            session.add(entity)
-            session.commit()
-            session.refresh(entity)
-
+        try:
+            with self.session_scope() as session:
+                session.add(entity)
+                self.commit(session)
+                session.refresh(entity)
+        finally:
+            self.invalidate_cache(type(entity))
+
+    @traced_query
     def delete_by_id(self, entity_type: Type[sqlmodel.SQLModel], entity_id: int):
         """Deletes the entity of the given type with the given id from the database"""
         logger.debug(f"deleting {entity_type} with id={entity_id}")
-        with self.create_session() as session:
-            session.exec(
-                sqlmodel.delete(entity_type).where(entity_type.id == entity_id)
-            )
-            session.commit()
+        try:
+            with self.session_scope() as session:
+                session.exec(
+                    sqlmodel.delete(entity_type).where(entity_type.id == entity_id)
+                )
+                self.commit(session)
+        finally:
+            self.invalidate_cache(entity_type)
 
 
 class Intent(ABC):
-    """Abstract base class for intent classes."""
-
-    def __getattribute__(self, name):
-        """Logs all calls to methods of this class""" ""
-        attr = object.__getattribute__(self, name)
-        if callable(attr):
-
-            @functools.wraps(attr)
-            def wrapped(*args, **kwargs):
-                class_name = self.__class__.__name__
-                # Mask password argument if exists
-                kwargs = {
-                    k: "******" if k == "password" else v for k, v in kwargs.items()
-                }
-                logger.debug(f"Intent: {class_name}:{name} called with: {kwargs}")
-                return attr(*args, **kwargs)
-
-            return wrapped
-        return attr
+    """Abstract base class for intent classes.
+
+    Subclasses register with the instrumentation layer, which can log and time their method calls.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrumentation.register_intent_class(cls)
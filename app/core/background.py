@@ -0,0 +1,59 @@
+"""Jobs that run one after the other on a background thread.
+
+Used for slow work the user does not need to wait for, such as rendering a batch of
+invoices. The thread is started with the first job and stays idle when there is none.
+"""
+
+from typing import Callable, Optional
+
+import queue
+import threading
+
+from loguru import logger
+
+from tuttle import tracing
+from tuttle.dev import singleton
+
+
+@singleton
+class BackgroundJobs:
+    """Runs queued jobs in order on a single background thread"""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def enqueue(self, name: str, job: Callable[[], None]):
+        """Queues the job, a failing job is logged and does not stop the ones after it"""
+        self._jobs.put((name, job))
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="background-jobs", daemon=True
+                )
+                self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running"""
+        return self._jobs.unfinished_tasks
+
+    def wait(self):
+        """Blocks until all queued jobs have finished"""
+        self._jobs.join()
+
+    def _run(self):
+        while True:
+            name, job = self._jobs.get()
+            try:
+                with tracing.span(name, category="background"):
+                    job()
+            except Exception as e:
+                logger.error(
+                    f"background job {name} failed: {e.__class__.__name__} {e}"
+                )
+                logger.exception(e)
+            finally:
+                self._jobs.task_done()
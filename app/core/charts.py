@@ -1,18 +1,22 @@
-import flet
-from flet.matplotlib_chart import MatplotlibChart
+import functools
 
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider
-
-matplotlib.use("svg")
 from flet import UserControl
 
-from custom_flet.custom_mat_chart import CustomMatplotlibChart
 from res.colors import BLACK_COLOR, GRAY_COLOR, PRIMARY_COLOR, WHITE_COLOR
 from res.fonts import BODY_1_SIZE
 
 
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """Imports pyplot when the first chart is created, as matplotlib takes long to load"""
+    import matplotlib
+
+    matplotlib.use("svg")
+    import matplotlib.pyplot
+
+    return matplotlib.pyplot
+
+
 class BarChart(UserControl):
     """Displays a bar chart"""
 
@@ -28,7 +32,7 @@ class BarChart(UserControl):
         labels_color: str = GRAY_COLOR,
     ):
         super().__init__()
-        self.figure, self.axes = plt.subplots()
+        self.figure, self.axes = _pyplot().subplots()
         legends_per_item = []
         bar_colors = []
         first_item = True
@@ -76,7 +80,13 @@ class BarChart(UserControl):
     def update(self):
         self.chart.update()
 
+    def close(self):
+        """Releases the figure, call when the chart is replaced or no longer displayed"""
+        _pyplot().close(self.figure)
+
     def build(self):
+        from custom_flet.custom_mat_chart import CustomMatplotlibChart
+
         self.chart = CustomMatplotlibChart(
             self.figure,
             isolated=True,
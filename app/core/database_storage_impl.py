@@ -3,12 +3,11 @@ from typing import Callable
 import re
 from pathlib import Path
 
+import sqlalchemy
 import sqlmodel
 from loguru import logger
 
-from tuttle import demo
-
-from .abstractions import DatabaseStorage
+from .abstractions import DatabaseStorage, EntityCache
 
 
 class DatabaseStorageImpl(DatabaseStorage):
@@ -26,6 +25,27 @@ class DatabaseStorageImpl(DatabaseStorage):
         logger.info("Creating database model")
         sqlmodel.SQLModel.metadata.create_all(self.db_engine, checkfirst=True)
 
+    def upgrade_model(self):
+        """Adds the nullable columns that the model gained since the database was created"""
+        inspector = sqlalchemy.inspect(self.db_engine)
+        with self.db_engine.begin() as connection:
+            for table in sqlmodel.SQLModel.metadata.sorted_tables:
+                if not inspector.has_table(table.name):
+                    continue
+                existing = {
+                    column["name"] for column in inspector.get_columns(table.name)
+                }
+                for column in table.columns:
+                    if column.name in existing or not column.nullable:
+                        continue
+                    logger.info(f"Adding column {table.name}.{column.name}")
+                    column_type = column.type.compile(self.db_engine.dialect)
+                    connection.execute(
+                        sqlalchemy.text(
+                            f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+                        )
+                    )
+
     def ensure_database(self):
         if not self.db_path.exists():
             self.db_engine = sqlmodel.create_engine(
@@ -34,6 +54,12 @@ class DatabaseStorageImpl(DatabaseStorage):
             self.create_model()
         else:
             logger.info("Database exists, skipping creation")
+            self.db_engine = sqlmodel.create_engine(
+                f"sqlite:///{self.db_path}", echo=self.debug_mode
+            )
+            # tables and columns added to the model since
+            self.create_model()
+            self.upgrade_model()
 
     def reset_database(self):
         logger.info("Clearing database")
@@ -41,6 +67,7 @@ class DatabaseStorageImpl(DatabaseStorage):
             self.db_path.unlink()
         except FileNotFoundError:
             logger.info("Database file not found, skipping delete")
+        EntityCache().clear()
         self.db_engine = sqlmodel.create_engine(
             f"sqlite:///{self.db_path}",
             echo=self.debug_mode,
@@ -50,6 +77,9 @@ class DatabaseStorageImpl(DatabaseStorage):
     def install_demo_data(
         self,
     ):
+        # the demo data generation pulls in faker and the like, which the app does not need otherwise
+        from tuttle import demo
+
         self.reset_database()
         try:
             demo.install_demo_data(
@@ -58,6 +88,7 @@ class DatabaseStorageImpl(DatabaseStorage):
                 on_cache_timetracking_dataframe=self.store_demo_dataframe_callback,
             )
             logger.info("Demo data installation completed")
+            EntityCache().clear()
         except Exception as ex:
             logger.exception(ex)
             logger.error("Failed to install demo data")
@@ -0,0 +1,184 @@
+"""Optional instrumentation of intent methods.
+
+Intent classes register themselves when they are defined. While instrumentation is
+enabled, their methods are replaced by wrappers that log each call and record call
+counts and latencies. Disabling it puts the original methods back, so disabled
+instrumentation adds no overhead at all.
+
+Enable it by setting the environment variable TUTTLE_INSTRUMENT_INTENTS=1, or at
+runtime with `enable()`. It also follows tracing, whether enabled by TUTTLE_TRACE or at
+runtime with `tracing.enable()`, so that intent calls show up as spans of the trace.
+"""
+
+from typing import Dict, List
+
+import bisect
+import functools
+import inspect
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from tuttle import tracing
+
+# upper bounds of the latency histogram buckets in milliseconds, the last bucket is open
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+@dataclass
+class CallStats:
+    """Number and latency of the calls of one intent method"""
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+
+    def record(self, seconds: float):
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+_intent_classes: List[type] = []
+_stats: Dict[str, CallStats] = {}
+_lock = threading.Lock()
+# whether the methods are instrumented
+_enabled = False
+# whether instrumentation was enabled on its own, rather than by tracing
+_requested = False
+
+
+def _mask_password(kwargs: dict) -> dict:
+    return {k: "******" if k == "password" else v for k, v in kwargs.items()}
+
+
+def _instrumented(class_name: str, name: str, method):
+    """Wraps a method to log its calls and record their latency"""
+    key = f"{class_name}.{name}"
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        logger.debug(
+            f"Intent: {class_name}:{name} called with: {_mask_password(kwargs)}"
+        )
+        start = time.perf_counter()
+        try:
+            with tracing.span(key, category="intent"):
+                return method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with _lock:
+                _stats.setdefault(key, CallStats()).record(elapsed)
+
+    wrapper._instrumented_original = method
+    return wrapper
+
+
+def _instrument(cls: type):
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("__") or not inspect.isfunction(attr):
+            continue
+        if hasattr(attr, "_instrumented_original"):
+            continue
+        setattr(cls, name, _instrumented(cls.__name__, name, attr))
+
+
+def _uninstrument(cls: type):
+    for name, attr in list(vars(cls).items()):
+        original = getattr(attr, "_instrumented_original", None)
+        if original is not None:
+            setattr(cls, name, original)
+
+
+def register_intent_class(cls: type):
+    """Called for every intent class when it is defined"""
+    _intent_classes.append(cls)
+    if _enabled:
+        _instrument(cls)
+
+
+def enable():
+    """Instruments the methods of all intent classes"""
+    global _requested
+    _requested = True
+    _set_instrumented(True)
+
+
+def disable():
+    """Restores the original methods of all intent classes, recorded stats are kept"""
+    global _requested
+    _requested = False
+    _set_instrumented(False)
+
+
+def _on_tracing_toggled(tracing_enabled: bool):
+    """Follows tracing, unless instrumentation was enabled on its own"""
+    if not _requested:
+        _set_instrumented(tracing_enabled)
+
+
+def _set_instrumented(instrumented: bool):
+    global _enabled
+    _enabled = instrumented
+    for cls in _intent_classes:
+        if instrumented:
+            _instrument(cls)
+        else:
+            _uninstrument(cls)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def get_stats() -> Dict[str, CallStats]:
+    """Returns a snapshot of the recorded stats keyed by "IntentClass.method" """
+    with _lock:
+        return {
+            key: CallStats(
+                calls=stats.calls,
+                total_seconds=stats.total_seconds,
+                max_seconds=stats.max_seconds,
+                histogram=list(stats.histogram),
+            )
+            for key, stats in _stats.items()
+        }
+
+
+def reset_stats():
+    with _lock:
+        _stats.clear()
+
+
+def format_report() -> str:
+    """Formats the recorded stats as a table, most expensive methods first"""
+    stats = sorted(
+        get_stats().items(), key=lambda item: item[1].total_seconds, reverse=True
+    )
+    lines = [
+        f"{'intent method':<60} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"
+    ]
+    for key, call_stats in stats:
+        lines.append(
+            f"{key:<60} {call_stats.calls:>7} {call_stats.total_seconds * 1000:>10.1f} "
+            f"{call_stats.mean_seconds * 1000:>9.2f} {call_stats.max_seconds * 1000:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+tracing.add_toggle_listener(_on_tracing_toggled)
+if os.environ.get("TUTTLE_INSTRUMENT_INTENTS", "").lower() in ("1", "true", "yes"):
+    enable()
+elif tracing.is_enabled():
+    _on_tracing_toggled(True)
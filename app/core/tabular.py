@@ -1,51 +1,208 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from flet import Column, DataCell, DataColumn, DataRow, DataTable
+from flet import (
+    Column,
+    DataCell,
+    DataColumn,
+    DataRow,
+    DataTable,
+    IconButton,
+    Row,
+    UserControl,
+    icons,
+)
 
+import numpy
 import pandas
 from res import dimens
 
 from . import utils, views
 
+DEFAULT_ROWS_PER_PAGE = 50
+
+# how cell values are displayed, matched against the string representation of a value
+_DISPLAYED_VALUES = {"False": "No", "True": "Yes", "None": "-", "nan": "-"}
+
+
+def format_data_frame_values(data_frame: pandas.DataFrame) -> pandas.DataFrame:
+    """Converts all values of the DataFrame to the strings displayed in a table, column by column"""
+    return pandas.DataFrame(
+        {
+            column_name: data_frame[column_name]
+            .astype(str)
+            .str.strip()
+            .replace(_DISPLAYED_VALUES)
+            for column_name in data_frame.columns
+        },
+        index=data_frame.index,
+    )
+
+
+class PagedDataTable(UserControl):
+    """Displays a pandas DataFrame as a table, one page of rows at a time
+
+    Only the rows of the current page are formatted and turned into controls. Sorting
+    and filtering only reorder the row positions, so neither rebuilds more than the
+    visible page. Filtering formats all cells once, column by column.
+    """
+
+    def __init__(
+        self,
+        data_frame: pandas.DataFrame,
+        rows_per_page: int = DEFAULT_ROWS_PER_PAGE,
+        table_style: Optional[Dict] = None,
+    ):
+        super().__init__()
+        self.data_frame = data_frame.reset_index(drop=True)
+        self.rows_per_page = rows_per_page
+        self._formatted_values: Optional[numpy.ndarray] = None
+        self._search_text: Optional[pandas.Series] = None
+        self.filter_query = ""
+        self.sort_column_index: Optional[int] = None
+        self.sort_ascending = True
+        self.page_index = 0
+        # positions of the rows to display, filtered and in display order
+        self.row_positions = numpy.arange(len(self.data_frame))
+
+        self.data_table = DataTable(
+            columns=[
+                DataColumn(
+                    label=views.TBodyText(_format_column_name(column_name)),
+                    on_sort=self.on_sort,
+                )
+                for column_name in self.data_frame.columns
+            ],
+            **table_style or {},
+        )
+        self.filter_field = views.TTextField(
+            label="Filter",
+            hint="Show rows containing",
+            on_change=lambda e: self.set_filter(e.control.value),
+            width=dimens.MIN_WINDOW_WIDTH // 2,
+        )
+        self.page_info = views.TBodyText()
+        self.previous_button = IconButton(
+            icon=icons.CHEVRON_LEFT_ROUNDED,
+            on_click=lambda _: self.go_to_page(self.page_index - 1),
+        )
+        self.next_button = IconButton(
+            icon=icons.CHEVRON_RIGHT_ROUNDED,
+            on_click=lambda _: self.go_to_page(self.page_index + 1),
+        )
+        self._display_page()
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows left after filtering"""
+        return len(self.row_positions)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.row_count // self.rows_per_page))
+
+    @property
+    def visible_rows(self) -> List[List[str]]:
+        """The formatted values of the rows on the current page"""
+        start = self.page_index * self.rows_per_page
+        positions = self.row_positions[start : start + self.rows_per_page]
+        if self._formatted_values is not None:
+            return self._formatted_values[positions].tolist()
+        page = self.data_frame.iloc[positions]
+        return format_data_frame_values(page).to_numpy().tolist()
+
+    def on_sort(self, e):
+        self.sort_by(e.column_index, e.ascending)
+
+    def sort_by(self, column_index: int, ascending: bool = True):
+        """Sorts the rows by the values, not the displayed strings, of the given column"""
+        self.sort_column_index = column_index
+        self.sort_ascending = ascending
+        self._update_row_positions()
+
+    def set_filter(self, query: str):
+        """Shows only the rows that contain the query in any of their cells, ignoring case"""
+        self.filter_query = query.strip().lower()
+        self._update_row_positions()
+
+    def go_to_page(self, page_index: int):
+        self.page_index = min(max(page_index, 0), self.page_count - 1)
+        self._display_page()
+
+    def _matching_rows(self) -> numpy.ndarray:
+        if not self.filter_query:
+            return numpy.ones(len(self.data_frame), dtype=bool)
+        if self._search_text is None:
+            # all cells of a row joined, computed on the first filter only
+            self._formatted_values = format_data_frame_values(
+                self.data_frame
+            ).to_numpy()
+            self._search_text = pandas.Series(
+                ["\t".join(row) for row in self._formatted_values]
+            ).str.lower()
+        return self._search_text.str.contains(self.filter_query, regex=False).to_numpy()
+
+    def _update_row_positions(self):
+        if self.sort_column_index is None:
+            order = numpy.arange(len(self.data_frame))
+        else:
+            column = self.data_frame.iloc[:, self.sort_column_index]
+            order = column.reset_index(drop=True).sort_values(
+                ascending=self.sort_ascending, kind="stable", na_position="last"
+            )
+            order = order.index.to_numpy()
+        self.row_positions = order[self._matching_rows()[order]]
+        self.page_index = 0
+        self._display_page()
+
+    def _display_page(self):
+        self.data_table.rows = [
+            DataRow(cells=[DataCell(views.TBodyText(value)) for value in row])
+            for row in self.visible_rows
+        ]
+        self.data_table.sort_column_index = self.sort_column_index
+        self.data_table.sort_ascending = self.sort_ascending
+        start = self.page_index * self.rows_per_page
+        end = min(start + self.rows_per_page, self.row_count)
+        self.page_info.value = (
+            f"{start + 1}-{end} of {self.row_count}" if self.row_count else "No rows"
+        )
+        self.previous_button.disabled = self.page_index == 0
+        self.next_button.disabled = self.page_index >= self.page_count - 1
+        if self.page:
+            self.update()
+
+    def build(self):
+        return Column(
+            controls=[
+                self.filter_field,
+                Column(
+                    controls=[self.data_table],
+                    scroll=utils.ALWAYS_SCROLL,
+                ),
+                Row(
+                    controls=[
+                        self.previous_button,
+                        self.page_info,
+                        self.next_button,
+                    ],
+                    alignment=utils.END_ALIGNMENT,
+                ),
+            ],
+        )
+
 
 def data_frame_to_data_table(
     data_frame: pandas.DataFrame,
     table_style: Dict = None,
-) -> DataTable:
+    rows_per_page: int = DEFAULT_ROWS_PER_PAGE,
+) -> PagedDataTable:
     """
-    Convert a pandas DataFrame to a flet DataTable.
+    Convert a pandas DataFrame to a paged table control.
     """
-    # Get the column names from the DataFrame
-    column_names = data_frame.columns.tolist()
-
-    # Create a list of DataColumn objects using the column names
-    columns = [
-        DataColumn(label=views.TBodyText(_format_column_name(column_name)))
-        for column_name in column_names
-    ]
-
-    # Create a list of DataRow objects using the data in the DataFrame
-    rows = []
-    for i, row in data_frame.iterrows():
-        # Create a list of DataCell objects for the row
-        cells = [
-            DataCell(views.TBodyText(_format_data_frame_cell_value(value)))
-            for value in row
-        ]
-
-        # Create a DataRow object for the row
-        rows.append(DataRow(cells=cells))
-
-    # Create and return a DataTable object using the columns and rows
-    return Column(
-        controls=[
-            DataTable(
-                columns=columns,
-                rows=rows,
-                **table_style or {},
-            )
-        ],
-        scroll=utils.ALWAYS_SCROLL,
+    return PagedDataTable(
+        data_frame=data_frame,
+        rows_per_page=rows_per_page,
+        table_style=table_style,
     )
 
 
@@ -54,14 +211,3 @@ def _format_column_name(value: any) -> str:
     capped = value_as_str.capitalize()
     no_underscores = capped.replace("_", " ")
     return no_underscores
-
-
-def _format_data_frame_cell_value(value: any) -> str:
-    value_as_str = str(value).strip()
-    if value_as_str == "False":
-        return "No"
-    if value_as_str == "True":
-        return "Yes"
-    if value_as_str == "None":
-        return "-"
-    return value_as_str
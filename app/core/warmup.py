@@ -0,0 +1,117 @@
+"""Warm-up of heavy subsystems in the background.
+
+The first use of some subsystems is slow: the time tracking views need pandas and
+pandera, rendering an invoice needs Jinja, weasyprint and its fonts. Right after the
+splash screen is shown, the warm-up runs such initializations in stages on a background
+thread, so that the user does not wait for them later.
+
+Nothing depends on the warm-up having finished, a subsystem that is not warmed up yet
+is initialized on first use as before. Code that must not run concurrently with a stage
+can await it:
+
+    WarmUp().wait(DATABASE_WARM_UP)
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import threading
+import time
+from collections import defaultdict
+
+from loguru import logger
+
+from tuttle import tracing
+from tuttle.dev import singleton
+
+DATABASE_WARM_UP = "database"
+VIEWS_WARM_UP = "views"
+RENDERING_WARM_UP = "rendering"
+
+
+@singleton
+class WarmUp:
+    """Runs warm-up stages one after the other on a background thread"""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._ready: Dict[str, threading.Event] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._listeners: Dict[str, List[Callable[[], None]]] = defaultdict(list)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, stages: List[Tuple[str, Callable[[], None]]]):
+        """Starts running the (name, function) stages in order, unless the warm-up was started before"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            for name, _ in stages:
+                self._ready[name] = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(stages,), name="warm-up", daemon=True
+            )
+        self._thread.start()
+
+    def _run(self, stages: List[Tuple[str, Callable[[], None]]]):
+        for name, warm_up in stages:
+            start = time.perf_counter()
+            try:
+                with tracing.span(f"warm-up {name}", category="warm-up"):
+                    warm_up()
+                logger.info(
+                    f"warmed up {name} in {time.perf_counter() - start:.2f} seconds"
+                )
+            except Exception as e:
+                # the subsystem is initialized on first use instead
+                logger.warning(f"warm-up of {name} failed: {e.__class__.__name__} {e}")
+                self._errors[name] = e
+            with self._lock:
+                self._ready[name].set()
+                listeners = self._listeners.pop(name, [])
+            for listener in listeners:
+                listener()
+
+    def _stage_events(self, stage: Optional[str]) -> List[threading.Event]:
+        with self._lock:
+            if stage is None:
+                return list(self._ready.values())
+            event = self._ready.get(stage)
+            return [] if event is None else [event]
+
+    def is_ready(self, stage: Optional[str] = None) -> bool:
+        """Whether the stage, or all stages if none is given, has finished
+
+        Stages that are not part of the warm-up count as ready.
+        """
+        return all(event.is_set() for event in self._stage_events(stage))
+
+    def wait(
+        self,
+        stage: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Blocks until the stage, or all stages if none is given, has finished
+
+        Returns False if the timeout in seconds passed before.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for event in self._stage_events(stage):
+            remaining = (
+                None if deadline is None else max(0, deadline - time.monotonic())
+            )
+            if not event.wait(remaining):
+                return False
+        return True
+
+    def add_ready_listener(self, stage: str, listener: Callable[[], None]):
+        """Calls the listener once the stage has finished, right away if it has already"""
+        with self._lock:
+            event = self._ready.get(stage)
+            if event is not None and not event.is_set():
+                self._listeners[stage].append(listener)
+                return
+        listener()
+
+    def get_error(self, stage: str) -> Optional[Exception]:
+        """The exception that made the stage fail, if any"""
+        return self._errors.get(stage)
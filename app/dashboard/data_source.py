@@ -0,0 +1,260 @@
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import datetime
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+
+from loguru import logger
+import sqlalchemy
+import sqlmodel
+
+from core.abstractions import EntityCache, SQLModelDataSourceMixin
+from core.intent_result import IntentResult
+from invoicing.data_source import INVOICE_ITEM_SUBTOTAL, INVOICE_ITEM_VAT
+
+from tuttle.dev import singleton
+from tuttle.model import Client, Contract, Invoice, InvoiceItem
+
+
+@dataclass
+class InvoiceContribution:
+    """What a single invoice contributes to the dashboard aggregates"""
+
+    invoice_id: int
+    month: str
+    client_id: Optional[int]
+    total: Decimal
+    paid: bool
+    cancelled: bool
+    due_date: Optional[datetime.date]
+
+    @classmethod
+    def of(cls, invoice: Invoice) -> "InvoiceContribution":
+        """Computes the contribution of an invoice entity"""
+        contract = invoice.contract
+        return cls(
+            invoice_id=invoice.id,
+            month=invoice.date.strftime("%Y-%m"),
+            client_id=contract.client_id if contract else None,
+            total=invoice.total,
+            paid=bool(invoice.paid),
+            cancelled=bool(invoice.cancelled),
+            due_date=invoice.due_date if contract else None,
+        )
+
+    @property
+    def revenue(self) -> Decimal:
+        """Cancelled invoices do not count as revenue"""
+        return Decimal(0) if self.cancelled else self.total
+
+    @property
+    def unpaid(self) -> Decimal:
+        return Decimal(0) if (self.cancelled or self.paid) else self.total
+
+
+@dataclass
+class RevenueTotals:
+    """Revenue and the part of it that is still unpaid"""
+
+    revenue: Decimal = Decimal(0)
+    unpaid: Decimal = Decimal(0)
+
+
+@singleton
+class DashboardAggregates:
+    """Keeps per-month and per-client revenue and unpaid totals materialized in memory
+
+    The aggregates are loaded once from the database and then updated incrementally
+    with every invoice that is saved or deleted, so reading them never scans the invoices.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+        EntityCache().add_invalidation_listener(self._on_entities_written)
+
+    def _on_entities_written(self, entity_type):
+        """Reloads on next use if contracts or clients changed, which move due dates and client totals
+
+        Invoices are written by the invoicing intents, which update the aggregates themselves.
+        """
+        if entity_type is None or entity_type in (Contract, Client):
+            self._reset()
+
+    def _reset(self):
+        self.is_loaded = False
+        self._contributions: Dict[int, InvoiceContribution] = {}
+        self._per_month: Dict[str, RevenueTotals] = defaultdict(RevenueTotals)
+        self._per_client: Dict[Optional[int], RevenueTotals] = defaultdict(
+            RevenueTotals
+        )
+        # unpaid amounts by (due date, client id), to find overdue payments at any day
+        self._unpaid_by_due_date: Dict[
+            Tuple[datetime.date, Optional[int]], Decimal
+        ] = defaultdict(Decimal)
+
+    def load(self, contributions: List[InvoiceContribution]):
+        """Replaces the aggregates with those of the given invoice contributions"""
+        self._reset()
+        for contribution in contributions:
+            self._add(contribution)
+        self.is_loaded = True
+
+    def _add(self, contribution: InvoiceContribution, sign: int = 1):
+        self._per_month[contribution.month].revenue += sign * contribution.revenue
+        self._per_month[contribution.month].unpaid += sign * contribution.unpaid
+        self._per_client[contribution.client_id].revenue += sign * contribution.revenue
+        self._per_client[contribution.client_id].unpaid += sign * contribution.unpaid
+        if contribution.due_date and contribution.unpaid:
+            key = (contribution.due_date, contribution.client_id)
+            self._unpaid_by_due_date[key] += sign * contribution.unpaid
+            if not self._unpaid_by_due_date[key]:
+                del self._unpaid_by_due_date[key]
+        if sign > 0:
+            self._contributions[contribution.invoice_id] = contribution
+
+    def remove_invoice(self, invoice_id: int):
+        """Takes back the contribution of a deleted invoice"""
+        if not self.is_loaded:
+            return
+        contribution = self._contributions.pop(invoice_id, None)
+        if contribution:
+            self._add(contribution, sign=-1)
+
+    def apply_invoice(self, invoice: Invoice):
+        """Updates the aggregates after an invoice has been created or changed"""
+        if not self.is_loaded:
+            # the invoice will be included when the aggregates are loaded
+            return
+        self.remove_invoice(invoice.id)
+        self._add(InvoiceContribution.of(invoice))
+
+    def revenue_per_month(self) -> Mapping[str, RevenueTotals]:
+        """Totals keyed by "YYYY-MM" month of the invoice date"""
+        return dict(self._per_month)
+
+    def revenue_per_client(self) -> Mapping[Optional[int], RevenueTotals]:
+        """Totals keyed by client id"""
+        return dict(self._per_client)
+
+    def unpaid_total(self) -> Decimal:
+        return sum((totals.unpaid for totals in self._per_client.values()), Decimal(0))
+
+    def overdue_per_client(
+        self, today: Optional[datetime.date] = None
+    ) -> Mapping[Optional[int], Decimal]:
+        """Unpaid amounts whose due date has passed, keyed by client id"""
+        if today is None:
+            today = datetime.date.today()
+        overdue = defaultdict(Decimal)
+        for (due_date, client_id), amount in self._unpaid_by_due_date.items():
+            if due_date < today:
+                overdue[client_id] += amount
+        return dict(overdue)
+
+
+class DashboardDataSource(SQLModelDataSourceMixin):
+    """Reads the figures shown on the dashboard from the database"""
+
+    def __init__(self):
+        super().__init__()
+
+    def get_invoice_contributions(
+        self,
+    ) -> IntentResult[Optional[List[InvoiceContribution]]]:
+        """Computes the contribution of every invoice with one aggregate query, without loading any entities
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data : list[InvoiceContribution] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            statement = (
+                sqlmodel.select(
+                    Invoice.id,
+                    Invoice.date,
+                    Invoice.paid,
+                    Invoice.cancelled,
+                    Contract.client_id,
+                    Contract.term_of_payment,
+                    sqlalchemy.type_coerce(
+                        sqlalchemy.func.coalesce(
+                            sqlalchemy.func.sum(INVOICE_ITEM_SUBTOTAL), 0
+                        ),
+                        sqlalchemy.Numeric(),
+                    ),
+                    sqlalchemy.type_coerce(
+                        sqlalchemy.func.coalesce(
+                            sqlalchemy.func.sum(INVOICE_ITEM_VAT), 0
+                        ),
+                        sqlalchemy.Numeric(),
+                    ),
+                )
+                .select_from(Invoice)
+                .outerjoin(InvoiceItem, InvoiceItem.invoice_id == Invoice.id)
+                .outerjoin(Contract, Invoice.contract_id == Contract.id)
+                .group_by(Invoice.id)
+            )
+            with self.session_scope() as session:
+                rows = session.exec(statement).all()
+            contributions = [
+                InvoiceContribution(
+                    invoice_id=invoice_id,
+                    month=date.strftime("%Y-%m"),
+                    client_id=client_id,
+                    total=Decimal(invoice_sum) + Decimal(VAT_total),
+                    paid=bool(paid),
+                    cancelled=bool(cancelled),
+                    due_date=(
+                        date + datetime.timedelta(days=term_of_payment)
+                        if term_of_payment
+                        else None
+                    ),
+                )
+                for (
+                    invoice_id,
+                    date,
+                    paid,
+                    cancelled,
+                    client_id,
+                    term_of_payment,
+                    invoice_sum,
+                    VAT_total,
+                ) in rows
+            ]
+            logger.debug(f"Computed contributions of {len(contributions)} invoices")
+            return IntentResult(was_intent_successful=True, data=contributions)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @DashboardDataSource.get_invoice_contributions {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_client_names(self) -> IntentResult[Optional[Mapping[int, str]]]:
+        """Fetches the names of all clients keyed by client id
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data : dict of client id to name if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            with self.session_scope() as session:
+                rows = session.exec(sqlmodel.select(Client.id, Client.name)).all()
+            return IntentResult(
+                was_intent_successful=True,
+                data={client_id: name for (client_id, name) in rows},
+            )
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @DashboardDataSource.get_client_names {e.__class__.__name__}",
+                exception=e,
+            )
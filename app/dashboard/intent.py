@@ -0,0 +1,127 @@
+from typing import List, Optional, Tuple
+
+import datetime
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from core.abstractions import Intent
+from core.intent_result import IntentResult
+
+from .data_source import DashboardAggregates, DashboardDataSource
+
+
+@dataclass
+class ClientSummary:
+    """The figures of one client as shown on the dashboard"""
+
+    name: str
+    revenue: Decimal
+    unpaid: Decimal
+    overdue: Decimal
+
+
+@dataclass
+class DashboardSummary:
+    """Everything the dashboard displays
+
+    Params:
+        months - the last months as "YYYY-MM", oldest first
+        revenue_per_month - the revenue of each of these months
+        revenue_total - revenue of all invoices that are not cancelled
+        unpaid_total - the part of the revenue not paid yet
+        overdue_total - the part of the unpaid revenue whose due date has passed
+        clients - figures per client, highest revenue first
+    """
+
+    months: List[str] = field(default_factory=list)
+    revenue_per_month: List[Decimal] = field(default_factory=list)
+    revenue_total: Decimal = Decimal(0)
+    unpaid_total: Decimal = Decimal(0)
+    overdue_total: Decimal = Decimal(0)
+    clients: List[ClientSummary] = field(default_factory=list)
+
+
+def last_months(
+    today: datetime.date,
+    n_months: int,
+) -> List[str]:
+    """Returns the n months up to and including the month of today as "YYYY-MM", oldest first"""
+    months = []
+    year, month = today.year, today.month
+    for _ in range(n_months):
+        months.append(f"{year:04}-{month:02}")
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return list(reversed(months))
+
+
+class DashboardIntent(Intent):
+    """Handles the intents of the dashboard"""
+
+    def __init__(self):
+        self._data_source = DashboardDataSource()
+        self._aggregates = DashboardAggregates()
+
+    def get_dashboard_summary(
+        self,
+        n_months: int = 12,
+        today: Optional[datetime.date] = None,
+    ) -> IntentResult[Optional[DashboardSummary]]:
+        """Summarizes revenue, unpaid and overdue amounts from the materialized aggregates
+
+        The aggregates are loaded from the database on first use only, afterwards they
+        are kept up to date by the invoicing intents.
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data : DashboardSummary if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        if today is None:
+            today = datetime.date.today()
+        if not self._aggregates.is_loaded:
+            result = self._data_source.get_invoice_contributions()
+            if not result.was_intent_successful:
+                result.error_msg = "Failed to load the dashboard. Please retry"
+                result.log_message_if_any()
+                return result
+            self._aggregates.load(result.data)
+        names_result = self._data_source.get_client_names()
+        if not names_result.was_intent_successful:
+            names_result.error_msg = "Failed to load the clients. Please retry"
+            names_result.log_message_if_any()
+            return names_result
+        client_names = names_result.data
+
+        per_month = self._aggregates.revenue_per_month()
+        per_client = self._aggregates.revenue_per_client()
+        overdue_per_client = self._aggregates.overdue_per_client(today)
+        months = last_months(today, n_months)
+        clients = [
+            ClientSummary(
+                name=client_names.get(client_id, "No client"),
+                revenue=totals.revenue,
+                unpaid=totals.unpaid,
+                overdue=overdue_per_client.get(client_id, Decimal(0)),
+            )
+            for client_id, totals in per_client.items()
+            if totals.revenue
+        ]
+        clients.sort(key=lambda client: client.revenue, reverse=True)
+        summary = DashboardSummary(
+            months=months,
+            revenue_per_month=[
+                per_month[month].revenue if month in per_month else Decimal(0)
+                for month in months
+            ],
+            revenue_total=sum(
+                (totals.revenue for totals in per_client.values()), Decimal(0)
+            ),
+            unpaid_total=self._aggregates.unpaid_total(),
+            overdue_total=sum(overdue_per_client.values(), Decimal(0)),
+            clients=clients,
+        )
+        return IntentResult(was_intent_successful=True, data=summary)
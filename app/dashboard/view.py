@@ -0,0 +1,145 @@
+from typing import Optional
+
+from decimal import Decimal
+
+from flet import (
+    Card,
+    Column,
+    Container,
+    ListTile,
+    ResponsiveRow,
+    UserControl,
+    padding,
+)
+
+from core import utils, views
+from core.abstractions import TView, TViewParams
+from core.charts import BarChart
+from core.intent_result import IntentResult
+from res import colors, dimens, fonts, res_utils
+
+from .intent import DashboardIntent, DashboardSummary
+
+
+def format_amount(amount: Decimal) -> str:
+    return f"{amount:,.2f}"
+
+
+class FigureCard(Card):
+    """Displays a single labelled figure"""
+
+    def __init__(self, label: str, col: Optional[dict] = None):
+        self.figure_control = views.THeading(size=fonts.HEADLINE_3_SIZE)
+        super().__init__(
+            col=col,
+            content=Container(
+                padding=padding.all(dimens.SPACE_STD),
+                content=Column(
+                    controls=[
+                        views.TBodyText(
+                            txt=label,
+                            color=colors.GRAY_COLOR,
+                            size=fonts.BODY_2_SIZE,
+                        ),
+                        self.figure_control,
+                    ],
+                ),
+            ),
+        )
+
+    def set_figure(self, amount: Decimal):
+        self.figure_control.value = format_amount(amount)
+
+
+class DashboardView(TView, UserControl):
+    """The dashboard shows revenue and outstanding payments at a glance"""
+
+    def __init__(self, params: TViewParams):
+        super().__init__(params)
+        self.intent = DashboardIntent()
+        self.loading_indicator = views.TProgressBar()
+        self.revenue_card = FigureCard("Revenue", col={"xs": 12, "md": 4})
+        self.unpaid_card = FigureCard("Unpaid", col={"xs": 12, "md": 4})
+        self.overdue_card = FigureCard("Overdue", col={"xs": 12, "md": 4})
+        self.chart: Optional[BarChart] = None
+        self.chart_container = Container(height=300)
+        self.clients_container = Column()
+
+    def parent_intent_listener(self, intent: str, data: any):
+        """Called when the parent view passes an intent"""
+        if intent == res_utils.RELOAD_INTENT:
+            self.reload_all_data()
+
+    def display_summary(self, summary: DashboardSummary):
+        """Displays the figures, the monthly revenue chart and the per-client figures"""
+        self.revenue_card.set_figure(summary.revenue_total)
+        self.unpaid_card.set_figure(summary.unpaid_total)
+        self.overdue_card.set_figure(summary.overdue_total)
+        if self.chart:
+            self.chart.close()
+        self.chart = BarChart(
+            x_items_labels=[month[2:] for month in summary.months],
+            values=[float(revenue) for revenue in summary.revenue_per_month],
+            y_label="Revenue",
+            x_label="Month",
+            chart_title="Revenue per month",
+            legend="Invoiced",
+        )
+        self.chart_container.content = self.chart
+        self.clients_container.controls = [
+            ListTile(
+                leading=views.THeading(client.name, size=fonts.SUBTITLE_1_SIZE),
+                title=views.TBodyText(
+                    f"Revenue {format_amount(client.revenue)}",
+                ),
+                subtitle=views.TBodyText(
+                    f"Unpaid {format_amount(client.unpaid)}, overdue {format_amount(client.overdue)}",
+                    color=colors.ERROR_COLOR if client.overdue else colors.GRAY_COLOR,
+                ),
+            )
+            for client in summary.clients
+        ]
+
+    def did_mount(self):
+        """Called when the view is mounted"""
+        self.reload_all_data()
+
+    def reload_all_data(self):
+        """Reloads the dashboard when view is mounted or parent view passes a reload intent"""
+        self.mounted = True
+        self.loading_indicator.visible = True
+        self.update_self()
+        result: IntentResult = self.intent.get_dashboard_summary()
+        if result.was_intent_successful:
+            self.display_summary(result.data)
+        else:
+            self.show_snack(result.error_msg, True)
+        self.loading_indicator.visible = False
+        self.update_self()
+
+    def build(self):
+        """Builds the view"""
+        return Column(
+            controls=[
+                views.THeading(title="Dashboard", size=fonts.HEADLINE_4_SIZE),
+                self.loading_indicator,
+                views.Spacer(md_space=True),
+                ResponsiveRow(
+                    controls=[
+                        self.revenue_card,
+                        self.unpaid_card,
+                        self.overdue_card,
+                    ],
+                    vertical_alignment=utils.CENTER_ALIGNMENT,
+                ),
+                views.Spacer(md_space=True),
+                self.chart_container,
+                views.Spacer(md_space=True),
+                views.TSubHeading("Clients"),
+                self.clients_container,
+            ]
+        )
+
+    def will_unmount(self):
+        """Called when the view is unmounted"""
+        self.mounted = False
@@ -26,6 +26,7 @@ from contacts.view import ContactsListView
 from contracts.view import ContractsListView
 from core import utils, views
 from core.abstractions import DialogHandler, TView, TViewParams
+from dashboard.view import DashboardView
 from invoicing.view import InvoicingListView
 from projects.view import ProjectsListView
 from res import colors, dimens, fonts, res_utils, theme
@@ -138,19 +139,21 @@ class MainMenuItemsHandler:
     def __init__(self, params: TViewParams):
         super().__init__()
         self.menu_title = "My Business"
+        self.dashboard_view = DashboardView(params)
         self.projects_view = ProjectsListView(params)
         self.contacts_view = ContactsListView(params)
         self.clients_view = ClientsListView(params)
         self.contracts_view = ContractsListView(params)
         self.items = [
-            # MenuItem(
-            #     index=0,
-            #     label="Dashboard",
-            #     icon=utils.TuttleComponentIcons.dashboard_icon,
-            #     selected_icon=utils.TuttleComponentIcons.dashboard_selected_icon,
-            #     destination=Container(),
-            #     on_new_screen_route="/404",
-            # ),
+            views.NavigationMenuItem(
+                index=0,
+                label="Dashboard",
+                icon=utils.TuttleComponentIcons.dashboard_icon,
+                selected_icon=utils.TuttleComponentIcons.dashboard_selected_icon,
+                destination=self.dashboard_view,
+                on_new_screen_route=None,
+                on_new_intent=None,
+            ),
             views.NavigationMenuItem(
                 index=1,
                 label="Projects",
@@ -311,7 +314,7 @@ class HomeScreen(TView, UserControl):
         item = self.current_menu_handler.items[self.selected_tab]
         if item.on_new_intent:
             self.pass_intent_to_destination(item.on_new_intent)
-        else:
+        elif item.on_new_screen_route:
             self.navigate_to_route(item.on_new_screen_route)
 
     def on_resume_after_back_pressed(self):
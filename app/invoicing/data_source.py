@@ -1,14 +1,61 @@
-from typing import List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import datetime
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
 
 from loguru import logger
+import sqlalchemy
 import sqlmodel
 
-from core.abstractions import SQLModelDataSourceMixin
+from core.abstractions import EntityPage, SQLModelDataSourceMixin
 from core.intent_result import IntentResult
 
-from tuttle.model import Invoice, Project, Timesheet
+from tuttle.model import (
+    Contract,
+    Invoice,
+    InvoiceItem,
+    Project,
+    Timesheet,
+    format_invoice_number,
+)
+from tuttle import invoicing
+
+
+@dataclass
+class InvoiceTotals:
+    """Amounts of a group of invoices, aggregated in the database
+
+    Params:
+        key - the value the invoices are grouped by, e.g. an invoice id, client id, month or status
+        count - the number of invoices in the group
+        sum - sum over all invoice items, before VAT
+        VAT_total - sum of VAT over all invoice items
+        total - total invoiced amount
+    """
+
+    key: Any
+    count: int
+    sum: Decimal
+    VAT_total: Decimal
+    total: Decimal
+
+
+# amounts of an invoice item as SQL expressions, mirroring InvoiceItem.subtotal and InvoiceItem.VAT
+INVOICE_ITEM_SUBTOTAL = InvoiceItem.quantity * InvoiceItem.unit_price
+INVOICE_ITEM_VAT = INVOICE_ITEM_SUBTOTAL * InvoiceItem.VAT_rate
+
+# the status of an invoice as shown to the user, cancellation overrides payment
+INVOICE_STATUS = sqlalchemy.case(
+    (Invoice.cancelled == True, "cancelled"),
+    (Invoice.paid == True, "paid"),
+    (Invoice.sent == True, "sent"),
+    else_="draft",
+)
+
+
+_invoice_number_lock = threading.Lock()
 
 
 class InvoicingDataSource(SQLModelDataSourceMixin):
@@ -62,6 +109,181 @@ class InvoicingDataSource(SQLModelDataSourceMixin):
                 exception=ex,
             )
 
+    def get_invoices_page(
+        self,
+        after: Optional[Tuple] = None,
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Fetches one page of invoices, newest first, ordered by date
+
+        Args:
+            after : the cursor of the previous page, or None to fetch the first page
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  EntityPage of Invoice if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            page = self.query_page(
+                Invoice,
+                after=after,
+                order_by="date",
+                descending=True,
+            )
+            return IntentResult(was_intent_successful=True, data=page)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @InvoicingDataSource.get_invoices_page {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def _query_invoice_totals(
+        self,
+        group_by: Any,
+        include_cancelled: bool,
+        join_contract: bool = False,
+    ) -> List[InvoiceTotals]:
+        """Aggregates the amounts of invoice items per group without loading any entities"""
+        statement = (
+            sqlmodel.select(
+                group_by,
+                sqlalchemy.func.count(sqlalchemy.distinct(Invoice.id)),
+                sqlalchemy.type_coerce(
+                    sqlalchemy.func.coalesce(
+                        sqlalchemy.func.sum(INVOICE_ITEM_SUBTOTAL), 0
+                    ),
+                    sqlalchemy.Numeric(),
+                ),
+                sqlalchemy.type_coerce(
+                    sqlalchemy.func.coalesce(sqlalchemy.func.sum(INVOICE_ITEM_VAT), 0),
+                    sqlalchemy.Numeric(),
+                ),
+            )
+            .select_from(Invoice)
+            .outerjoin(InvoiceItem, InvoiceItem.invoice_id == Invoice.id)
+        )
+        if join_contract:
+            statement = statement.outerjoin(
+                Contract, Invoice.contract_id == Contract.id
+            )
+        if not include_cancelled:
+            statement = statement.where(Invoice.cancelled == False)
+        statement = statement.group_by(group_by).order_by(group_by)
+        with self.session_scope() as session:
+            rows = session.exec(statement).all()
+        return [
+            InvoiceTotals(
+                key=key,
+                count=count,
+                sum=Decimal(invoice_sum),
+                VAT_total=Decimal(VAT_total),
+                total=Decimal(invoice_sum) + Decimal(VAT_total),
+            )
+            for (key, count, invoice_sum, VAT_total) in rows
+        ]
+
+    def get_totals_per_invoice(
+        self,
+        include_cancelled: bool = True,
+    ) -> IntentResult[Optional[List[InvoiceTotals]]]:
+        """Computes sum, VAT and total of each invoice, keyed by invoice id
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data : list[InvoiceTotals] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            totals = self._query_invoice_totals(Invoice.id, include_cancelled)
+            return IntentResult(was_intent_successful=True, data=totals)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @InvoicingDataSource.get_totals_per_invoice {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_totals_per_client(
+        self,
+        include_cancelled: bool = True,
+    ) -> IntentResult[Optional[List[InvoiceTotals]]]:
+        """Computes the invoiced amounts per client, keyed by client id
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data : list[InvoiceTotals] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            totals = self._query_invoice_totals(
+                Contract.client_id,
+                include_cancelled,
+                join_contract=True,
+            )
+            return IntentResult(was_intent_successful=True, data=totals)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @InvoicingDataSource.get_totals_per_client {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_totals_per_month(
+        self,
+        include_cancelled: bool = True,
+    ) -> IntentResult[Optional[List[InvoiceTotals]]]:
+        """Computes the invoiced amounts per month of the invoice date, keyed by "YYYY-MM"
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data : list[InvoiceTotals] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            totals = self._query_invoice_totals(
+                sqlalchemy.func.strftime("%Y-%m", Invoice.date),
+                include_cancelled,
+            )
+            return IntentResult(was_intent_successful=True, data=totals)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @InvoicingDataSource.get_totals_per_month {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_totals_per_status(self) -> IntentResult[Optional[List[InvoiceTotals]]]:
+        """Computes the invoiced amounts per invoice status, keyed by "draft", "sent", "paid" or "cancelled"
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data : list[InvoiceTotals] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            totals = self._query_invoice_totals(
+                INVOICE_STATUS,
+                include_cancelled=True,
+            )
+            return IntentResult(was_intent_successful=True, data=totals)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @InvoicingDataSource.get_totals_per_status {e.__class__.__name__}",
+                exception=e,
+            )
+
     def delete_invoice_by_id(self, invoice_id):
         """Deletes an invoice by id
 
@@ -78,45 +300,73 @@ class InvoicingDataSource(SQLModelDataSourceMixin):
         logger.info(f"Saving invoice {invoice}")
         self.store(invoice)
 
+    def save_rendered_status(self, invoice: Invoice):
+        """Updates only the rendered flags of the invoice and its timesheets"""
+        with self.session_scope() as session:
+            session.execute(
+                sqlalchemy.update(Invoice)
+                .where(Invoice.id == invoice.id)
+                .values(rendered=invoice.rendered)
+            )
+            for timesheet in invoice.timesheets:
+                session.execute(
+                    sqlalchemy.update(Timesheet)
+                    .where(Timesheet.id == timesheet.id)
+                    .values(rendered=timesheet.rendered)
+                )
+            self.commit(session)
+        self.invalidate_cache(Invoice)
+
     def save_timesheet(self, timesheet: Timesheet):
         """Creates or updates a timesheet"""
         self.store(timesheet)
 
-    def get_timesheet_for_invoice(self, invoice: Invoice) -> Timesheet:
-        """Get the timesheet associated with an invoice
+    def get_timesheets_for_invoice(self, invoice: Invoice) -> List[Timesheet]:
+        """Get the timesheets associated with an invoice, ordered by period
 
         Args:
-            invoice (Invoice): the invoice to get the timesheet for
+            invoice (Invoice): the invoice to get the timesheets for
 
         Returns:
-            Optional[Timesheet]: the timesheet associated with the invoice
+            List[Timesheet]: the timesheets associated with the invoice
         """
         if not len(invoice.timesheets) > 0:
             raise ValueError(
                 f"invoice {invoice.id} has no timesheets associated with it"
             )
-        if len(invoice.timesheets) > 1:
-            raise ValueError(
-                f"invoice {invoice.id} has more than one timesheet associated with it: {invoice.timesheets}"
-            )
-        timesheet = invoice.timesheets[0]
-        return timesheet
-
-    def generate_invoice_number(self, date: datetime.date) -> str:
-        """Generate a new valid invoice number"""
-        # invoice number scheme: YYYY-MM-DD-XX
-        prefix = date.strftime("%Y-%m-%d")
-
-        # where XX is the number of invoices for the day
-        # if there are no invoices for the day, start at 1
-        # if there are invoices for the day, start at the last invoice number + 1
-        # count the number of invoices for the day
-        with self.create_session() as session:
-            invoices = session.exec(
-                sqlmodel.select(Invoice).where(Invoice.date == date)
-            ).all()
-            invoice_count = len(invoices)
-            if invoice_count == 0:
-                return f"{prefix}-01"
-            else:
-                return f"{prefix}-{invoice_count + 1}"
+        return sorted(invoice.timesheets, key=lambda timesheet: timesheet.period_start)
+
+    def get_billed_until_by_project(self) -> Dict[int, datetime.date]:
+        """The end of the last period billed for each project, in one grouped query
+
+        Cancelled invoices do not count, their periods are billed again.
+        """
+        statement = (
+            sqlmodel.select(
+                Invoice.project_id, sqlalchemy.func.max(Timesheet.period_end)
+            )
+            .select_from(Invoice)
+            .join(Timesheet, Timesheet.invoice_id == Invoice.id)
+            .where(Invoice.cancelled == False)
+            .group_by(Invoice.project_id)
+        )
+        with self.session_scope() as session:
+            rows = session.exec(statement).all()
+        return {project_id: billed_until for (project_id, billed_until) in rows}
+
+    def generate_invoice_number(
+        self,
+        date: datetime.date,
+        pattern: Optional[str] = None,
+    ) -> str:
+        """Generate a new valid invoice number
+
+        The counter of the number is drawn from a sequence per date, or whatever else
+        the pattern contains besides the counter, see tuttle.invoicing.allocate_invoice_counter.
+        """
+        # threads share the connection of a data source, the database lock cannot tell them apart
+        with _invoice_number_lock:
+            with self.session_scope() as session:
+                counter = invoicing.allocate_invoice_counter(session, date, pattern)
+                self.commit(session)
+        return format_invoice_number(date, counter, pattern)
@@ -1,13 +1,17 @@
-from typing import Mapping, Optional, Type, Union
+from typing import Dict, List, Mapping, Optional, Tuple, Type, Union
 
 import datetime
+import functools
 import textwrap
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
 from auth.data_source import UserDataSource
-from core.abstractions import ClientStorage, Intent
+from core.abstractions import ClientStorage, EntityPage, Intent
+from core.background import BackgroundJobs
 from core.intent_result import IntentResult
+from dashboard.data_source import DashboardAggregates
 from loguru import logger
 from pandas import DataFrame
 from projects.intent import ProjectsIntent
@@ -22,6 +26,14 @@ from .data_source import InvoicingDataSource
 from auth.intent import AuthIntent
 
 
+@dataclass
+class DueBilling:
+    """A project with billing periods that are over and not invoiced yet"""
+
+    project: Project
+    periods: List[Tuple[date, date]]
+
+
 class InvoicingIntent(Intent):
     """Handles Invoicing C_R_U_D intents"""
 
@@ -33,17 +45,24 @@ class InvoicingIntent(Intent):
             reference to the TimeTrackingIntent for forwarding timetracking related intents
         _data_source : InvoicingDataSource
             reference to the invoicing data source
+        _background_invoicing_data_source : InvoicingDataSource
+            invoicing data source with its own connection, for the background jobs
         _projects_intent : ProjectsIntent
             reference to the ProjectsIntent for forwarding project related intents
         _auth_intent : AuthIntent
             reference to the AuthIntent for forwarding auth related intents
+        _dashboard_aggregates : DashboardAggregates
+            materialized dashboard figures, updated with every saved or deleted invoice
         """
         self._timetracking_intent = TimeTrackingIntent(client_storage=client_storage)
         self._projects_intent = ProjectsIntent()
         self._invoicing_data_source = InvoicingDataSource()
+        # a connection of its own for the background jobs
+        self._background_invoicing_data_source = InvoicingDataSource()
         self._timetracking_data_source = TimeTrackingDataFrameSource()
         self._user_data_source = UserDataSource()
         self._auth_intent = AuthIntent()
+        self._dashboard_aggregates = DashboardAggregates()
 
     def get_user(self) -> IntentResult[User]:
         user = self._user_data_source.get_user()
@@ -73,10 +92,30 @@ class InvoicingIntent(Intent):
             result.log_message_if_any()
             return {}
 
+    def get_invoices_page(
+        self, after: Optional[Tuple] = None
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Get the next page of invoices
+
+        Args:
+            after : the next_cursor of the previously loaded page, None for the first page
+
+        Returns:
+            IntentResult[EntityPage]: the page of invoices and the cursor to the following page
+        """
+        result: IntentResult = self._invoicing_data_source.get_invoices_page(
+            after=after
+        )
+        if not result.was_intent_successful:
+            result.error_msg = "Failed to load the invoices. Please retry"
+            result.log_message_if_any()
+        return result
+
     def delete_invoice_by_id(self, invoice_id) -> IntentResult[None]:
         """Delete an invoice by id."""
         try:
             self._invoicing_data_source.delete_invoice_by_id(invoice_id)
+            self._dashboard_aggregates.remove_invoice(invoice_id)
             return IntentResult(was_intent_successful=True)
         except Exception as ex:
             logger.error(f"Could not delete invoice with id {invoice_id}.")
@@ -93,19 +132,27 @@ class InvoicingIntent(Intent):
         from_date: date,
         to_date: date,
         render: bool = True,
+        pack_timesheet: bool = True,
+        periods: Optional[List[Tuple[date, date]]] = None,
     ) -> IntentResult[Invoice]:
-        """Create a new invoice from time tracking data."""
+        """Create a new invoice from time tracking data.
+
+        The invoice gets one timesheet per period with time tracking data, by default
+        for the single period from from_date to to_date. Unless pack_timesheet is False,
+        the items of the timesheets are stored as a single blob each instead of one
+        row each, see Timesheet.pack_items.
+        """
         logger.info(f"⚙️ Creating invoice for {project.title}...")
         user = self._user_data_source.get_user()
+        periods = periods or [(from_date, to_date)]
         try:
             # get the time tracking data
             timetracking_data = self._timetracking_data_source.get_data_frame()
-            # generate timesheet
-            timesheet: Timesheet = timetracking.generate_timesheet(
+            # generate timesheets
+            timesheets: List[Timesheet] = timetracking.generate_timesheets(
                 timetracking_data,
                 project,
-                from_date,
-                to_date,
+                periods=periods,
             )
 
             invoice_number = self._invoicing_data_source.generate_invoice_number(
@@ -115,55 +162,33 @@ class InvoicingIntent(Intent):
             invoice: Invoice = invoicing.generate_invoice(
                 date=invoice_date,
                 number=invoice_number,
-                timesheets=[
-                    timesheet,
-                ],
+                timesheets=timesheets,
                 contract=project.contract,
                 project=project,
             )
 
             if render:
-                # render timesheet
-                try:
-                    logger.info(f"⚙️ Rendering timesheet for {project.title}...")
-                    rendering.render_timesheet(
-                        user=user,
-                        timesheet=timesheet,
-                        out_dir=Path.home() / ".tuttle" / "Timesheets",
-                        only_final=True,
-                    )
-                    logger.info(f"✅ rendered timesheet for {project.title}")
-                except Exception as ex:
-                    logger.error(
-                        f"❌ Error rendering timesheet for {project.title}: {ex}"
-                    )
-                    logger.exception(ex)
-                # render invoice
-                try:
-                    logger.info(f"⚙️ Rendering invoice for {project.title}...")
-                    rendering.render_invoice(
-                        user=user,
-                        invoice=invoice,
-                        out_dir=Path.home() / ".tuttle" / "Invoices",
-                        only_final=True,
-                    )
-                    logger.info(f"✅ rendered invoice for {project.title}")
-                except Exception as ex:
-                    logger.error(f"❌ Error rendering invoice for {project.title}: {ex}")
-                    logger.exception(ex)
-
-            # save invoice and timesheet
-            timesheet.invoice = invoice
-            assert timesheet.invoice is not None
-            assert len(invoice.timesheets) == 1
+                self._render_documents(user, invoice, timesheets)
+
+            # save invoice and timesheets
+            for timesheet in timesheets:
+                timesheet.invoice = invoice
+                if pack_timesheet:
+                    timesheet.pack_items()
+            assert len(invoice.timesheets) == len(timesheets)
             # self._invoicing_data_source.save_timesheet(timesheet)
             self._invoicing_data_source.save_invoice(invoice)
+            self._dashboard_aggregates.apply_invoice(invoice)
             return IntentResult(
                 was_intent_successful=True,
                 data=invoice,
             )
         except ValueError:
-            error_message = f"No time tracking data found for project '{project.title}' between {from_date} and {to_date}."
+            period_text = ", ".join(
+                f"between {period_start} and {period_end}"
+                for period_start, period_end in periods
+            )
+            error_message = f"No time tracking data found for project '{project.title}' {period_text}."
             logger.error(error_message)
             return IntentResult(
                 was_intent_successful=False,
@@ -178,16 +203,183 @@ class InvoicingIntent(Intent):
                 error_msg=error_message,
             )
 
+    def _render_documents(
+        self,
+        user: User,
+        invoice: Invoice,
+        timesheets: List[Timesheet],
+    ):
+        """Renders the timesheets and the invoice, logging failures"""
+        project = invoice.project
+        for timesheet in timesheets:
+            try:
+                logger.info(f"⚙️ Rendering timesheet {timesheet.title}...")
+                rendering.render_timesheet(
+                    user=user,
+                    timesheet=timesheet,
+                    out_dir=Path.home() / ".tuttle" / "Timesheets",
+                    only_final=True,
+                )
+                logger.info(f"✅ rendered timesheet {timesheet.title}")
+            except Exception as ex:
+                logger.error(f"❌ Error rendering timesheet {timesheet.title}: {ex}")
+                logger.exception(ex)
+        try:
+            logger.info(f"⚙️ Rendering invoice for {project.title}...")
+            rendering.render_invoice(
+                user=user,
+                invoice=invoice,
+                out_dir=Path.home() / ".tuttle" / "Invoices",
+                only_final=True,
+            )
+            logger.info(f"✅ rendered invoice for {project.title}")
+        except Exception as ex:
+            logger.error(f"❌ Error rendering invoice for {project.title}: {ex}")
+            logger.exception(ex)
+
+    def _render_and_save(self, user: User, invoice: Invoice):
+        """Renders the documents of a saved invoice, then saves their rendered status
+
+        Runs on the background thread, so it writes through a data source of its own:
+        the connection of the intent's data source carries the UI thread's transactions.
+        """
+        self._render_documents(user, invoice, invoice.timesheets)
+        self._background_invoicing_data_source.save_rendered_status(invoice)
+
+    def get_due_billing(
+        self,
+        today: Optional[date] = None,
+    ) -> IntentResult[Optional[List[DueBilling]]]:
+        """Finds the projects with billing periods that are over and not invoiced yet
+
+        The periods follow the billing cycle of each project's contract, starting after
+        the last period invoiced, see tuttle.invoicing.due_billing_periods. Only periods
+        with time tracked for the project are due, as only they can be invoiced.
+        """
+        try:
+            due = self._find_due_billing(today or date.today())
+            return IntentResult(was_intent_successful=True, data=due)
+        except Exception as ex:
+            error_message = "Failed to find the projects due for invoicing."
+            logger.error(error_message)
+            logger.exception(ex)
+            return IntentResult(
+                was_intent_successful=False,
+                error_msg=error_message,
+            )
+
+    def _split_by_tag(self) -> Dict[str, DataFrame]:
+        """The time tracking data split by tag, in a single pass"""
+        timetracking_data = self._timetracking_data_source.get_data_frame()
+        if timetracking_data is None:
+            return {}
+        return {
+            tag: tag_data
+            for tag, tag_data in timetracking_data.groupby(
+                "tag", observed=True, sort=False
+            )
+        }
+
+    def _find_due_billing(self, today: date) -> List[DueBilling]:
+        """The due billing periods with time tracked, looked up in the cached rollups"""
+        projects = list(self._projects_intent.get_all_projects_as_map().values())
+        rollups = self._timetracking_data_source.get_rollups(projects)
+        if rollups is None:
+            return []
+        billed_until = self._invoicing_data_source.get_billed_until_by_project()
+        due = []
+        for project in projects:
+            # completed projects still get the periods up to their contract's end billed
+            if project.contract is None:
+                continue
+            periods = rollups.periods_with_entries(
+                project.tag,
+                invoicing.due_billing_periods(
+                    project.contract, billed_until.get(project.id), today
+                ),
+            )
+            if periods:
+                due.append(DueBilling(project=project, periods=periods))
+        return due
+
+    def create_due_invoices(
+        self,
+        invoice_date: Optional[date] = None,
+        render: bool = True,
+    ) -> IntentResult[Optional[List[Invoice]]]:
+        """Creates an invoice for every project with due billing periods, in one batch
+
+        The due periods are looked up in the cached rollups. The time tracking data is
+        split by tag once, each project's timesheets are cut from its share. The invoices are saved together, their rendering is queued in the
+        background.
+        """
+        invoice_date = invoice_date or date.today()
+        try:
+            due_billing = self._find_due_billing(invoice_date)
+            data_by_tag = self._split_by_tag() if due_billing else {}
+            invoices = []
+            with self._invoicing_data_source.unit_of_work():
+                for due in due_billing:
+                    project = due.project
+                    timesheets = timetracking.generate_timesheets(
+                        data_by_tag[project.tag],
+                        project,
+                        periods=due.periods,
+                        date=invoice_date,
+                    )
+                    invoice = invoicing.generate_invoice(
+                        date=invoice_date,
+                        number=self._invoicing_data_source.generate_invoice_number(
+                            invoice_date
+                        ),
+                        timesheets=timesheets,
+                        contract=project.contract,
+                        project=project,
+                    )
+                    for timesheet in timesheets:
+                        timesheet.invoice = invoice
+                        timesheet.pack_items()
+                    self._invoicing_data_source.save_invoice(invoice)
+                    invoices.append(invoice)
+            for invoice in invoices:
+                self._dashboard_aggregates.apply_invoice(invoice)
+            if render and invoices:
+                user = self._user_data_source.get_user()
+                for invoice in invoices:
+                    BackgroundJobs().enqueue(
+                        f"render invoice {invoice.number}",
+                        functools.partial(self._render_and_save, user, invoice),
+                    )
+            logger.info(f"✅ created {len(invoices)} due invoices")
+            return IntentResult(was_intent_successful=True, data=invoices)
+        except Exception as ex:
+            error_message = "Failed to create the due invoices."
+            logger.error(error_message)
+            logger.exception(ex)
+            return IntentResult(
+                was_intent_successful=False,
+                error_msg=error_message,
+            )
+
     def update_invoice(
         self,
         invoice: Invoice,
     ) -> IntentResult:
-        result: IntentResult = self._invoicing_data_source.save_invoice(invoice)
-        if not result.was_intent_successful:
-            result.log_message_if_any()
-            result.error_msg = "Failed to update the invoice."
+        try:
+            self._invoicing_data_source.save_invoice(invoice)
+            self._dashboard_aggregates.apply_invoice(invoice)
+            return IntentResult(
+                was_intent_successful=True,
+                data=invoice,
+            )
+        except Exception as ex:
+            logger.error(f"❌ Error updating invoice: {ex}")
+            logger.exception(ex)
             # TODO re-load old invoice
-        return result
+            return IntentResult(
+                was_intent_successful=False,
+                error_msg="Failed to update the invoice.",
+            )
 
     def send_invoice_by_mail(self, invoice: Invoice) -> IntentResult[None]:
         """attempts to trigger the mail client to send the intent as attachment"""
@@ -255,6 +447,7 @@ class InvoicingIntent(Intent):
         try:
             invoice.sent = not invoice.sent
             self._invoicing_data_source.save_invoice(invoice)
+            self._dashboard_aggregates.apply_invoice(invoice)
             return IntentResult(
                 was_intent_successful=True,
                 data=invoice,
@@ -282,6 +475,7 @@ class InvoicingIntent(Intent):
         try:
             invoice.paid = not invoice.paid
             self._invoicing_data_source.save_invoice(invoice)
+            self._dashboard_aggregates.apply_invoice(invoice)
             return IntentResult(
                 was_intent_successful=True,
                 data=invoice,
@@ -311,6 +505,7 @@ class InvoicingIntent(Intent):
         try:
             invoice.cancelled = not invoice.cancelled
             self._invoicing_data_source.save_invoice(invoice)
+            self._dashboard_aggregates.apply_invoice(invoice)
             return IntentResult(
                 was_intent_successful=True,
                 data=invoice,
@@ -346,13 +541,14 @@ class InvoicingIntent(Intent):
             )
 
     def view_timesheet_for_invoice(self, invoice: Invoice) -> IntentResult[None]:
-        """Attempts to open the timesheet for the invoice in the default pdf viewer"""
+        """Attempts to open the timesheets for the invoice in the default pdf viewer"""
         try:
-            timesheet = self._invoicing_data_source.get_timesheet_for_invoice(invoice)
-            timesheet_path = (
-                Path().home() / ".tuttle" / "Timesheets" / f"{timesheet.prefix}.pdf"
-            )
-            preview_pdf(timesheet_path)
+            timesheets = self._invoicing_data_source.get_timesheets_for_invoice(invoice)
+            for timesheet in timesheets:
+                timesheet_path = (
+                    Path().home() / ".tuttle" / "Timesheets" / f"{timesheet.prefix}.pdf"
+                )
+                preview_pdf(timesheet_path)
             return IntentResult(was_intent_successful=True)
         except ValueError as ve:
             logger.error(f"❌ Error getting timesheet for invoice: {ve}")
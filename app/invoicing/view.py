@@ -139,6 +139,7 @@ class InvoicingListView(TView, UserControl):
         super().__init__(params=params)
         self.intent = InvoicingIntent(client_storage=params.client_storage)
         self.invoices_to_display = {}
+        self.next_page_cursor = None
         self.contacts = {}
         self.active_projects = {}
         self.editor = None
@@ -209,26 +210,62 @@ class InvoicingListView(TView, UserControl):
         """Refreshes the invoices"""
         self.invoices_list_control.controls.clear()
         for key in self.invoices_to_display:
-            try:
-                invoice = self.invoices_to_display[key]
-                invoiceItemControl = InvoiceTile(
-                    invoice=invoice,
-                    on_delete_clicked=self.on_delete_invoice_clicked,
-                    on_mail_invoice=self.on_mail_invoice,
-                    on_view_invoice=self.on_view_invoice,
-                    on_view_timesheet=self.on_view_timesheet,
-                    toggle_paid_status=self.toggle_paid_status,
-                    toggle_cancelled_status=self.toggle_cancelled_status,
-                    toggle_sent_status=self.toggle_sent_status,
-                )
-            except Exception as ex:
-                logger.error(f"Error while refreshing invoice: {ex}")
-                logger.exception(ex)
-                invoiceItemControl = ListTile(
-                    title="Error while refreshing invoice",
-                )
-            finally:
-                self.invoices_list_control.controls.append(invoiceItemControl)
+            self.add_invoice_tile(self.invoices_to_display[key])
+
+    def add_invoice_tile(self, invoice: Invoice):
+        """Appends a tile for the given invoice to the invoices list"""
+        try:
+            invoiceItemControl = InvoiceTile(
+                invoice=invoice,
+                on_delete_clicked=self.on_delete_invoice_clicked,
+                on_mail_invoice=self.on_mail_invoice,
+                on_view_invoice=self.on_view_invoice,
+                on_view_timesheet=self.on_view_timesheet,
+                toggle_paid_status=self.toggle_paid_status,
+                toggle_cancelled_status=self.toggle_cancelled_status,
+                toggle_sent_status=self.toggle_sent_status,
+            )
+        except Exception as ex:
+            logger.error(f"Error while refreshing invoice: {ex}")
+            logger.exception(ex)
+            invoiceItemControl = ListTile(
+                title="Error while refreshing invoice",
+            )
+        finally:
+            self.invoices_list_control.controls.append(invoiceItemControl)
+
+    def load_first_page_of_invoices(self):
+        """Loads the most recent page of invoices"""
+        self.invoices_to_display = {}
+        self.next_page_cursor = None
+        self.invoices_list_control.controls.clear()
+        self.load_next_page()
+
+    def load_next_page(self) -> bool:
+        """Loads the next page of invoices and appends their tiles, returns False on failure"""
+        result: IntentResult = self.intent.get_invoices_page(
+            after=self.next_page_cursor
+        )
+        if not result.was_intent_successful:
+            self.show_snack(result.error_msg, True)
+            return False
+        for invoice in result.data.entities:
+            if invoice.id in self.invoices_to_display:
+                # saved while an earlier page was displayed
+                continue
+            self.invoices_to_display[invoice.id] = invoice
+            self.add_invoice_tile(invoice)
+        self.next_page_cursor = result.data.next_cursor
+        self.load_more_button.visible = self.next_page_cursor is not None
+        return True
+
+    def on_load_more_clicked(self, e):
+        """Called when the user asks for older invoices"""
+        self.loading_indicator.visible = True
+        self.update_self()
+        self.load_next_page()
+        self.loading_indicator.visible = False
+        self.update_self()
 
     def on_mail_invoice(self, invoice: Invoice):
         """Called when the user clicks send in the context menu of an invoice"""
@@ -364,6 +401,34 @@ class InvoicingListView(TView, UserControl):
             self.update_invoice_from_intent_result(result)
         self.update_self()
 
+    def load_due_billing(self):
+        """Offers to create the invoices of the billing periods that are over"""
+        result: IntentResult = self.intent.get_due_billing()
+        due_count = len(result.data) if result.was_intent_successful else 0
+        self.due_invoices_button.text = f"Create {due_count} due invoices"
+        self.due_invoices_button.visible = due_count > 0
+
+    def on_create_due_invoices_clicked(self, e):
+        """Creates the invoices of all projects due for billing in one batch"""
+        if self.is_user_missing_payment_info():
+            return  # can't create invoices without payment info
+        self.loading_indicator.visible = True
+        self.update_self()
+        result: IntentResult = self.intent.create_due_invoices()
+        if not result.was_intent_successful:
+            self.show_snack(result.error_msg, True)
+        else:
+            self.show_snack(
+                f"{len(result.data)} invoices have been created, "
+                "they are being rendered in the background",
+                False,
+            )
+            self.load_first_page_of_invoices()
+            self.no_invoices_control.visible = len(self.invoices_to_display) == 0
+        self.load_due_billing()
+        self.loading_indicator.visible = False
+        self.update_self()
+
     def did_mount(self):
         """Called when the view is mounted"""
         self.initialize_data()
@@ -375,13 +440,11 @@ class InvoicingListView(TView, UserControl):
         self.active_projects = self.intent.get_active_projects_as_map()
         self.time_tracking_data = self.intent.get_time_tracking_data_as_dataframe()
         self.load_user_data()
-        self.invoices_to_display = self.intent.get_all_invoices_as_map()
+        self.load_first_page_of_invoices()
+        self.load_due_billing()
         count = len(self.invoices_to_display)
         self.loading_indicator.visible = False
-        if count == 0:
-            self.no_invoices_control.visible = True
-        else:
-            self.refresh_invoices()
+        self.no_invoices_control.visible = count == 0
         self.update_self()
 
     def build(self):
@@ -407,11 +470,25 @@ class InvoicingListView(TView, UserControl):
             expand=False,
             spacing=dimens.SPACE_STD,
         )
+        self.load_more_button = views.TSecondaryButton(
+            label="Load more",
+            icon=icons.EXPAND_MORE,
+            on_click=self.on_load_more_clicked,
+        )
+        self.load_more_button.visible = False
+        self.due_invoices_button = views.TSecondaryButton(
+            label="Create due invoices",
+            icon=icons.EVENT_REPEAT,
+            on_click=self.on_create_due_invoices_clicked,
+        )
+        self.due_invoices_button.visible = False
         return Column(
             controls=[
                 self.title_control,
+                self.due_invoices_button,
                 views.Spacer(md_space=True),
                 Container(self.invoices_list_control, expand=True),
+                self.load_more_button,
             ],
         )
 
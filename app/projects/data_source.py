@@ -1,8 +1,10 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import datetime
 
-from core.abstractions import SQLModelDataSourceMixin
+import sqlmodel
+
+from core.abstractions import EntityPage, SQLModelDataSourceMixin
 from core.intent_result import IntentResult
 
 from tuttle.model import Contract, Project
@@ -36,6 +38,108 @@ class ProjectDataSource(SQLModelDataSourceMixin):
                 exception=e,
             )
 
+    def get_projects_page(
+        self,
+        after: Optional[Tuple] = None,
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Fetches one page of projects, ordered by id
+
+        Args:
+            after : the cursor of the previous page, or None to fetch the first page
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  EntityPage of Project if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            page = self.query_page(
+                Project,
+                after=after,
+            )
+            return IntentResult(was_intent_successful=True, data=page)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @ProjectDataSource.get_projects_page {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_active_projects(
+        self,
+    ) -> IntentResult[List[Project]]:
+        """Fetches the projects that are not completed, have started and have not ended yet
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  list[Project] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            today = datetime.date.today()
+            projects = self.query_filtered(
+                Project,
+                sqlmodel.not_(Project.is_completed),
+                Project.start_date <= today,
+                sqlmodel.or_(Project.end_date == None, Project.end_date >= today),
+            )
+            return IntentResult(was_intent_successful=True, data=projects)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @ProjectDataSource.get_active_projects {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_completed_projects(
+        self,
+    ) -> IntentResult[List[Project]]:
+        """Fetches the projects that are marked as completed
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  list[Project] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            projects = self.query_filtered(Project, Project.is_completed)
+            return IntentResult(was_intent_successful=True, data=projects)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @ProjectDataSource.get_completed_projects {e.__class__.__name__}",
+                exception=e,
+            )
+
+    def get_upcoming_projects(
+        self,
+    ) -> IntentResult[List[Project]]:
+        """Fetches the projects that are scheduled to start in the future
+
+        Returns:
+            IntentResult:
+                was_intent_successful : bool
+                data :  list[Project] if was_intent_successful else None
+                log_message  : str  if an error or exception occurs
+                exception : Exception if an exception occurs
+        """
+        try:
+            today = datetime.date.today()
+            projects = self.query_filtered(Project, Project.start_date > today)
+            return IntentResult(was_intent_successful=True, data=projects)
+        except Exception as e:
+            return IntentResult(
+                was_intent_successful=False,
+                log_message=f"Exception raised @ProjectDataSource.get_upcoming_projects {e.__class__.__name__}",
+                exception=e,
+            )
+
     def save_project(
         self,
         project: Project,
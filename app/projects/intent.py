@@ -1,16 +1,19 @@
-from typing import Mapping, Optional, Union
+from typing import TYPE_CHECKING, List, Mapping, Optional, Tuple, Union
 
 import datetime
 
 from clients.intent import ClientsIntent
 from contracts.intent import ContractsIntent
 from core.intent_result import IntentResult
-from core.abstractions import Intent
+from core.abstractions import EntityPage, Intent
 
 from tuttle.model import Client, Contract, Project
 
 from .data_source import ProjectDataSource
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 
 class ProjectsIntent(Intent):
     """Handles intents related to the projects data Ui"""
@@ -65,22 +68,24 @@ class ProjectsIntent(Intent):
         project.end_date = end_date
         project.is_completed = is_completed
         project.contract = contract
-        result: IntentResult = self._data_source.save_project(
-            project=project,
-        )
-        if not result.was_intent_successful:
-            if is_updating:
-                # recover old project
-                old_project_result = self._data_source.get_project_by_id(
-                    projectId=project.id
-                )
-                result.data = (
-                    old_project_result.data
-                    if old_project_result.was_intent_successful
-                    else None
-                )
-            result.error_msg = "Failed to save the project. Please retry"
-            result.log_message_if_any()
+        # save and, on failure, reload within one unit of work
+        with self._data_source.unit_of_work():
+            result: IntentResult = self._data_source.save_project(
+                project=project,
+            )
+            if not result.was_intent_successful:
+                if is_updating:
+                    # recover old project
+                    old_project_result = self._data_source.get_project_by_id(
+                        projectId=project.id
+                    )
+                    result.data = (
+                        old_project_result.data
+                        if old_project_result.was_intent_successful
+                        else None
+                    )
+                result.error_msg = "Failed to save the project. Please retry"
+                result.log_message_if_any()
         return result
 
     def get_project_by_id(self, projectId) -> IntentResult[Optional[Project]]:
@@ -113,46 +118,46 @@ class ProjectsIntent(Intent):
 
     def get_all_projects_as_map(self) -> Mapping[int, Project]:
         """Get all projects as a map of project_id to project object"""
-        result: IntentResult = self._data_source.get_all_projects()
+        return self._projects_result_as_map(self._data_source.get_all_projects())
+
+    def _projects_result_as_map(self, result: IntentResult) -> Mapping[int, Project]:
+        """Converts the result of a projects query to a map of project_id to project object"""
         if result.was_intent_successful:
-            projects = result.data
-            projects_map = {project.id: project for project in projects}
-            return projects_map
+            return {project.id: project for project in result.data}
         else:
             result.log_message_if_any()
             return {}
 
+    def get_projects_page(
+        self, after: Optional[Tuple] = None
+    ) -> IntentResult[Optional[EntityPage]]:
+        """Get the next page of projects
+
+        Args:
+            after : the next_cursor of the previously loaded page, None for the first page
+
+        Returns:
+            IntentResult[EntityPage]: the page of projects and the cursor to the following page
+        """
+        result: IntentResult = self._data_source.get_projects_page(after=after)
+        if not result.was_intent_successful:
+            result.error_msg = "Something went wrong, failed to load the projects"
+            result.log_message_if_any()
+        return result
+
     def get_completed_projects_as_map(self) -> Mapping[int, Project]:
         """Get all completed projects as a map of project_id to project object"""
-        _all_projects = self.get_all_projects_as_map()
-        _completed_projects = {}
-        for key in _all_projects:
-            p: Project = _all_projects[key]
-            if p.is_completed:
-                _completed_projects[key] = p
-        return _completed_projects
+        return self._projects_result_as_map(self._data_source.get_completed_projects())
 
     def get_active_projects_as_map(
         self,
     ) -> Mapping[int, Project]:
         """Get all active projects as a map of project_id to project object"""
-        _all_projects = self.get_all_projects_as_map()
-        _active_projects = {}
-        for key in _all_projects:
-            p: Project = _all_projects[key]
-            if p.is_active():
-                _active_projects[key] = p
-        return _active_projects
+        return self._projects_result_as_map(self._data_source.get_active_projects())
 
     def get_upcoming_projects_as_map(self) -> Mapping[int, Project]:
         """Get all upcoming projects as a map of project_id to project object"""
-        _all_projects = self.get_all_projects_as_map()
-        _upcoming_projects = {}
-        for key in _all_projects:
-            p: Project = _all_projects[key]
-            if p.is_upcoming():
-                _upcoming_projects[key] = p
-        return _upcoming_projects
+        return self._projects_result_as_map(self._data_source.get_upcoming_projects())
 
     def delete_project_by_id(self, project_id: str) -> IntentResult[None]:
         """
@@ -187,3 +192,36 @@ class ProjectsIntent(Intent):
             result.log_message_if_any()
         result.data = project
         return result
+
+    def get_progress_of_projects(
+        self, projects: List[Project]
+    ) -> IntentResult[Optional["DataFrame"]]:
+        """Get the progress of the projects towards their contract volume
+
+        Returns:
+            IntentResult:
+                data : DataFrame indexed by project tag, see tuttle.timetracking.progress_all,
+                    None if no time tracking data has been loaded
+        """
+        # pandas is only loaded once progress is asked for
+        from timetracking.data_source import TimeTrackingDataFrameSource
+
+        from tuttle import timetracking
+
+        try:
+            data = TimeTrackingDataFrameSource().get_data_frame()
+            if data is None:
+                return IntentResult(was_intent_successful=True, data=None)
+            return IntentResult(
+                was_intent_successful=True,
+                data=timetracking.progress_all(projects, data),
+            )
+        except Exception as e:
+            result = IntentResult(
+                was_intent_successful=False,
+                error_msg="Failed to calculate the progress of the projects",
+                log_message=f"Exception raised @ProjectsIntent.get_progress_of_projects {e.__class__.__name__}",
+                exception=e,
+            )
+            result.log_message_if_any()
+            return result
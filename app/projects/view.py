@@ -1,5 +1,6 @@
-from typing import Callable, Optional
+from typing import Callable, List, Mapping, Optional
 
+import math
 from enum import Enum
 
 from flet import (
@@ -12,6 +13,7 @@ from flet import (
     Icon,
     IconButton,
     ListTile,
+    ProgressBar,
     ResponsiveRow,
     Row,
     TextButton,
@@ -36,10 +38,17 @@ class ProjectCard(UserControl):
     """Formats a single project info into a card ui display"""
 
     def __init__(
-        self, project, on_view_details_clicked, on_delete_clicked, on_edit_clicked
+        self,
+        project,
+        on_view_details_clicked,
+        on_delete_clicked,
+        on_edit_clicked,
+        progress: Optional[Mapping] = None,
     ):
         super().__init__()
         self.project: Project = project
+        # the project's row of tuttle.timetracking.progress_all, if any
+        self.progress = progress
         self.project_info_container = Column(run_spacing=0, spacing=0)
         self.on_view_details_clicked = on_view_details_clicked
         self.on_delete_clicked = on_delete_clicked
@@ -184,6 +193,10 @@ class ProjectCard(UserControl):
             ),
             views.Spacer(md_space=True),
         ]
+        if self.progress is not None:
+            self.project_info_container.controls.extend(
+                [self.build_progress_row(), views.Spacer(md_space=True)]
+            )
         card = Card(
             elevation=2,
             expand=True,
@@ -196,6 +209,40 @@ class ProjectCard(UserControl):
         )
         return card
 
+    def build_progress_row(self) -> ResponsiveRow:
+        """Builds the row showing the time tracked against the contract volume"""
+        unit = self.project.contract.unit
+        units_tracked = f"{self.progress['units_tracked']:.1f} {unit}s tracked"
+        progress = self.progress["progress"]
+        # projects without a contract volume make no progress towards it
+        has_volume = not math.isnan(progress)
+        progress_text = units_tracked
+        if has_volume:
+            progress_text += f" of {self.progress['volume']:.0f} ({progress:.0%})"
+        return ResponsiveRow(
+            controls=[
+                views.TBodyText(
+                    txt="Progress",
+                    color=colors.GRAY_COLOR,
+                    size=fonts.BODY_2_SIZE,
+                    col={"xs": "12"},
+                ),
+                views.TBodyText(
+                    txt=progress_text,
+                    col={"xs": "12"},
+                ),
+                ProgressBar(
+                    value=min(progress, 1.0) if has_volume else None,
+                    visible=has_volume,
+                    col={"xs": "12"},
+                ),
+            ],
+            alignment=utils.START_ALIGNMENT,
+            vertical_alignment=utils.START_ALIGNMENT,
+            spacing=dimens.SPACE_XS,
+            run_spacing=0,
+        )
+
 
 class ProjectStates(Enum):
     """Project states"""
@@ -594,21 +641,78 @@ class ProjectsListView(TView, UserControl):
             ]
         )
         self.projects_container = views.THomeGrid(max_extent=600)
+        self.load_more_button = views.TSecondaryButton(
+            label="Load more",
+            icon=icons.EXPAND_MORE,
+            on_click=self.on_load_more_clicked,
+        )
+        self.load_more_button.visible = False
         self.projects_to_display = {}
+        self.projects_progress = None
+        self.next_page_cursor = None
         self.dialog = None
 
     def display_currently_filtered_projects(self):
         """Display the projects that according to the current filter"""
         self.projects_container.controls.clear()
+        self.load_progress(list(self.projects_to_display.values()))
         for key in self.projects_to_display:
-            project = self.projects_to_display[key]
-            projectCard = ProjectCard(
-                project=project,
-                on_view_details_clicked=self.on_view_project_clicked,
-                on_delete_clicked=self.on_delete_project_clicked,
-                on_edit_clicked=self.on_edit_project_clicked,
-            )
-            self.projects_container.controls.append(projectCard)
+            self.add_project_card(self.projects_to_display[key])
+
+    def load_progress(self, projects: List[Project]):
+        """Calculates the progress of the given projects at once, for their cards to display"""
+        result = self.intent.get_progress_of_projects(projects)
+        self.projects_progress = result.data if result.was_intent_successful else None
+
+    def add_project_card(self, project: Project):
+        """Appends a card for the given project to the displayed projects"""
+        progress = None
+        if (
+            self.projects_progress is not None
+            and project.tag in self.projects_progress.index
+        ):
+            progress = self.projects_progress.loc[project.tag]
+        projectCard = ProjectCard(
+            project=project,
+            on_view_details_clicked=self.on_view_project_clicked,
+            on_delete_clicked=self.on_delete_project_clicked,
+            on_edit_clicked=self.on_edit_project_clicked,
+            progress=progress,
+        )
+        self.projects_container.controls.append(projectCard)
+
+    def load_next_page(self) -> bool:
+        """Loads the next page of projects and appends their cards, returns False on failure"""
+        result: IntentResult = self.intent.get_projects_page(
+            after=self.next_page_cursor
+        )
+        if not result.was_intent_successful:
+            self.show_snack(result.error_msg, True)
+            return False
+        self.load_progress(result.data.entities)
+        for project in result.data.entities:
+            if project.id in self.projects_to_display:
+                # saved while an earlier page was displayed
+                continue
+            self.projects_to_display[project.id] = project
+            self.add_project_card(project)
+        self.next_page_cursor = result.data.next_cursor
+        self.load_more_button.visible = self.next_page_cursor is not None
+        return True
+
+    def reset_pages(self):
+        """Clears the displayed projects so that paging starts over with the first page"""
+        self.projects_to_display = {}
+        self.next_page_cursor = None
+        self.projects_container.controls.clear()
+
+    def on_load_more_clicked(self, e):
+        """Called when the user asks for more projects"""
+        self.loading_indicator.visible = True
+        self.update_self()
+        self.load_next_page()
+        self.loading_indicator.visible = False
+        self.update_self()
 
     def on_view_project_clicked(self, project_id: str):
         """Called when view details button is clicked on a project card"""
@@ -654,6 +758,7 @@ class ProjectsListView(TView, UserControl):
 
     def on_filter_projects(self, filterByState: ProjectStates):
         """Called when the user selects a filter option"""
+        self.load_more_button.visible = False
         if filterByState.value == ProjectStates.ACTIVE.value:
             self.projects_to_display = self.intent.get_active_projects_as_map()
         elif filterByState.value == ProjectStates.UPCOMING.value:
@@ -661,7 +766,11 @@ class ProjectsListView(TView, UserControl):
         elif filterByState.value == ProjectStates.COMPLETED.value:
             self.projects_to_display = self.intent.get_completed_projects_as_map()
         else:
-            self.projects_to_display = self.intent.get_all_projects_as_map()
+            # all projects are paged
+            self.reset_pages()
+            self.load_next_page()
+            self.update_self()
+            return
         self.display_currently_filtered_projects()
         self.update_self()
 
@@ -678,16 +787,12 @@ class ProjectsListView(TView, UserControl):
         """reloads data displayed when view is mounted or when parent view sends a reload intent"""
         self.mounted = True
         self.loading_indicator.visible = True
-        self.projects_to_display = self.intent.get_all_projects_as_map()
+        self.reset_pages()
+        self.load_next_page()
         count = len(self.projects_to_display)
         self.loading_indicator.visible = False
-        if count == 0:
-            # Show the no projects message
-            self.no_projects_control.visible = True
-            self.projects_container.controls.clear()
-        else:
-            self.no_projects_control.visible = False
-            self.display_currently_filtered_projects()
+        # Show the no projects message if there are none
+        self.no_projects_control.visible = count == 0
         self.update_self()
 
     def build(self):
@@ -699,6 +804,7 @@ class ProjectsListView(TView, UserControl):
                 ProjectFiltersView(onStateChanged=self.on_filter_projects),
                 views.Spacer(md_space=True),
                 Container(self.projects_container, expand=True),
+                self.load_more_button,
             ]
         )
 
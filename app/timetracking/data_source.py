@@ -1,5 +1,6 @@
-from typing import Type, Union, Any, Optional
+from typing import Type, Union, Any, Dict, List, Optional
 
+import datetime
 from pathlib import Path
 
 from loguru import logger
@@ -13,6 +14,7 @@ from tuttle.calendar import ICSCalendar, ICloudCalendar, CloudCalendar
 from tuttle.dev import singleton
 from tuttle.cloud import CloudConnector, CloudProvider
 from tuttle import timetracking
+from tuttle.model import Project
 
 
 @singleton
@@ -22,12 +24,76 @@ class TimeTrackingDataFrameSource:
     def __init__(self):
         super().__init__()
         self.data: Optional[DataFrame] = None
+        # incremented whenever the data frame is replaced
+        self.version = 0
+        self._rollups: Optional[timetracking.TimeTrackingRollups] = None
+        self._rollups_key: Optional[tuple] = None
+        self._evaluations: Dict[datetime.date, DataFrame] = {}
+        self._evaluations_key: Optional[tuple] = None
 
     def get_data_frame(self) -> DataFrame:
         return self.data
 
     def store_data_frame(self, data: DataFrame):
-        self.data = data
+        """Stores the data in the compact representation, see tuttle.timetracking.compact"""
+        self.data = None if data is None else timetracking.compact(data)
+        self.version += 1
+
+    def get_rollups(
+        self, projects: List[Project]
+    ) -> Optional[timetracking.TimeTrackingRollups]:
+        """Rollups of the data frame, reused until the data or the projects' billing terms change"""
+        if self.data is None:
+            return None
+        key = (self.version, _billing_terms_key(projects))
+        if key != self._rollups_key:
+            self._rollups = timetracking.TimeTrackingRollups(self.data, projects)
+            self._rollups_key = key
+        return self._rollups
+
+    def get_planning_evaluation(
+        self,
+        projects: List[Project],
+        from_date: datetime.date,
+    ) -> Optional[DataFrame]:
+        """The planned entries from the date on with their revenue, see tuttle.timetracking.evaluate_time_planning
+
+        Evaluations are reused until the data or the projects' billing terms change.
+        """
+        if self.data is None:
+            return None
+        terms_key = _billing_terms_key(projects)
+        if (self.version, terms_key) != self._evaluations_key:
+            self._evaluations = {}
+            self._evaluations_key = (self.version, terms_key)
+        if from_date not in self._evaluations:
+            data = self.data
+            if not data.index.is_monotonic_increasing:
+                # selecting by date requires sorted entries
+                data = data.sort_index()
+            planning_data = timetracking.get_time_planning_data(
+                data, from_date=from_date
+            )
+            self._evaluations[from_date] = timetracking.evaluate_time_planning(
+                planning_data, projects
+            )
+        return self._evaluations[from_date]
+
+
+def _billing_terms_key(projects: List[Project]) -> tuple:
+    """Identifies the billing terms of the projects, to detect when they change"""
+    return tuple(
+        (
+            project.tag,
+            project.title,
+            project.contract_id,
+            project.contract.rate,
+            project.contract.unit,
+            project.contract.units_per_workday,
+        )
+        for project in projects
+        if project.contract is not None
+    )
 
 
 class TimeTrackingSpreadsheetSource:
@@ -1,5 +1,6 @@
 from typing import Optional, Type, Union
 
+import datetime
 from pathlib import Path
 
 from loguru import logger
@@ -10,6 +11,7 @@ from core.intent_result import IntentResult
 from pandas import DataFrame
 from preferences.intent import PreferencesIntent
 from preferences.model import PreferencesStorageKeys
+from projects.data_source import ProjectDataSource
 
 from .data_source import (
     TimeTrackingCloudCalendarSource,
@@ -19,6 +21,7 @@ from .data_source import (
 )
 from tuttle.cloud import CloudConnector, CloudProvider
 from tuttle.calendar import Calendar
+from tuttle.time import Cycle
 
 
 class TimeTrackingIntent(Intent):
@@ -30,6 +33,7 @@ class TimeTrackingIntent(Intent):
         self._file_calendar_source = TimeTrackingFileCalendarSource()
         self._spreadsheet_source = TimeTrackingSpreadsheetSource()
         self._timetracking_data_frame_source = TimeTrackingDataFrameSource()
+        self._project_data_source = ProjectDataSource()
         self._preferences_intent = PreferencesIntent(client_storage)
 
     def get_preferred_cloud_account(self) -> IntentResult[Optional[list]]:
@@ -160,6 +164,72 @@ class TimeTrackingIntent(Intent):
                 data=None,
             )
 
+    def get_time_tracked(
+        self,
+        by: str = "project",
+        cycle: Optional[Cycle] = Cycle.monthly,
+    ) -> IntentResult[Optional[DataFrame]]:
+        """Total duration and billable amount of the time tracking data per period
+
+        Args:
+            by : tag, project, client or contract
+            cycle : length of the periods, or None for the total over all time
+        """
+        try:
+            projects_result = self._project_data_source.get_all_projects()
+            if not projects_result.was_intent_successful:
+                return projects_result
+            rollups = self._timetracking_data_frame_source.get_rollups(
+                projects=projects_result.data
+            )
+            return IntentResult(
+                was_intent_successful=True,
+                data=None if rollups is None else rollups.rollup(by=by, cycle=cycle),
+            )
+        except Exception as ex:
+            error_msg = "Failed to aggregate time tracking data"
+            logger.error(error_msg)
+            logger.exception(ex)
+            return IntentResult(
+                was_intent_successful=False,
+                error_msg=error_msg,
+                exception=ex,
+                data=None,
+            )
+
+    def get_time_planning_evaluation(
+        self,
+        from_date: Optional[datetime.date] = None,
+    ) -> IntentResult[Optional[DataFrame]]:
+        """The planned entries from the date on, today by default, with their revenue
+
+        Suitable for tuttle.dataviz.plot_eval_time_planning.
+        """
+        try:
+            if from_date is None:
+                from_date = datetime.date.today()
+            projects_result = self._project_data_source.get_all_projects()
+            if not projects_result.was_intent_successful:
+                return projects_result
+            evaluation = self._timetracking_data_frame_source.get_planning_evaluation(
+                projects=projects_result.data,
+                from_date=from_date,
+            )
+            return IntentResult(
+                was_intent_successful=True,
+                data=evaluation,
+            )
+        except Exception as ex:
+            error_msg = "Failed to evaluate the time planning"
+            logger.error(error_msg)
+            logger.exception(ex)
+            return IntentResult(
+                was_intent_successful=False,
+                error_msg=error_msg,
+                exception=ex,
+                data=None,
+            )
+
     def set_timetracking_data(self, data: DataFrame) -> IntentResult[None]:
         try:
             self._timetracking_data_frame_source.store_data_frame(data=data)
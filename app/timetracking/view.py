@@ -21,6 +21,7 @@ from core.intent_result import IntentResult
 from pandas import DataFrame
 from res import colors, dimens, fonts, res_utils
 
+from tuttle import dataviz
 from tuttle.calendar import Calendar
 from tuttle.cloud import CloudConnector
 
@@ -243,8 +244,7 @@ class TimeTrackingView(TView, UserControl):
             is_error = not intent_result.was_intent_successful
             self.show_snack(msg, is_error)
             if intent_result.was_intent_successful:
-                self.dataframe_to_display = intent_result.data
-                self.update_timetracking_dataframe()
+                self.update_timetracking_dataframe(intent_result.data)
                 self.display_dataframe()
             self.set_progress_hint(hide_progress=True)
 
@@ -376,8 +376,7 @@ class TimeTrackingView(TView, UserControl):
                 is_error=True,
             )
             return
-        self.dataframe_to_display = result.data
-        self.update_timetracking_dataframe()
+        self.update_timetracking_dataframe(result.data)
         self.display_dataframe()
 
     """ DISPLAYED DATA FRAME """
@@ -390,10 +389,13 @@ class TimeTrackingView(TView, UserControl):
         if isinstance(result.data, DataFrame):
             self.dataframe_to_display = result.data
 
-    def update_timetracking_dataframe(self):
-        result = self.intent.set_timetracking_data(self.dataframe_to_display)
+    def update_timetracking_dataframe(self, data: DataFrame):
+        """Stores the data and displays the stored compact copy, so that the loaded data can be freed"""
+        result = self.intent.set_timetracking_data(data)
         if not result.was_intent_successful:
             self.show_snack(result.error_msg, is_error=True)
+            return
+        self.load_existing_dataframe()
 
     def display_dataframe(self):
         if not isinstance(self.dataframe_to_display, DataFrame):
@@ -406,6 +408,51 @@ class TimeTrackingView(TView, UserControl):
             },
         )
         self.timetracked_container.content = data_table
+        self.display_time_tracked()
+        self.display_planned_revenue()
+
+    def display_time_tracked(self):
+        """Displays the total hours and billable amount per project"""
+        result = self.intent.get_time_tracked(by="project", cycle=None)
+        if not result.was_intent_successful:
+            self.show_snack(result.error_msg, is_error=True)
+            return
+        if result.data is None or result.data.empty:
+            self.time_tracked_container.content = None
+            return
+        totals = DataFrame(
+            {
+                "hours": (result.data["duration"].dt.total_seconds() / 3600).round(2),
+                "billable amount": result.data["billable_amount"].round(2),
+            }
+        )
+        self.time_tracked_container.content = tabular.data_frame_to_data_table(
+            data_frame=totals.reset_index(),
+            table_style={
+                "border": border.all(),
+                "border_radius": 10,
+            },
+        )
+
+    def display_planned_revenue(self):
+        """Displays the revenue planned from today on per project"""
+        result = self.intent.get_time_planning_evaluation()
+        if not result.was_intent_successful:
+            self.show_snack(result.error_msg, is_error=True)
+            return
+        if result.data is None or result.data.empty:
+            self.planned_revenue_container.content = None
+            return
+        planned = dataviz.aggregate_time_planning(result.data, by="project")
+        self.planned_revenue_container.content = tabular.data_frame_to_data_table(
+            data_frame=planned.round({"revenue": 2}).rename(
+                columns={"revenue": "planned revenue"}
+            ),
+            table_style={
+                "border": border.all(),
+                "border_radius": 10,
+            },
+        )
 
     def show_no_recorded_timetracks(self):
         self.no_timetrack_control.visible = True
@@ -460,11 +507,17 @@ class TimeTrackingView(TView, UserControl):
                 )
             ]
         )
+        self.time_tracked_container = Container()
+        self.planned_revenue_container = Container()
         self.timetracked_container = Container(expand=True)
         return Column(
             controls=[
                 self.title_control,
                 views.Spacer(md_space=True),
+                self.time_tracked_container,
+                views.Spacer(md_space=True),
+                self.planned_revenue_container,
+                views.Spacer(md_space=True),
                 self.timetracked_container,
             ]
         )
@@ -6,17 +6,34 @@ __authors__ = [
 ]
 __version__ = "1.0.1"
 
-from . import (
-    banking,
-    calendar,
-    cloud,
-    invoicing,
-    model,
-    tax,
-    timetracking,
-    dataviz,
-    time,
-    rendering,
-    os_functions,
-    mail,
+import importlib
+
+# submodules are imported on first access, so that importing tuttle does not pull in
+# pandas, altair, icloudpy and the like before they are needed
+_submodules = (
+    "banking",
+    "calendar",
+    "cloud",
+    "invoicing",
+    "model",
+    "tax",
+    "timetracking",
+    "dataviz",
+    "time",
+    "rendering",
+    "os_functions",
+    "mail",
+    "tracing",
+    "columnar",
+    "forecasting",
 )
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_submodules))
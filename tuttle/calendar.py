@@ -17,7 +17,7 @@ from pandera.typing import DataFrame
 from pandera import check_io
 from pandas import DataFrame
 
-from . import schema
+from . import schema, tracing
 
 
 def extract_hashtag(string) -> str:
@@ -56,6 +56,7 @@ class CloudCalendar(Calendar):
 class ICSCalendar(Calendar):
     """An ICS data format based calendar."""
 
+    @tracing.traced(name="ICSCalendar.parse", category="import")
     def __init__(
         self,
         name: str,
@@ -88,6 +89,7 @@ class ICSCalendar(Calendar):
         )
         return event_data_raw
 
+    @tracing.traced(category="import")
     @check_io(out=schema.time_tracking)
     def to_data(self) -> DataFrame:
         """Convert ics.Calendar to pandas.DataFrame"""
@@ -146,6 +148,7 @@ class ICloudCalendar(CloudCalendar):
         event_data_raw = pandas.DataFrame(all_events)
         return event_data_raw
 
+    @tracing.traced(category="import")
     @check_io(out=schema.time_tracking)
     def to_data(self) -> DataFrame:
         """Convert iCloud calendar events to time tracking data format."""
@@ -1,6 +1,7 @@
 """Data visualization."""
 
 import altair
+import pandas
 
 # from pandera.typing import DataFrame
 from pandas import DataFrame
@@ -34,16 +35,65 @@ def enable_theme(theme_name="tuttle_dark"):
         raise ValueError("unknown theme: {theme_name}")
 
 
+def enable_data_transformer(name: str = "default", **options):
+    """Sets how the data of charts gets into their Vega-Lite specs.
+
+    "default" inlines the rows in the spec, "json" and "csv" write them to a file that the
+    spec refers to by URL, see altair.data_transformers. Can be used as a context manager.
+
+    Args:
+        name (str): default, json or csv
+        **options: options of the transformer, such as urlpath and filename for json
+    """
+    if name not in altair.data_transformers.names():
+        raise ValueError(f"unknown data transformer: {name}")
+    return altair.data_transformers.enable(name, **options)
+
+
+def aggregate_time_planning(
+    planning_data: DataFrame,
+    by,
+) -> DataFrame:
+    """Total planned revenue by project, or by month and project, as plotted by plot_eval_time_planning
+
+    Args:
+        planning_data (DataFrame): planning data with a revenue column, see tuttle.timetracking.evaluate_time_planning
+        by: "project" or ("month", "project")
+    """
+    revenue = planning_data["revenue"].to_numpy()
+    project = planning_data["tag"].astype(str).to_numpy()
+    if by == "project":
+        return (
+            DataFrame({"project": project, "revenue": revenue})
+            .groupby("project", as_index=False)["revenue"]
+            .sum()
+        )
+    elif by == ("month", "project"):
+        begin = pandas.DatetimeIndex(planning_data.index)
+        if begin.tz is not None:
+            # months follow the local time of the entries
+            begin = begin.tz_localize(None)
+        month = begin.to_period("M").to_timestamp()
+        return (
+            DataFrame({"month": month, "project": project, "revenue": revenue})
+            .groupby(["month", "project"], as_index=False)["revenue"]
+            .sum()
+        )
+    else:
+        raise ValueError(f"unknown mode {by}")
+
+
 def plot_eval_time_planning(
     planning_data,
     by,
 ):
+    """Bar chart of the planned revenue, see aggregate_time_planning
+
+    The data is aggregated before it is passed to the chart, so that the spec holds one
+    row per bar rather than every planned entry.
+    """
+    plot_data = aggregate_time_planning(planning_data, by)
     if by == "project":
-        plot_data = (
-            planning_data.reset_index()
-            .filter(["tag", "revenue"])
-            .rename(columns={"tag": "project"})
-        )
         plot = (
             altair.Chart(plot_data)
             .mark_bar()
@@ -53,18 +103,13 @@ def plot_eval_time_planning(
             )
             .properties(width=600)
         )
-    elif by == ("month", "project"):
-        plot_data = (
-            planning_data.reset_index()
-            .filter(["tag", "begin", "revenue"])
-            .rename(columns={"tag": "project", "begin": "month_end"})
-        )
+    else:
         plot = (
             altair.Chart(plot_data)
             .mark_bar()
             .encode(
                 y=altair.Y(
-                    "yearmonth(month_end):O",
+                    "yearmonth(month):O",
                     axis=altair.Axis(title="month"),
                 ),
                 x=altair.X(
@@ -74,6 +119,4 @@ def plot_eval_time_planning(
             )
             .properties(width=600)
         )
-    else:
-        raise ValueError(f"unknown mode {by}")
     return plot
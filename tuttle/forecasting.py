@@ -0,0 +1,161 @@
+"""Income and tax forecasting.
+
+Projects the monthly revenue of the planned time, valued at the rates of the contracts,
+and the income tax and disposable income that follow from it. The uncertainty of the
+plan is simulated: in each scenario, every project realizes a random share of its
+planned revenue in every month. All scenarios are computed in one pass over arrays of
+shape (scenarios, months, projects), so that thousands of them can be recomputed
+interactively.
+"""
+
+from typing import List, Sequence
+
+from dataclasses import dataclass
+
+import numpy
+import pandas
+from pandas import DataFrame
+
+from . import tax, timetracking, tracing
+from .model import Project
+
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+
+
+def monthly_planned_revenue(
+    planning_data: DataFrame,
+    projects: List[Project],
+) -> DataFrame:
+    """Planned revenue per month and project, see timetracking.planned_revenue
+
+    Returns:
+        DataFrame indexed by month, without gaps, with one column per project tag.
+    """
+    revenue = timetracking.planned_revenue(planning_data, projects)
+    begin = pandas.DatetimeIndex(planning_data.index)
+    if begin.tz is not None:
+        # months follow the local time of the entries
+        begin = begin.tz_localize(None)
+    months = begin.to_period("M")
+    monthly = (
+        pandas.DataFrame(
+            {
+                "month": months,
+                "tag": planning_data["tag"].to_numpy(),
+                "revenue": revenue.to_numpy(),
+            }
+        )
+        .dropna(subset=["revenue"])
+        .groupby(["month", "tag"])["revenue"]
+        .sum()
+        .unstack("tag", fill_value=0.0)
+    )
+    if monthly.empty:
+        return monthly
+    all_months = pandas.period_range(monthly.index.min(), monthly.index.max(), freq="M")
+    return monthly.reindex(all_months, fill_value=0.0).rename_axis("month")
+
+
+@dataclass
+class IncomeForecast:
+    """Simulated monthly figures, as arrays of shape (scenarios, months)"""
+
+    months: pandas.PeriodIndex
+    revenue: numpy.ndarray
+    expenses: numpy.ndarray
+    tax: numpy.ndarray
+
+    @property
+    def disposable_income(self) -> numpy.ndarray:
+        return self.revenue - self.expenses - self.tax
+
+    def quantiles(self, q: Sequence[float] = DEFAULT_QUANTILES) -> DataFrame:
+        """Quantiles of the revenue, tax and disposable income per month
+
+        Returns:
+            DataFrame indexed by month, with the columns (measure, quantile).
+        """
+        measures = {
+            "revenue": self.revenue,
+            "tax": self.tax,
+            "disposable_income": self.disposable_income,
+        }
+        columns = {}
+        for measure, values in measures.items():
+            for quantile, row in zip(q, numpy.quantile(values, q, axis=0)):
+                columns[(measure, quantile)] = row
+        return DataFrame(columns, index=self.months)
+
+
+def _tariff_year(year: int) -> int:
+    """The latest year with a known tariff that is not after the year"""
+    years = sorted(tax.INCOME_TAX_TARIFFS_GERMANY)
+    earlier = [known for known in years if known <= year]
+    return earlier[-1] if earlier else years[0]
+
+
+@tracing.traced()
+def forecast_income(
+    monthly_revenue: DataFrame,
+    n_scenarios: int = 10000,
+    realization: float = 0.9,
+    concentration: float = 20.0,
+    monthly_expenses: float = 0.0,
+    income_to_date: float = 0.0,
+    country: str = "Germany",
+    seed=None,
+) -> IncomeForecast:
+    """Simulates the monthly income of the planned revenue in many scenarios
+
+    Args:
+        monthly_revenue (DataFrame): planned revenue per month and project, see monthly_planned_revenue
+        n_scenarios (int): number of scenarios to simulate
+        realization (float): the expected share of the planned revenue that is realized
+        concentration (float): how closely the realized shares follow the expected one,
+            the parameter a + b of their beta distribution
+        monthly_expenses (float): deductible expenses per month
+        income_to_date (float): taxable income of the first year before the forecast
+        country (str): the country of the income tax
+        seed: seed of the random number generator, for reproducible forecasts
+
+    Returns:
+        IncomeForecast: revenue, expenses and income tax per scenario and month. The tax
+        of each year is distributed over its months in proportion to their income.
+    """
+    if not 0 < realization < 1:
+        raise ValueError(f"realization must be between 0 and 1, not {realization}")
+    months = pandas.PeriodIndex(monthly_revenue.index, freq="M")
+    planned = monthly_revenue.to_numpy(dtype="float64")
+    rng = numpy.random.default_rng(seed)
+    shares = rng.beta(
+        realization * concentration,
+        (1 - realization) * concentration,
+        size=(n_scenarios,) + planned.shape,
+    )
+    revenue = numpy.einsum("smp,mp->sm", shares, planned)
+    expenses = numpy.full_like(revenue, monthly_expenses)
+    income = revenue - expenses
+
+    monthly_tax = numpy.zeros_like(revenue)
+    years = months.year.to_numpy()
+    for i, year in enumerate(numpy.unique(years)):
+        in_year = years == year
+        prior_income = income_to_date if i == 0 else 0.0
+        tariff_year = _tariff_year(int(year))
+        yearly_income = income[:, in_year].sum(axis=1)
+        yearly_tax = tax.income_tax_vectorized(
+            prior_income + yearly_income, country, year=tariff_year
+        ) - tax.income_tax_vectorized(prior_income, country, year=tariff_year)
+        # in proportion to the positive income of each month
+        weights = numpy.clip(income[:, in_year], 0, None)
+        totals = weights.sum(axis=1, keepdims=True)
+        weights = numpy.divide(
+            weights, totals, out=numpy.zeros_like(weights), where=totals > 0
+        )
+        monthly_tax[:, in_year] = weights * yearly_tax[:, None]
+    return IncomeForecast(
+        months=months,
+        revenue=revenue,
+        expenses=expenses,
+        tax=monthly_tax,
+    )
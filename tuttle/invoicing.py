@@ -1,6 +1,6 @@
 """Invoicing."""
 
-from typing import List, Optional, Dict
+from typing import Dict, List, Optional, Tuple
 import datetime
 from pathlib import Path
 import shutil
@@ -8,9 +8,22 @@ import shutil
 
 import pandas
 import datetime
+import sqlalchemy
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from .model import InvoiceItem, Invoice, Contract, User, Project
-from .timetracking import Timesheet
+from .model import (
+    InvoiceItem,
+    Invoice,
+    InvoiceNumberSequence,
+    Contract,
+    User,
+    Project,
+    invoice_number_counter,
+    invoice_number_prefix,
+    invoice_number_sequence_name,
+)
+from .time import Cycle
+from .timetracking import CYCLE_FREQUENCIES, Timesheet
 
 
 def generate_invoice(
@@ -26,12 +39,15 @@ def generate_invoice(
         project=project,
         number=number,
     )
+    # the quantities come from the aggregates of the timesheets, not from their items
     for timesheet in timesheets:
+        if timesheet.empty:
+            continue
         total_hours = timesheet.total / pandas.Timedelta("1h")
         item = InvoiceItem(
             invoice=invoice,
-            start_date=timesheet.table["begin"].min().date(),
-            end_date=timesheet.table["end"].max().date(),
+            start_date=timesheet.begin.date(),
+            end_date=timesheet.end.date(),
             quantity=total_hours,
             unit="hour",
             unit_price=timesheet.project.contract.rate,
@@ -42,6 +58,56 @@ def generate_invoice(
     return invoice
 
 
+def _billing_frequency(cycle: Cycle) -> str:
+    # cycles shorter than a day are billed by the day
+    return CYCLE_FREQUENCIES[Cycle.daily if cycle == Cycle.hourly else cycle]
+
+
+def billing_periods(
+    start: datetime.date,
+    end: datetime.date,
+    cycle: Cycle,
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """The periods of the billing cycle from start to end, the first and last cut to them.
+
+    Periods are calendar periods: weeks from Monday to Sunday, months, quarters and
+    years. Cycles shorter than a day are billed by the day.
+    """
+    if end < start:
+        return []
+    return [
+        (max(period.start_time.date(), start), min(period.end_time.date(), end))
+        for period in pandas.period_range(start, end, freq=_billing_frequency(cycle))
+    ]
+
+
+def due_billing_periods(
+    contract: Contract,
+    billed_until: Optional[datetime.date],
+    today: datetime.date,
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """The periods of the contract's billing cycle that are over and not billed yet.
+
+    Billing starts the day after billed_until, or on the start date of the contract if
+    nothing was billed before. A period is due once it is over, or once the contract is.
+    """
+    start = contract.start_date
+    if billed_until is not None:
+        start = max(start, billed_until + datetime.timedelta(days=1))
+    last_day = today - datetime.timedelta(days=1)
+    if contract.end_date is not None and contract.end_date < today:
+        last_day = contract.end_date
+    periods = billing_periods(start, last_day, contract.billing_cycle)
+    if periods and last_day != contract.end_date:
+        current_period = pandas.Period(
+            last_day, freq=_billing_frequency(contract.billing_cycle)
+        )
+        if current_period.end_time.date() > last_day:
+            # the current period is not over yet
+            periods.pop()
+    return periods
+
+
 def generate_invoice_email(
     invoice: Invoice,
     user: User,
@@ -62,3 +128,46 @@ def generate_invoice_email(
         "recipient": invoice.client.invoicing_contact.email,
     }
     return email
+
+
+def allocate_invoice_counter(
+    session: sqlalchemy.orm.Session,
+    date: datetime.date,
+    pattern: Optional[str] = None,
+) -> int:
+    """Increments the invoice number sequence of the date and returns its new value
+
+    Runs in the write transaction of the session, which the caller commits. Concurrent
+    allocations are serialized by the database's write lock, so each value is handed out
+    once, and deleting invoices never makes a value reappear. A new sequence continues
+    after the highest counter of the invoices numbered before it existed.
+    """
+    name = invoice_number_sequence_name(date, pattern)
+    sequence = InvoiceNumberSequence.__table__
+    updated = session.execute(
+        sqlalchemy.update(sequence)
+        .where(sequence.c.name == name)
+        .values(last_value=sequence.c.last_value + 1)
+    )
+    if updated.rowcount == 0:
+        number_prefix = invoice_number_prefix(date, pattern)
+        numbers = session.execute(
+            sqlalchemy.select(Invoice.number).where(
+                Invoice.number.startswith(number_prefix, autoescape=True)
+            )
+        ).scalars()
+        counters = [invoice_number_counter(number, date, pattern) for number in numbers]
+        last_value = max(
+            (counter for counter in counters if counter is not None), default=0
+        )
+        session.execute(
+            sqlite_insert(sequence)
+            .values(name=name, last_value=last_value + 1)
+            .on_conflict_do_update(
+                index_elements=[sequence.c.name],
+                set_={"last_value": sequence.c.last_value + 1},
+            )
+        )
+    return session.execute(
+        sqlalchemy.select(sequence.c.last_value).where(sequence.c.name == name)
+    ).scalar_one()
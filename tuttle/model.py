@@ -1,6 +1,6 @@
 """Object model."""
 
-from typing import Optional, List, Dict, Type
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple, Type
 from pydantic import constr, BaseModel, condecimal
 from enum import Enum
 import datetime
@@ -17,7 +17,6 @@ import uuid
 from decimal import Decimal
 from enum import Enum
 
-import pandas
 import sqlalchemy
 
 # from pydantic import str
@@ -28,8 +27,14 @@ from sqlmodel import SQLModel, Field, Relationship, Constraint
 from .dev import deprecated
 from .time import Cycle, TimeUnit
 
+if TYPE_CHECKING:
+    # pandas is imported where it is used, so that importing the model does not load it
+    import pandas
+
 
 def help(model_class: Type[BaseModel]):
+    import pandas
+
     return pandas.DataFrame(
         (
             (field_name, field.field_info.description)
@@ -39,16 +44,63 @@ def help(model_class: Type[BaseModel]):
     )
 
 
-def to_dataframe(items: List[Type[BaseModel]]) -> pandas.DataFrame:
+def to_dataframe(items: List[Type[BaseModel]]) -> "pandas.DataFrame":
     """Convert list of pydantic model items to DataFrame.
 
+    The fields are read column by column, without the validation and copying of
+    item.dict(). Items with nested models are converted record by record.
+
     Args:
-        items (List[Type[BaseModel]]): [description]
+        items (List[Type[BaseModel]]): items of the same model
 
     Returns:
-        pandas.DataFrame: [description]
+        pandas.DataFrame: one row per item, one column per field
     """
-    return pandas.DataFrame.from_records([item.dict() for item in items])
+    import pandas
+
+    if not items:
+        return pandas.DataFrame()
+    fields = type(items[0]).__fields__
+    if any(
+        isinstance(field.type_, type) and issubclass(field.type_, BaseModel)
+        for field in fields.values()
+    ):
+        return pandas.DataFrame.from_records([item.dict() for item in items])
+    return pandas.DataFrame(
+        {name: _to_column([getattr(item, name) for item in items]) for name in fields}
+    ).infer_objects()
+
+
+def _to_column(values: List) -> "pandas.Index | List":
+    """Converts pandas timestamps and timedeltas via their nanoseconds.
+
+    Letting pandas infer the type of a list of these objects takes far longer.
+    """
+    import numpy
+    import pandas
+
+    if not isinstance(values[0], (pandas.Timestamp, pandas.Timedelta)):
+        # types are inferred for the whole frame, much faster than from lists
+        return numpy.fromiter(values, dtype=object, count=len(values))
+    try:
+        nanoseconds = numpy.fromiter(
+            (value.value for value in values), dtype="int64", count=len(values)
+        )
+    except AttributeError:
+        # mixed with None or Python objects
+        return values
+    if isinstance(values[0], pandas.Timedelta):
+        if not all(isinstance(value, pandas.Timedelta) for value in values):
+            return values
+        return pandas.TimedeltaIndex(nanoseconds)
+    # by name, pytz has one tzinfo per UTC offset of a time zone
+    time_zones = {str(getattr(value, "tz", False)) for value in values}
+    if len(time_zones) != 1 or "False" in time_zones:
+        return values
+    time_zone = values[0].tz
+    if time_zone is None:
+        return pandas.DatetimeIndex(nanoseconds)
+    return pandas.DatetimeIndex(nanoseconds, tz="UTC").tz_convert(time_zone)
 
 
 def OneToOneRelationship(back_populates):
@@ -485,6 +537,10 @@ class TimeTrackingItem(SQLModel, table=True):
     )
 
 
+# the item fields stored by Timesheet.pack_items
+PACKED_ITEM_COLUMNS = ["begin", "end", "duration", "title", "tag", "description"]
+
+
 class Timesheet(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
@@ -513,6 +569,25 @@ class Timesheet(SQLModel, table=True):
         },
     )
 
+    # items packed into a single columnar blob instead of one row each, see pack_items
+    items_blob: Optional[bytes] = Field(
+        default=None,
+        sa_column=sqlalchemy.Column(sqlalchemy.LargeBinary),
+        description="The packed items, compressed column by column.",
+    )
+    items_count: Optional[int] = Field(
+        default=None, description="Number of packed items."
+    )
+    items_total: Optional[datetime.timedelta] = Field(
+        default=None, description="Sum of time of the packed items."
+    )
+    items_begin: Optional[datetime.datetime] = Field(
+        default=None, description="Begin of the earliest packed item."
+    )
+    items_end: Optional[datetime.datetime] = Field(
+        default=None, description="End of the latest packed item."
+    )
+
     rendered: bool = Field(
         default=False,
         description="Whether the Timesheet has been rendered as a PDF.",
@@ -538,19 +613,246 @@ class Timesheet(SQLModel, table=True):
     @property
     def total(self) -> datetime.timedelta:
         """Sum of time in timesheet."""
-        total_time = self.table["duration"].sum()
-        return total_time
+        return self._aggregates()["total"]
 
     @property
-    def table(self) -> pandas.DataFrame:
+    def begin(self) -> Optional[datetime.datetime]:
+        """Begin of the earliest item."""
+        return self._aggregates()["begin"]
+
+    @property
+    def end(self) -> Optional[datetime.datetime]:
+        """End of the latest item."""
+        return self._aggregates()["end"]
+
+    @property
+    def table(self) -> "pandas.DataFrame":
         """items as DataFrame"""
-        return to_dataframe(self.items)
+        aggregates = self._aggregates()
+        if aggregates["table"] is None:
+            if self.packed:
+                from . import columnar
+
+                aggregates["table"] = columnar.decode(self.items_blob)
+            else:
+                aggregates["table"] = to_dataframe(self.items)
+        return aggregates["table"].copy()
+
+    @property
+    def packed(self) -> bool:
+        """Whether the items are stored as a blob, see pack_items."""
+        return self.items_blob is not None
+
+    @property
+    def time_tracking_items(self) -> List[TimeTrackingItem]:
+        """The items, decoded from the blob if they are packed.
+
+        Decoded items are not added to the timesheet, so they are never stored as rows.
+        """
+        if not self.packed:
+            return self.items
+        aggregates = self._aggregates()
+        if aggregates.get("items") is None:
+            aggregates["items"] = [
+                TimeTrackingItem(**record) for record in self.table.to_dict("records")
+            ]
+        return aggregates["items"]
+
+    def pack_items(self):
+        """Stores the items as a single compressed columnar blob instead of one row each.
+
+        The count, total, begin and end of the items are kept in columns of the
+        timesheet, so that reading them does not decode the blob. Calling it again
+        packs items appended since into the blob.
+        """
+        import pandas
+
+        from . import columnar
+
+        tables = [self.table] if self.packed else []
+        if self.items or not self.packed:
+            tables.append(to_dataframe(self.items).reindex(columns=PACKED_ITEM_COLUMNS))
+        table = pandas.concat(tables, ignore_index=True)
+        self.items_blob = columnar.encode(table[PACKED_ITEM_COLUMNS])
+        self.items_count = len(table)
+        self.items_total = pandas.to_timedelta(table["duration"]).sum().to_pytimedelta()
+        if not table.empty:
+            self.items_begin = table["begin"].min().to_pydatetime()
+            self.items_end = table["end"].max().to_pydatetime()
+        self.items = []
+        self._invalidate_aggregates()
+
+    def _aggregates(self) -> Dict:
+        """Table and aggregates of the items, kept until the items change."""
+        aggregates = self.__dict__.get("_items_aggregates")
+        if aggregates is None and self.packed:
+            aggregates = {
+                "table": None,
+                "total": self.items_total,
+                "begin": self.items_begin,
+                "end": self.items_end,
+            }
+            object.__setattr__(self, "_items_aggregates", aggregates)
+        elif aggregates is None:
+            aggregates = {"table": None, "total": datetime.timedelta(0)}
+            # missing values are skipped, as by pandas
+            aggregates["begin"] = min(
+                (item.begin for item in self.items if item.begin is not None),
+                default=None,
+            )
+            aggregates["end"] = max(
+                (item.end for item in self.items if item.end is not None),
+                default=None,
+            )
+            for item in self.items:
+                if item.duration is not None:
+                    aggregates["total"] += item.duration
+            # not a field, so neither validated nor stored
+            object.__setattr__(self, "_items_aggregates", aggregates)
+        return aggregates
+
+    def _invalidate_aggregates(self):
+        self.__dict__.pop("_items_aggregates", None)
+
+    def _add_to_aggregates(self, item: TimeTrackingItem):
+        """Updates the aggregates for an appended item instead of recomputing them."""
+        if self.packed:
+            # the aggregates are those of the blob until the item is packed as well
+            return
+        aggregates = self.__dict__.get("_items_aggregates")
+        if aggregates is None:
+            if self.__dict__.get("items") != []:
+                # computed from all items on first access
+                return
+            # the first item, follow the items from here on
+            aggregates = self._aggregates()
+        aggregates["table"] = None
+        if item.duration is not None:
+            aggregates["total"] += item.duration
+        if item.begin is not None and (
+            aggregates["begin"] is None or item.begin < aggregates["begin"]
+        ):
+            aggregates["begin"] = item.begin
+        if item.end is not None and (
+            aggregates["end"] is None or item.end > aggregates["end"]
+        ):
+            aggregates["end"] = item.end
 
     @property
     def empty(self) -> bool:
+        if self.packed:
+            return self.items_count == 0
         return len(self.items) == 0
 
 
+@sqlalchemy.event.listens_for(Timesheet.items, "append")
+def _on_timesheet_item_appended(timesheet, item, initiator):
+    timesheet._add_to_aggregates(item)
+
+
+@sqlalchemy.event.listens_for(Timesheet.items, "remove")
+@sqlalchemy.event.listens_for(Timesheet.items, "bulk_replace")
+def _on_timesheet_items_replaced(timesheet, *args):
+    timesheet._invalidate_aggregates()
+
+
+@sqlalchemy.event.listens_for(Timesheet, "refresh")
+@sqlalchemy.event.listens_for(Timesheet, "expire")
+@sqlalchemy.event.listens_for(Timesheet.items_blob, "set")
+def _on_timesheet_reloaded(timesheet, *args):
+    # None if the timesheet was garbage collected before the session expired it
+    if timesheet is not None:
+        timesheet._invalidate_aggregates()
+
+
+@sqlalchemy.event.listens_for(TimeTrackingItem.begin, "set")
+@sqlalchemy.event.listens_for(TimeTrackingItem.end, "set")
+@sqlalchemy.event.listens_for(TimeTrackingItem.duration, "set")
+def _on_time_tracking_item_changed(item, value, old_value, initiator):
+    # without loading the timesheet of an item that does not have it yet
+    timesheet = item.__dict__.get("timesheet")
+    if timesheet is not None:
+        timesheet._invalidate_aggregates()
+
+
+# invoice numbers are formatted from the invoice date and a counter, by default YYYY-MM-DD-XX
+INVOICE_NUMBER_PATTERN = "{date:%Y-%m-%d}-{counter:02}"
+
+
+def format_invoice_number(
+    date: datetime.date,
+    counter: int,
+    pattern: Optional[str] = None,
+) -> str:
+    """Format an invoice number from a pattern of the fields date and counter."""
+    if pattern is None:
+        pattern = INVOICE_NUMBER_PATTERN
+    return pattern.format(date=date, counter=counter)
+
+
+class _CounterPlaceholder:
+    def __init__(self, text: str = "#"):
+        self.text = text
+
+    def __format__(self, format_spec: str) -> str:
+        return self.text
+
+
+def invoice_number_sequence_name(
+    date: datetime.date,
+    pattern: Optional[str] = None,
+) -> str:
+    """Name of the sequence the counter is drawn from: the number without its counter.
+
+    Numbers that differ only in their counter share a sequence, so a pattern with the
+    full date counts per day, a pattern with only the year counts per year.
+    """
+    return format_invoice_number(date, _CounterPlaceholder(), pattern)
+
+
+def _invoice_number_parts(
+    date: datetime.date,
+    pattern: Optional[str] = None,
+) -> Tuple[str, str]:
+    """The parts of an invoice number before and after its counter."""
+    marker = "\0"
+    prefix, _, suffix = format_invoice_number(
+        date, _CounterPlaceholder(marker), pattern
+    ).partition(marker)
+    return prefix, suffix
+
+
+def invoice_number_prefix(
+    date: datetime.date,
+    pattern: Optional[str] = None,
+) -> str:
+    """The part of the invoice numbers of the pattern and date that precedes the counter."""
+    return _invoice_number_parts(date, pattern)[0]
+
+
+def invoice_number_counter(
+    number: str,
+    date: datetime.date,
+    pattern: Optional[str] = None,
+) -> Optional[int]:
+    """The counter of an invoice number, None if the number does not match the pattern and date."""
+    prefix, suffix = _invoice_number_parts(date, pattern)
+    match = re.fullmatch(re.escape(prefix) + r"(\d+)" + re.escape(suffix), number)
+    return int(match.group(1)) if match else None
+
+
+class InvoiceNumberSequence(SQLModel, table=True):
+    """The last counter used in invoice numbers of a sequence."""
+
+    name: str = Field(
+        primary_key=True,
+        description="The invoice number without its counter, see invoice_number_sequence_name.",
+    )
+    last_value: int = Field(
+        default=0, description="The counter of the last invoice number."
+    )
+
+
 class Invoice(SQLModel, table=True):
     """An invoice is a bill for a client."""
 
@@ -627,15 +929,19 @@ class Invoice(SQLModel, table=True):
         t = self.sum + self.VAT_total
         return Decimal(t)
 
-    def generate_number(self, pattern=None, counter=None) -> str:
-        """Generate an invoice number"""
-        date_prefix = self.date.strftime("%Y-%m-%d")
-        # suffix = hashlib.shake_256(str(uuid.uuid4()).encode("utf-8")).hexdigest(2)
-        # TODO: auto-increment suffix for invoices generated on the same day
+    def generate_number(
+        self,
+        pattern: Optional[str] = None,
+        counter: Optional[int] = None,
+    ) -> str:
+        """Generate an invoice number from a pattern, see format_invoice_number.
+
+        The counter defaults to 1, a unique counter is allocated by the data source.
+        """
         if counter is None:
             counter = 1
-        suffix = f"{counter:02}"
-        self.number = f"{date_prefix}-{suffix}"
+        self.number = format_invoice_number(self.date, counter, pattern)
+        return self.number
 
     @property
     def due_date(self) -> Optional[datetime.date]:
@@ -4,6 +4,7 @@ import os
 import sys
 from pathlib import Path
 import shutil
+import functools
 import glob
 import jinja2
 from babel.numbers import format_currency
@@ -15,6 +16,7 @@ import PyPDF2
 import PIL
 
 
+from . import tracing
 from .model import User, Invoice, Timesheet, Project
 
 
@@ -26,6 +28,60 @@ def get_template_path(template_name) -> str:
     return template_path
 
 
+@jinja2.pass_context
+def _as_currency(context, number):
+    return format_currency(
+        number, currency=context["invoice"].contract.currency, locale="en_US"
+    )
+
+
+def _as_percentage(number):
+    return f"{number * 100:.1f} %"
+
+
+def _as_hours(timedelta):
+    return timedelta / pandas.Timedelta("1 hour")
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_environment(template_name: str) -> jinja2.Environment:
+    """Get the Jinja environment of an HTML template by name
+
+    The environment is created once, so that templates are compiled only on first use.
+    """
+    template_env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(get_template_path(template_name))
+    )
+    template_env.filters["as_currency"] = _as_currency
+    template_env.filters["as_percentage"] = _as_percentage
+    template_env.filters["as_hours"] = _as_hours
+    return template_env
+
+
+@functools.lru_cache(maxsize=None)
+def _load_stylesheet(path: Path, modified: float):
+    """Parse a stylesheet for weasyprint, cached until the file is modified"""
+    import weasyprint
+
+    return weasyprint.CSS(filename=str(path))
+
+
+@tracing.traced(category="rendering")
+def preload():
+    """Load the templates and stylesheets and initialize weasyprint ahead of the first rendering"""
+    for template_name, template_file in (
+        ("invoice-anvil", "invoice.html"),
+        ("timesheet-anvil", "timesheet.html"),
+    ):
+        get_template_environment(template_name).get_template(template_file)
+    for template_name in ("invoice-anvil", "timesheet-anvil"):
+        template_path = get_template_path(template_name)
+        for css_path in glob.glob(f"{template_path}/**/*.css", recursive=True):
+            css_path = Path(css_path).resolve()
+            _load_stylesheet(css_path, css_path.stat().st_mtime)
+
+
+@tracing.traced(category="rendering")
 def convert_html_to_pdf(
     in_path,
     out_path,
@@ -80,10 +136,13 @@ def _convert_html_to_pdf_with_weasyprint(
         raise
     css_paths = [Path(css_path).resolve() for css_path in css_paths]
     logger.debug(f"css_paths: {css_paths}")
+    stylesheets = [
+        _load_stylesheet(css_path, css_path.stat().st_mtime) for css_path in css_paths
+    ]
     (
         weasyprint.HTML(in_path).write_pdf(
             out_path,
-            stylesheets=css_paths,
+            stylesheets=stylesheets,
         )
     )
 
@@ -114,6 +173,7 @@ def _convert_html_to_pdf_with_QT(
     app.exec()
 
 
+@tracing.traced(category="rendering")
 def render_invoice(
     user: User,
     invoice: Invoice,
@@ -133,20 +193,9 @@ def render_invoice(
         str: [description]
     """
 
-    def as_currency(number):
-        return format_currency(
-            number, currency=invoice.contract.currency, locale="en_US"
-        )
-
-    def as_percentage(number):
-        return f"{number * 100:.1f} %"
-
     template_name = f"invoice-anvil"
     template_path = get_template_path(template_name)
-    template_env = jinja2.Environment(loader=jinja2.FileSystemLoader(template_path))
-
-    template_env.filters["as_currency"] = as_currency
-    template_env.filters["as_percentage"] = as_percentage
+    template_env = get_template_environment(template_name)
 
     invoice_template = template_env.get_template(f"invoice.html")
     html = invoice_template.render(
@@ -184,8 +233,11 @@ def render_invoice(
                     dirs_exist_ok=True,
                 )
         if document_format == "pdf":
+            # the copied stylesheets are identical to the template's own, which are
+            # parsed only once
             css_paths = [
-                path for path in glob.glob(f"{invoice_dir}/**/*.css", recursive=True)
+                template_path / Path(path).relative_to(invoice_dir)
+                for path in glob.glob(f"{invoice_dir}/**/*.css", recursive=True)
             ]
             convert_html_to_pdf(
                 in_path=str(invoice_path),
@@ -207,6 +259,7 @@ def render_invoice(
     invoice.rendered = True
 
 
+@tracing.traced(category="rendering")
 def render_timesheet(
     user: User,
     timesheet: Timesheet,
@@ -227,9 +280,7 @@ def render_timesheet(
     """
     template_name = "timesheet-anvil"
     template_path = get_template_path(template_name)
-    template_env = jinja2.Environment(loader=jinja2.FileSystemLoader(template_path))
-    # filters
-    template_env.filters["as_hours"] = lambda td: td / pandas.Timedelta("1 hour")
+    template_env = get_template_environment(template_name)
 
     timesheet_template = template_env.get_template("timesheet.html")
     html = timesheet_template.render(user=user, timesheet=timesheet, style=style)
@@ -265,7 +316,8 @@ def render_timesheet(
                 )
         if document_format == "pdf":
             css_paths = [
-                path for path in glob.glob(f"{timesheet_dir}/**/*.css", recursive=True)
+                template_path / Path(path).relative_to(timesheet_dir)
+                for path in glob.glob(f"{timesheet_dir}/**/*.css", recursive=True)
             ]
             convert_html_to_pdf(
                 in_path=str(timesheet_path),
@@ -1,7 +1,9 @@
 """Pandera schemata."""
+import pandas
 from pandera import (
     SchemaModel,
     DataFrameSchema,
+    Check,
     Column,
     Index,
     DateTime,
@@ -12,15 +14,30 @@ from pandera import (
 )
 
 
+def _is_text(series: pandas.Series) -> bool:
+    """Strings, or a categorical of strings as in timetracking.compact"""
+    if pandas.api.types.is_categorical_dtype(series.dtype):
+        return pandas.api.types.is_object_dtype(series.cat.categories.dtype)
+    return pandas.api.types.is_string_dtype(series.dtype)
+
+
+def TextColumn(nullable: bool = False) -> Column:
+    """A column of strings, which may be stored as a categorical"""
+    return Column(
+        checks=Check(_is_text, error="expected strings or a categorical of strings"),
+        nullable=nullable,
+    )
+
+
 time_tracking = DataFrameSchema(
     # TODO: fix datetime type
     # index=Index(DateTime, name="begin", allow_duplicates=True),
     columns={
         # "begin": Column(Timestamp, nullable=True),
         # "end": Column(DateTime, nullable=True),
-        "title": Column(String, nullable=True),
-        "tag": Column(String),
-        "description": Column(String, nullable=True),
+        "title": TextColumn(nullable=True),
+        "tag": TextColumn(),
+        "description": TextColumn(nullable=True),
         "duration": Column(Timedelta),
         "all_day": Column(Bool, nullable=True),
     },
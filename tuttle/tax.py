@@ -1,47 +1,188 @@
 """Functionality related to taxation."""
 
+from typing import Dict
 
+from dataclasses import dataclass
 from decimal import Decimal
-from unittest.loader import VALID_MODULE_NAME
 
+import numpy
+from numpy.typing import ArrayLike
 
-def income_tax(taxable_income: Decimal, country: str) -> Decimal:
+
+def income_tax(taxable_income: Decimal, country: str, year: int = 2020) -> Decimal:
     """[summary]
 
     Args:
         taxable_income (Decimal): [description]
         country (str): [description]
+        year (int): the year of the tax tariff
 
     Returns:
         Decimal: [description]
     """
     if country == "Germany":
-        return income_tax_germany(taxable_income)
+        return income_tax_germany(taxable_income, year=year)
+    else:
+        raise NotImplementedError(
+            f"income tax formula for {country} not yet implemented"
+        )
+
+
+def income_tax_vectorized(
+    taxable_income: ArrayLike,
+    country: str,
+    year: int = 2020,
+) -> numpy.ndarray:
+    """The income tax of an array of incomes, see income_tax."""
+    if country == "Germany":
+        return income_tax_germany_vectorized(taxable_income, year=year)
     else:
         raise NotImplementedError(
             f"income tax formula for {country} not yet implemented"
         )
 
 
-def income_tax_germany(taxable_income: Decimal) -> Decimal:
+@dataclass(frozen=True)
+class GermanIncomeTaxTariff:
+    """Constants of the German income tax tariff (§32a EStG) of a year.
+
+    The tariff has five zones, separated by the upper ends of the first four: no tax up
+    to the basic allowance, two zones of linearly rising tax rate, and two of a flat
+    rate of 42% and 45%.
+    """
+
+    basic_allowance: float
+    zone_2_end: float
+    zone_3_end: float
+    zone_4_end: float
+    zone_2_progression: float
+    zone_3_progression: float
+    zone_3_offset: float
+    zone_4_offset: float
+    zone_5_offset: float
+
+
+INCOME_TAX_TARIFFS_GERMANY: Dict[int, GermanIncomeTaxTariff] = {
+    2020: GermanIncomeTaxTariff(
+        basic_allowance=9408,
+        zone_2_end=14532,
+        zone_3_end=57051,
+        zone_4_end=270500,
+        zone_2_progression=972.87,
+        zone_3_progression=212.02,
+        zone_3_offset=972.79,
+        zone_4_offset=8963.74,
+        zone_5_offset=17078.74,
+    ),
+    2021: GermanIncomeTaxTariff(
+        basic_allowance=9744,
+        zone_2_end=14753,
+        zone_3_end=57918,
+        zone_4_end=274612,
+        zone_2_progression=995.21,
+        zone_3_progression=208.85,
+        zone_3_offset=950.96,
+        zone_4_offset=9136.63,
+        zone_5_offset=17374.99,
+    ),
+    2022: GermanIncomeTaxTariff(
+        basic_allowance=10347,
+        zone_2_end=14926,
+        zone_3_end=58596,
+        zone_4_end=277825,
+        zone_2_progression=1088.67,
+        zone_3_progression=206.43,
+        zone_3_offset=869.32,
+        zone_4_offset=9336.45,
+        zone_5_offset=17671.20,
+    ),
+    2023: GermanIncomeTaxTariff(
+        basic_allowance=10908,
+        zone_2_end=15999,
+        zone_3_end=62809,
+        zone_4_end=277825,
+        zone_2_progression=979.18,
+        zone_3_progression=192.59,
+        zone_3_offset=966.53,
+        zone_4_offset=9972.98,
+        zone_5_offset=18307.73,
+    ),
+}
+
+
+def _tariff_germany(year: int) -> GermanIncomeTaxTariff:
+    try:
+        return INCOME_TAX_TARIFFS_GERMANY[year]
+    except KeyError:
+        raise NotImplementedError(
+            f"income tax tariff for Germany in {year} not yet implemented"
+        )
+
+
+def income_tax_germany(taxable_income: Decimal, year: int = 2020) -> Decimal:
     """Income tax formula for Germany.
 
     Args:
         taxable_income (Decimal): [description]
+        year (int): the year of the tax tariff
 
     Returns:
         Decimal: [description]
     """
-    ti = taxable_income
-    if ti <= 9408:
+    t = _tariff_germany(year)
+    ti = float(taxable_income)
+    if ti <= t.basic_allowance:
         tax = 0
-    elif 9408 < ti <= 14532:
-        tax = (0.14 + (ti - 9408) * 972.87 * 1e-8) * (ti - 9408)
-    elif 14532 < ti <= 57051:
-        tax = (0.2397 + (ti - 14532) * 212.02 * 1e-8) * (ti - 14532) + 972.79
-    elif 57051 < ti <= 270500:
-        tax = (0.42 * ti) - 8963.74
+    elif t.basic_allowance < ti <= t.zone_2_end:
+        tax = (0.14 + (ti - t.basic_allowance) * t.zone_2_progression * 1e-8) * (
+            ti - t.basic_allowance
+        )
+    elif t.zone_2_end < ti <= t.zone_3_end:
+        tax = (0.2397 + (ti - t.zone_2_end) * t.zone_3_progression * 1e-8) * (
+            ti - t.zone_2_end
+        ) + t.zone_3_offset
+    elif t.zone_3_end < ti <= t.zone_4_end:
+        tax = (0.42 * ti) - t.zone_4_offset
     else:
-        tax = 0.45 * ti - 17078.74
+        tax = 0.45 * ti - t.zone_5_offset
     tax = round(tax)
     return tax
+
+
+def income_tax_germany_vectorized(
+    taxable_income: ArrayLike,
+    year: int = 2020,
+) -> numpy.ndarray:
+    """Income tax formula for Germany, evaluated over an array of incomes at once.
+
+    Gives the same results as income_tax_germany, element by element.
+
+    Args:
+        taxable_income (ArrayLike): taxable incomes
+        year (int): the year of the tax tariff
+
+    Returns:
+        numpy.ndarray: the income tax of each income, as integers
+    """
+    t = _tariff_germany(year)
+    ti = numpy.asarray(taxable_income, dtype="float64")
+    above_allowance = ti - t.basic_allowance
+    above_zone_2 = ti - t.zone_2_end
+    tax = numpy.select(
+        [
+            ti <= t.basic_allowance,
+            ti <= t.zone_2_end,
+            ti <= t.zone_3_end,
+            ti <= t.zone_4_end,
+        ],
+        [
+            0.0,
+            (0.14 + above_allowance * t.zone_2_progression * 1e-8) * above_allowance,
+            (0.2397 + above_zone_2 * t.zone_3_progression * 1e-8) * above_zone_2
+            + t.zone_3_offset,
+            (0.42 * ti) - t.zone_4_offset,
+        ],
+        default=0.45 * ti - t.zone_5_offset,
+    )
+    # rounds half to even, as round does
+    return numpy.rint(tax).astype("int64")
@@ -1,8 +1,9 @@
-from typing import Tuple, Union, Optional, List, Type
+from typing import Dict, Tuple, Union, Optional, List, Type
 
 import datetime
 from dataclasses import dataclass
 
+import numpy
 import pandas
 from pandas import DataFrame
 from pandera import check_io
@@ -10,11 +11,13 @@ from pandera.typing import DataFrame
 
 from tuttle.dev import deprecated
 
-from . import schema
+from . import schema, tracing
 from .calendar import Calendar, ICloudCalendar, ICSCalendar
 from .model import Project, Timesheet, TimeTrackingItem, User
+from .time import Cycle
 
 
+@tracing.traced()
 def generate_timesheet(
     timetracking_data: DataFrame,
     project: Project,
@@ -25,43 +28,68 @@ def generate_timesheet(
     item_description: str = None,
 ) -> Timesheet:
     """Create a timesheet from a dataframe of time tracking data."""
+    (ts,) = generate_timesheets(
+        timetracking_data,
+        project,
+        periods=[(period_start, period_end)],
+        date=date,
+        comment=comment,
+        item_description=item_description,
+    )
+    return ts
 
-    # convert period_start and period_end to strings that can be used as index for a DateTimeIndex
-    period_start = period_start.strftime("%Y-%m-%d")
-    period_end = period_end.strftime("%Y-%m-%d")
 
-    tag_query = f"tag == '{project.tag}'"
-    if period_end:
-        ts_table = (
-            timetracking_data.loc[period_start:period_end].query(tag_query).sort_index()
-        )
-        if ts_table.empty:
-            raise ValueError(
-                f"No time tracking data found for project {project.title} in period {period_start} - {period_end}"
-            )
-    else:
-        ts_table = timetracking_data.loc[period_start].query(tag_query).sort_index()
+@tracing.traced()
+def generate_timesheets(
+    timetracking_data: DataFrame,
+    project: Project,
+    periods: List[Tuple[datetime.date, datetime.date]],
+    date: datetime.date = datetime.date.today(),
+    comment: str = "",
+    item_description: str = None,
+) -> List[Timesheet]:
+    """Create one timesheet per period from a dataframe of time tracking data.
+
+    The entries of the project are selected once, each period is then cut from them by
+    a binary search on the sorted index. Periods without entries get no timesheet.
+    """
+    if not periods:
+        raise ValueError("No periods given")
+    first_day = min(start for start, _ in periods).strftime("%Y-%m-%d")
+    last_day = max(end for _, end in periods).strftime("%Y-%m-%d")
+    project_data = timetracking_data.sort_index().loc[first_day:last_day]
+    project_data = project_data[project_data["tag"] == project.tag].copy()
     # convert all-day entries
-    ts_table.loc[ts_table["all_day"], "duration"] = (
+    project_data.loc[project_data["all_day"], "duration"] = (
         project.contract.unit.to_timedelta() * project.contract.units_per_workday
     )
     if item_description:
         # TODO: extract item description from calendar
-        ts_table["description"] = item_description
-
-    period_str = f"{period_start} - {period_end}"
-    ts = Timesheet(
-        title=f"{project.title} - {period_str}",
-        period_start=period_start,
-        period_end=period_end,
-        project=project,
-        comment=comment,
-        date=date,
-    )
-    for record in ts_table.reset_index().to_dict("records"):
-        ts.items.append(TimeTrackingItem(**record))
+        project_data["description"] = item_description
 
-    return ts
+    timesheets = []
+    for period_start, period_end in periods:
+        # convert period_start and period_end to strings that can be used as index for a DateTimeIndex
+        start, end = period_start.strftime("%Y-%m-%d"), period_end.strftime("%Y-%m-%d")
+        ts_table = project_data.loc[start:end]
+        if ts_table.empty:
+            continue
+        ts = Timesheet(
+            title=f"{project.title} - {start} - {end}",
+            period_start=period_start,
+            period_end=period_end,
+            project=project,
+            comment=comment,
+            date=date,
+        )
+        for record in ts_table.reset_index().to_dict("records"):
+            ts.items.append(TimeTrackingItem(**record))
+        timesheets.append(ts)
+    if not timesheets:
+        raise ValueError(
+            f"No time tracking data found for project {project.title} in period {first_day} - {last_day}"
+        )
+    return timesheets
 
 
 def export_timesheet(
@@ -78,6 +106,7 @@ def export_timesheet(
 # IMPORT
 
 
+@tracing.traced(category="import")
 @check_io(out=schema.time_tracking)
 def import_from_calendar(cal: Calendar) -> DataFrame:
     """Convert the raw calendar to time tracking data table."""
@@ -116,6 +145,7 @@ def infer_spreadsheet_preset(data: DataFrame) -> Type[TimetrackingSpreadsheetPre
     raise NotImplementedError("TODO")
 
 
+@tracing.traced(category="import")
 @check_io(
     out=schema.time_tracking,
 )
@@ -194,17 +224,291 @@ def import_from_spreadsheet(
     return timetracking_data
 
 
+# MEMORY
+
+# columns of repeated strings, stored as categoricals by compact
+COMPACT_CATEGORICAL_COLUMNS = ("tag", "title", "description")
+
+
+def _as_datetime(values) -> Union[pandas.Series, pandas.DatetimeIndex]:
+    """Values as datetime64[ns], i.e. int64 nanoseconds, instead of Python objects"""
+    if pandas.api.types.is_datetime64_any_dtype(values):
+        return values
+    try:
+        converted = pandas.to_datetime(values)
+    except ValueError:
+        # mixed time zones
+        converted = pandas.to_datetime(values, utc=True)
+    if isinstance(values, pandas.Series):
+        return pandas.Series(converted, index=values.index, name=values.name)
+    return pandas.DatetimeIndex(converted, name=values.name)
+
+
+@tracing.traced()
+def compact(
+    time_tracking_data: DataFrame,
+    description: bool = True,
+) -> DataFrame:
+    """Time tracking data in a compact in-memory representation.
+
+    Tags, titles and descriptions repeat a lot, they become categoricals that store each
+    distinct string once. Begin, end and duration are stored as int64 nanoseconds
+    (datetime64 and timedelta64) rather than as Python objects. The result passes
+    schema.time_tracking and works with all functions of this module.
+
+    Args:
+        time_tracking_data: the time tracking data, unchanged
+        description: False to leave out the descriptions, which analyses do not need.
+            The column is kept, but empty. The descriptions are not loaded lazily
+            afterwards, they are gone until the data is imported again.
+    """
+    data = time_tracking_data.copy(deep=False)
+    if not description and "description" in data.columns:
+        data["description"] = None
+    for column in COMPACT_CATEGORICAL_COLUMNS:
+        if column in data.columns:
+            data[column] = data[column].astype("category")
+    if "end" in data.columns:
+        data["end"] = _as_datetime(data["end"])
+    if "duration" in data.columns:
+        data["duration"] = pandas.to_timedelta(data["duration"])
+    if "all_day" in data.columns and not data["all_day"].hasnans:
+        data["all_day"] = data["all_day"].astype(bool)
+    data.index = _as_datetime(data.index)
+    return data
+
+
+def memory_report(
+    time_tracking_data: DataFrame,
+    compacted: Optional[DataFrame] = None,
+) -> pandas.DataFrame:
+    """Bytes of memory used per column before and after compacting the data"""
+    if compacted is None:
+        compacted = compact(time_tracking_data)
+    report = pandas.DataFrame(
+        {
+            "before": time_tracking_data.memory_usage(deep=True),
+            "after": compacted.memory_usage(deep=True),
+        }
+    )
+    report.loc["total"] = report.sum()
+    report["ratio"] = report["after"] / report["before"]
+    return report
+
+
 # ANALYSIS
 
 
-def total_time_tracked(by: str) -> DataFrame:
-    """Calculate the total time spent, grouped by project, client..."""
-    if by == "project":
-        raise NotImplementedError()
-    elif by == "client":
-        raise NotImplementedError()
-    else:
-        raise ValueError()
+ROLLUP_DIMENSIONS = ("tag", "project", "client", "contract")
+
+# pandas period frequencies of the billing cycles
+CYCLE_FREQUENCIES = {
+    Cycle.hourly: "H",
+    Cycle.daily: "D",
+    Cycle.weekly: "W",
+    Cycle.monthly: "M",
+    Cycle.quarterly: "Q",
+    Cycle.yearly: "A",
+}
+
+
+def billing_terms(projects: List[Project]) -> pandas.DataFrame:
+    """Project, client, contract and billing terms of the projects, indexed by tag"""
+    records = [
+        {
+            "tag": project.tag,
+            "project": project.title,
+            "client": project.client.name if project.client else None,
+            "contract": project.contract.title,
+            "rate": float(project.contract.rate),
+            "volume": project.contract.volume,
+            "unit": project.contract.unit.to_timedelta(),
+            "workday": project.contract.unit.to_timedelta()
+            * project.contract.units_per_workday,
+        }
+        for project in projects
+        if project.contract is not None
+    ]
+    return (
+        pandas.DataFrame(
+            records,
+            columns=[
+                "tag",
+                "project",
+                "client",
+                "contract",
+                "rate",
+                "volume",
+                "unit",
+                "workday",
+            ],
+        )
+        .astype(
+            {
+                "rate": float,
+                "volume": float,
+                "unit": "timedelta64[ns]",
+                "workday": "timedelta64[ns]",
+            }
+        )
+        .drop_duplicates("tag")
+        .set_index("tag")
+    )
+
+
+def tracked_durations(
+    time_tracking_data: DataFrame,
+    terms: pandas.DataFrame,
+) -> pandas.Series:
+    """Durations of the entries, all-day entries counting as a workday of the contract, as on timesheets"""
+    duration = time_tracking_data["duration"]
+    if "all_day" not in time_tracking_data.columns:
+        return duration
+    workday = time_tracking_data["tag"].map(terms["workday"])
+    all_day = time_tracking_data["all_day"].fillna(False).astype(bool) & workday.notna()
+    return duration.mask(all_day, workday)
+
+
+class TimeTrackingRollups:
+    """Aggregates time tracking data by tag, project, client or contract per cycle.
+
+    The raw data is grouped by tag and day only once, coarser cycles and the other
+    dimensions re-aggregate this much smaller daily table. Every rollup is cached, so
+    an instance must be replaced when the time tracking data or the projects change.
+    """
+
+    def __init__(
+        self,
+        time_tracking_data: DataFrame,
+        projects: List[Project],
+    ):
+        self.time_tracking_data = time_tracking_data
+        self.projects = projects
+        self._tags: Optional[pandas.DataFrame] = None
+        self._durations: Dict[Optional[Cycle], pandas.DataFrame] = {}
+        self._rollups: Dict[Tuple[str, Optional[Cycle]], pandas.DataFrame] = {}
+
+    @property
+    def tags(self) -> pandas.DataFrame:
+        """Project, client, contract and billing terms of each project tag"""
+        if self._tags is None:
+            self._tags = billing_terms(self.projects)
+        return self._tags
+
+    def _group_by_tag(self, frequency: str) -> pandas.DataFrame:
+        """Total duration per tag and period of the raw data"""
+        data = self.time_tracking_data
+        duration = tracked_durations(data, self.tags)
+        begin = pandas.DatetimeIndex(data.index)
+        if begin.tz is not None:
+            # periods follow the local time of the entries
+            begin = begin.tz_localize(None)
+        grouped = pandas.DataFrame(
+            {
+                "tag": data["tag"].to_numpy(),
+                "period": begin.to_period(frequency),
+                "duration": pandas.to_timedelta(duration.to_numpy()),
+            }
+        )
+        return grouped.groupby(["tag", "period"], sort=True, as_index=False)[
+            "duration"
+        ].sum()
+
+    def _durations_by_tag(self, cycle: Optional[Cycle]) -> pandas.DataFrame:
+        """Total duration per tag and period, re-aggregated from the daily totals"""
+        if cycle not in self._durations:
+            if cycle == Cycle.hourly:
+                durations = self._group_by_tag(CYCLE_FREQUENCIES[Cycle.hourly])
+            elif cycle == Cycle.daily:
+                durations = self._group_by_tag(CYCLE_FREQUENCIES[Cycle.daily])
+            else:
+                daily = self._durations_by_tag(Cycle.daily)
+                if cycle is None:
+                    durations = daily.groupby("tag", sort=True, as_index=False)[
+                        "duration"
+                    ].sum()
+                else:
+                    durations = (
+                        daily.assign(
+                            period=daily["period"].dt.asfreq(CYCLE_FREQUENCIES[cycle])
+                        )
+                        .groupby(["tag", "period"], sort=True, as_index=False)[
+                            "duration"
+                        ]
+                        .sum()
+                    )
+            self._durations[cycle] = durations
+        return self._durations[cycle]
+
+    @tracing.traced()
+    def rollup(
+        self,
+        by: str = "tag",
+        cycle: Optional[Cycle] = Cycle.daily,
+    ) -> pandas.DataFrame:
+        """Total duration and billable amount per tag, project, client or contract.
+
+        Args:
+            by: one of ROLLUP_DIMENSIONS
+            cycle: length of the periods to total over, or None for a total over all time
+
+        Returns:
+            DataFrame with the columns duration and billable_amount, indexed by the
+            dimension and, unless cycle is None, the period. Tags without a project
+            only show up in the tag dimension, without a billable amount.
+        """
+        if by not in ROLLUP_DIMENSIONS:
+            raise ValueError(
+                f"cannot group time tracking data by {by}, choose one of {ROLLUP_DIMENSIONS}"
+            )
+        key = (by, cycle)
+        if key not in self._rollups:
+            durations = self._durations_by_tag(cycle)
+            terms = self.tags.reindex(durations["tag"])
+            units = durations["duration"].to_numpy() / terms["unit"].to_numpy()
+            rolled_up = durations.assign(
+                billable_amount=units.astype(float) * terms["rate"].to_numpy()
+            )
+            if by != "tag":
+                rolled_up[by] = terms[by].to_numpy()
+                rolled_up = rolled_up.dropna(subset=[by])
+            index = [by] if cycle is None else [by, "period"]
+            grouped = rolled_up.groupby(index, sort=True)
+            self._rollups[key] = pandas.DataFrame(
+                {
+                    "duration": grouped["duration"].sum(),
+                    "billable_amount": grouped["billable_amount"].sum(min_count=1),
+                }
+            )
+        return self._rollups[key]
+
+    def periods_with_entries(
+        self,
+        tag: str,
+        periods: List[Tuple[datetime.date, datetime.date]],
+    ) -> List[Tuple[datetime.date, datetime.date]]:
+        """The periods that contain entries of the tag, cut as in generate_timesheets
+
+        Looks up the days with entries in the daily totals instead of the raw data.
+        """
+        daily = self._durations_by_tag(Cycle.daily)
+        days = daily.loc[daily["tag"] == tag, "period"].dt.start_time.to_numpy()
+        return [
+            (period_start, period_end)
+            for period_start, period_end in periods
+            if days.searchsorted(numpy.datetime64(period_end), side="right")
+            > days.searchsorted(numpy.datetime64(period_start))
+        ]
+
+
+def total_time_tracked(
+    time_tracking_data: DataFrame,
+    projects: List[Project],
+    by: str = "project",
+) -> DataFrame:
+    """Calculate the total time spent, grouped by tag, project, client or contract."""
+    rollups = TimeTrackingRollups(time_tracking_data, projects)
+    return rollups.rollup(by=by, cycle=None)
 
 
 @check_io(
@@ -214,16 +518,54 @@ def progress(
     project: Project,
     time_tracking_data: DataFrame,
 ):
-    tag = project.tag
-    total_time = (
-        time_tracking_data.filter(["tag", "duration"])
-        .query(f"tag == @tag")
-        .groupby("tag")
-        .sum()
+    """Share of the contract volume of the project that has been tracked"""
+    return progress_all([project], time_tracking_data).loc[project.tag, "progress"]
+
+
+@tracing.traced()
+def progress_all(
+    projects: List[Project],
+    time_tracking_data: DataFrame,
+) -> pandas.DataFrame:
+    """Progress of all projects towards their contract volume in a single pass over the data
+
+    Returns:
+        DataFrame indexed by project tag with the columns time_tracked, units_tracked
+        in the unit of the contract, volume and progress, the share of the volume
+        that has been tracked. Projects without a volume have no progress.
+    """
+    terms = billing_terms(projects)
+    if "all_day" in time_tracking_data.columns:
+        all_day = time_tracking_data["all_day"].fillna(False).astype(bool)
+    else:
+        all_day = pandas.Series(False, index=time_tracking_data.index)
+    totals = (
+        pandas.DataFrame(
+            {
+                "duration": time_tracking_data["duration"]
+                .mask(all_day, pandas.Timedelta(0))
+                .to_numpy(),
+                "all_day": all_day.to_numpy(),
+            }
+        )
+        .groupby(time_tracking_data["tag"].to_numpy())
+        .agg({"duration": "sum", "all_day": "sum"})
+        .reindex(terms.index, fill_value=0)
+    )
+    # all-day entries count as a workday of the contract, as on timesheets
+    time_tracked = (
+        pandas.to_timedelta(totals["duration"]) + totals["all_day"] * terms["workday"]
+    )
+    units_tracked = (time_tracked / terms["unit"]).astype(float)
+    volume = terms["volume"]
+    return pandas.DataFrame(
+        {
+            "time_tracked": time_tracked,
+            "units_tracked": units_tracked,
+            "volume": volume,
+            "progress": units_tracked / volume.where(volume > 0),
+        }
     )
-    # TODO: work with project.unit
-    budget = project.contract.volume * datetime.timedelta(hours=1)
-    return total_time.loc[tag]["duration"] / budget
 
 
 @check_io(
@@ -244,3 +586,33 @@ def get_time_planning_data(
         schema.time_tracking.validate(planning_data)
     planning_data = planning_data[str(from_date) :]
     return planning_data
+
+
+def planned_revenue(
+    planning_data: DataFrame,
+    projects: List[Project],
+) -> pandas.Series:
+    """Revenue of each planned entry at the rate of its project's contract
+
+    All-day entries count as a workday of the contract. Entries whose tag belongs to
+    none of the projects have no revenue.
+    """
+    terms = billing_terms(projects)
+    duration = tracked_durations(planning_data, terms)
+    hour = pandas.Timedelta(hours=1)
+    # hourly rate of each tag, looked up by position, the last one for unknown tags
+    hourly_rates = numpy.append(
+        (terms["rate"] / (terms["unit"] / hour)).to_numpy(), numpy.nan
+    )
+    positions = terms.index.get_indexer(planning_data["tag"])
+    revenue = (duration / hour).to_numpy() * hourly_rates[positions]
+    return pandas.Series(revenue, index=planning_data.index, name="revenue")
+
+
+@tracing.traced()
+def evaluate_time_planning(
+    planning_data: DataFrame,
+    projects: List[Project],
+) -> DataFrame:
+    """The planning data with the revenue of each entry, see planned_revenue"""
+    return planning_data.assign(revenue=planned_revenue(planning_data, projects))
@@ -0,0 +1,268 @@
+"""Performance tracing.
+
+Records spans, i.e. timed sections of code that nest into parent/child relations per
+thread, and exports them as a Chrome trace (open in chrome://tracing or ui.perfetto.dev)
+or as a summary report. Spans may carry counters, such as the number of SQL statements
+executed while they were open.
+
+Tracing is disabled by default, in which case spans cost a single flag check. Enable it
+by setting the environment variable TUTTLE_TRACE, either to 1 to write the trace to
+tuttle-trace.json in the working directory on exit, or to the path of the trace file,
+or at runtime with enable(). The values 0, false, no and off leave it disabled. Other modules can follow the state, see add_toggle_listener.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import atexit
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+
+@dataclass
+class Span:
+    """A timed section of code"""
+
+    id: int
+    name: str
+    category: str
+    parent_id: Optional[int]
+    thread_id: int
+    start: float
+    duration: float = 0.0
+    args: Dict[str, Any] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+
+_enabled = False
+_toggle_listeners: List[Callable[[bool], None]] = []
+_spans: List[Span] = []
+_lock = threading.Lock()
+_local = threading.local()
+_span_ids = itertools.count(1)
+_origin = time.perf_counter()
+
+
+def _open_spans() -> List[Span]:
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+class _NullSpan:
+    """Stands in for a span while tracing is disabled"""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _SpanContext:
+    def __init__(self, name: str, category: str, args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.span: Optional[Span] = None
+
+    def __enter__(self) -> Span:
+        stack = _open_spans()
+        self.span = Span(
+            id=next(_span_ids),
+            name=self.name,
+            category=self.category,
+            parent_id=stack[-1].id if stack else None,
+            thread_id=threading.get_ident(),
+            start=time.perf_counter(),
+            args=self.args,
+        )
+        stack.append(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.span.duration = time.perf_counter() - self.span.start
+        if exc_type is not None:
+            self.span.args["error"] = exc_type.__name__
+        stack = _open_spans()
+        if stack and stack[-1] is self.span:
+            stack.pop()
+        with _lock:
+            _spans.append(self.span)
+        return False
+
+
+def span(name: str, category: str = "tuttle", **args):
+    """Returns a context manager that records the enclosed code as a span
+
+    Usage:
+        with tracing.span("render", category="rendering", format="pdf"):
+            ...
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _SpanContext(name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = "tuttle"):
+    """Decorator that records each call of the function as a span, named after the function by default"""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _SpanContext(span_name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(counter: str, amount: int = 1):
+    """Adds to a counter of all spans currently open in this thread"""
+    if not _enabled:
+        return
+    for open_span in _open_spans():
+        open_span.counters[counter] = open_span.counters.get(counter, 0) + amount
+
+
+def enable():
+    global _enabled
+    _enabled = True
+    _notify_toggle_listeners()
+
+
+def disable():
+    global _enabled
+    _enabled = False
+    _notify_toggle_listeners()
+
+
+def add_toggle_listener(listener: Callable[[bool], None]):
+    """Registers a callback, called with the new state whenever tracing is enabled or disabled"""
+    _toggle_listeners.append(listener)
+
+
+def _notify_toggle_listeners():
+    for listener in list(_toggle_listeners):
+        listener(_enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """Discards all recorded spans"""
+    with _lock:
+        _spans.clear()
+
+
+def get_spans() -> List[Span]:
+    """Returns the recorded spans in the order they ended"""
+    with _lock:
+        return list(_spans)
+
+
+def to_chrome_trace() -> Dict:
+    """Converts the recorded spans to the Chrome trace event format"""
+    pid = os.getpid()
+    events = [
+        {
+            "name": s.name,
+            "cat": s.category,
+            "ph": "X",
+            "ts": (s.start - _origin) * 1e6,
+            "dur": s.duration * 1e6,
+            "pid": pid,
+            "tid": s.thread_id,
+            "args": {
+                **s.args,
+                **s.counters,
+                "span_id": s.id,
+                "parent_id": s.parent_id,
+            },
+        }
+        for s in get_spans()
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path: Union[str, Path]) -> Path:
+    """Writes the recorded spans to a Chrome trace JSON file"""
+    path = Path(path)
+    with open(path, "w") as trace_file:
+        json.dump(to_chrome_trace(), trace_file, default=str)
+    logger.info(f"wrote {len(_spans)} spans to {path}")
+    return path
+
+
+def summary_report() -> str:
+    """Summarizes the recorded spans by name, most expensive first
+
+    Self time is the time spent in a span outside of its child spans.
+    """
+    spans = get_spans()
+    child_time = defaultdict(float)
+    for s in spans:
+        if s.parent_id is not None:
+            child_time[s.parent_id] += s.duration
+    rows = {}
+    for s in spans:
+        row = rows.setdefault(
+            s.name,
+            {"calls": 0, "total": 0.0, "self": 0.0, "max": 0.0, "counters": {}},
+        )
+        row["calls"] += 1
+        row["total"] += s.duration
+        row["self"] += s.duration - child_time[s.id]
+        row["max"] = max(row["max"], s.duration)
+        for counter, value in s.counters.items():
+            row["counters"][counter] = row["counters"].get(counter, 0) + value
+    lines = [
+        f"{'span':<60} {'calls':>6} {'total ms':>10} {'self ms':>10} {'max ms':>9}  counters"
+    ]
+    for name, row in sorted(rows.items(), key=lambda item: -item[1]["total"]):
+        counters = ", ".join(f"{k}={v}" for k, v in sorted(row["counters"].items()))
+        lines.append(
+            f"{name:<60} {row['calls']:>6} {row['total'] * 1000:>10.1f} "
+            f"{row['self'] * 1000:>10.1f} {row['max'] * 1000:>9.1f}  {counters}"
+        )
+    return "\n".join(lines)
+
+
+def _export_on_exit(path: Path):
+    if _spans:
+        export_chrome_trace(path)
+        logger.info(f"trace summary:\n{summary_report()}")
+
+
+def _trace_path(setting: str) -> Optional[Path]:
+    """The trace file of a TUTTLE_TRACE setting, or None if it leaves tracing disabled"""
+    setting = setting.strip()
+    if setting.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if setting.lower() in ("1", "true", "yes", "on"):
+        return Path("tuttle-trace.json")
+    return Path(setting)
+
+
+_trace_file = _trace_path(os.environ.get("TUTTLE_TRACE", ""))
+if _trace_file is not None:
+    enable()
+    atexit.register(_export_on_exit, _trace_file)
@@ -0,0 +1 @@
+"""Benchmarks of the tuttle core pipeline."""
@@ -0,0 +1,61 @@
+"""Benchmark fixtures.
+
+Store a baseline with `make benchmark-baseline`, after which `make benchmark` fails for
+every benchmark whose median time regressed by more than BENCHMARK_THRESHOLD. The data
+sizes are set with the option --bench-sizes, a comma separated list of the number of
+events or items, e.g. `make benchmark BENCHMARK_ARGS=--bench-sizes=1000,100000,1000000`.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from . import synthetic
+
+pytest.importorskip("pytest_benchmark")
+
+DEFAULT_SIZES = "1000,10000"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-sizes",
+        action="store",
+        default=DEFAULT_SIZES,
+        help="comma separated numbers of events/items to run the benchmarks with",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = [
+            int(size) for size in metafunc.config.getoption("--bench-sizes").split(",")
+        ]
+        metafunc.parametrize("size", sizes, ids=[f"n={size}" for size in sizes])
+
+
+@pytest.fixture(scope="session")
+def projects():
+    return synthetic.create_projects()
+
+
+@pytest.fixture(scope="session")
+def project(projects):
+    return projects[0]
+
+
+@pytest.fixture(scope="session")
+def user():
+    return synthetic.create_user()
+
+
+@pytest.fixture
+def app_home(tmp_path, monkeypatch):
+    """Points the app to a fresh database in a temporary home directory"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    app_dir = str(Path(__file__).parent.parent / "app")
+    if app_dir not in sys.path:
+        monkeypatch.syspath_prepend(app_dir)
+    (tmp_path / ".tuttle").mkdir()
+    return tmp_path
@@ -0,0 +1,205 @@
+"""Synthetic data of arbitrary size for the benchmarks.
+
+The fakers of tuttle.demo create a handful of entities with realistic content. The
+generators here build on them, but scale the bulk data - calendar events, spreadsheet
+rows, timesheet and invoice items - to any size, using a fixed seed so that every
+benchmark run works on the same data.
+"""
+
+from typing import List
+
+import datetime
+import random
+from decimal import Decimal
+
+import faker
+import numpy
+import pandas
+
+from tuttle import demo
+from tuttle.model import (
+    Invoice,
+    InvoiceItem,
+    Project,
+    Timesheet,
+    TimeTrackingItem,
+    User,
+)
+
+SEED = 42
+
+# all generated time tracking data falls into this period
+PERIOD_START = datetime.date(2022, 1, 1)
+PERIOD_END = datetime.date(2022, 12, 31)
+
+
+def create_faker() -> faker.Faker:
+    fake = faker.Faker(locale="en_US")
+    fake.seed_instance(SEED)
+    random.seed(SEED)
+    numpy.random.seed(SEED)
+    return fake
+
+
+def create_projects(n_projects: int = 10) -> List[Project]:
+    """Fake projects with unique tags"""
+    fake = create_faker()
+    projects = [demo.create_fake_project(fake) for _ in range(n_projects)]
+    for i, project in enumerate(projects):
+        project.tag = f"#project-{i}"
+    return projects
+
+
+def create_user() -> User:
+    return demo.create_demo_user()
+
+
+def _random_events(n_events: int, tags: List[str]) -> pandas.DataFrame:
+    """Begin, end and tag of n events of 1 to 8 hours at the full hour within the period"""
+    rng = numpy.random.default_rng(SEED)
+    n_days = (PERIOD_END - PERIOD_START).days + 1
+    days = rng.integers(0, n_days, n_events)
+    start_hours = rng.integers(6, 16, n_events)
+    durations = pandas.to_timedelta(rng.integers(1, 9, n_events), unit="h")
+    begin = (
+        pandas.Timestamp(PERIOD_START, tz="UTC")
+        + pandas.to_timedelta(days, unit="D")
+        + pandas.to_timedelta(start_hours, unit="h")
+    )
+    return pandas.DataFrame(
+        {
+            "begin": begin,
+            "end": begin + durations,
+            "duration": durations,
+            "tag": numpy.array(tags)[rng.integers(0, len(tags), n_events)],
+        }
+    )
+
+
+def create_ics_content(
+    n_events: int,
+    projects: List[Project],
+) -> bytes:
+    """An .ics file with n events tagged with the projects' tags"""
+    events = _random_events(n_events, [project.tag for project in projects])
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//tuttle//benchmarks//EN"]
+    ics_format = "%Y%m%dT%H%M%SZ"
+    for i, (begin, end, tag) in enumerate(
+        zip(
+            events["begin"].dt.strftime(ics_format),
+            events["end"].dt.strftime(ics_format),
+            events["tag"],
+        )
+    ):
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{i}@tuttle.benchmarks",
+            f"DTSTAMP:{begin}",
+            f"DTSTART:{begin}",
+            f"DTEND:{end}",
+            f"SUMMARY:Work on {tag}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(lines) + "\r\n").encode("utf-8")
+
+
+def create_toggl_csv(
+    path,
+    n_rows: int,
+    projects: List[Project],
+):
+    """A time tracking spreadsheet in the export format of Toggl with n rows"""
+    events = _random_events(n_rows, [project.tag for project in projects])
+    begin = events["begin"].dt.tz_localize(None)
+    end = events["end"].dt.tz_localize(None)
+    duration_seconds = events["duration"].dt.total_seconds().astype(int)
+    spreadsheet = pandas.DataFrame(
+        {
+            "User": "Harry Tuttle",
+            "Email": "mail@tuttle.com",
+            "Client": "Central Services",
+            "Project": events["tag"],
+            "Task": "Development",
+            "Description": "Work on " + events["tag"],
+            "Billable": "Yes",
+            "Start date": begin.dt.strftime("%Y-%m-%d"),
+            "Start time": begin.dt.strftime("%H:%M:%S"),
+            "End date": end.dt.strftime("%Y-%m-%d"),
+            "End time": end.dt.strftime("%H:%M:%S"),
+            "Duration": [
+                f"{s // 3600:02}:{s % 3600 // 60:02}:{s % 60:02}"
+                for s in duration_seconds
+            ],
+            "Tags": "",
+        }
+    )
+    spreadsheet.to_csv(path, index=False)
+
+
+def create_time_tracking_data(
+    n_events: int,
+    projects: List[Project],
+) -> pandas.DataFrame:
+    """Time tracking data with n events as returned by the calendar import"""
+    events = _random_events(n_events, [project.tag for project in projects])
+    data = pandas.DataFrame(
+        {
+            "title": "Work on " + events["tag"],
+            "description": "",
+            "begin": events["begin"].dt.tz_convert("CET"),
+            "end": events["end"].dt.tz_convert("CET"),
+            "all_day": False,
+            "duration": events["duration"],
+            "tag": events["tag"],
+        }
+    )
+    return data.set_index("begin").sort_index()
+
+
+def create_timesheets(
+    n_items: int,
+    project: Project,
+    items_per_timesheet: int = 100,
+) -> List[Timesheet]:
+    """Timesheets of the project with n time tracking items in total"""
+    data = create_time_tracking_data(n_items, [project]).reset_index()
+    records = data.to_dict("records")
+    timesheets = []
+    for i in range(0, n_items, items_per_timesheet):
+        timesheet = Timesheet(
+            title=f"{project.title} - {i // items_per_timesheet}",
+            period_start=PERIOD_START,
+            period_end=PERIOD_END,
+            project=project,
+        )
+        for record in records[i : i + items_per_timesheet]:
+            timesheet.items.append(TimeTrackingItem(**record))
+        timesheets.append(timesheet)
+    return timesheets
+
+
+def create_invoice(
+    n_items: int,
+    project: Project,
+) -> Invoice:
+    """An invoice of the project with n items"""
+    invoice = Invoice(
+        number=f"{PERIOD_END.isoformat()}-{n_items}",
+        date=PERIOD_END,
+        contract=project.contract,
+        project=project,
+    )
+    for i in range(n_items):
+        day = PERIOD_START + datetime.timedelta(days=i % 365)
+        InvoiceItem(
+            invoice=invoice,
+            start_date=day,
+            end_date=day,
+            quantity=1 + i % 8,
+            unit="hour",
+            unit_price=Decimal(project.contract.rate),
+            VAT_rate=project.contract.VAT_rate,
+            description=f"Work on {project.tag}, item {i}",
+        )
+    return invoice
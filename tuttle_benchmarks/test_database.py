@@ -0,0 +1,74 @@
+"""Benchmarks of storing and querying entities through the data sources of the app."""
+
+import pytest
+
+import sqlmodel
+
+from tuttle.model import TimeTrackingItem
+
+from . import synthetic
+
+
+@pytest.fixture
+def data_source(app_home):
+    from core.abstractions import EntityCache, SQLModelDataSourceMixin
+
+    EntityCache().clear()
+    data_source = SQLModelDataSourceMixin()
+    sqlmodel.SQLModel.metadata.create_all(data_source.db_engine)
+    yield data_source
+    EntityCache().clear()
+
+
+def create_items(size, projects):
+    data = synthetic.create_time_tracking_data(size, projects).reset_index()
+    return [TimeTrackingItem(**record) for record in data.to_dict("records")]
+
+
+def test_store(benchmark, size, projects, data_source):
+    """Stores size time tracking items in one unit of work"""
+
+    def store_all(items):
+        with data_source.unit_of_work():
+            for item in items:
+                data_source.store(item)
+
+    benchmark.pedantic(
+        store_all,
+        setup=lambda: ((create_items(size, projects),), {}),
+        rounds=3,
+    )
+
+
+def test_query(benchmark, size, projects, data_source):
+    """Queries size time tracking items, bypassing the entity cache"""
+    with data_source.unit_of_work():
+        for item in create_items(size, projects):
+            data_source.store(item)
+
+    items = benchmark.pedantic(
+        data_source.query,
+        args=(TimeTrackingItem,),
+        setup=data_source.entity_cache.clear,
+        rounds=5,
+    )
+    assert len(items) == size
+
+
+def test_query_page(benchmark, size, projects, data_source):
+    """Queries a page from the middle of size time tracking items ordered by begin"""
+    with data_source.unit_of_work():
+        for item in create_items(size, projects):
+            data_source.store(item)
+    items = sorted(
+        data_source.query(TimeTrackingItem), key=lambda item: (item.begin, item.id)
+    )
+    middle = items[size // 2]
+
+    page = benchmark(
+        data_source.query_page,
+        TimeTrackingItem,
+        after=(middle.begin, middle.id),
+        order_by="begin",
+    )
+    assert page.entities[0] is not None
@@ -0,0 +1,23 @@
+"""Benchmarks of the income forecast, recomputed interactively over many scenarios."""
+
+from tuttle import forecasting
+
+from . import synthetic
+
+
+def test_monthly_planned_revenue(benchmark, size, projects):
+    data = synthetic.create_time_tracking_data(size, projects)
+
+    monthly = benchmark(forecasting.monthly_planned_revenue, data, projects)
+    assert len(monthly.columns) <= len(projects)
+
+
+def test_forecast_income(benchmark, size, projects):
+    data = synthetic.create_time_tracking_data(1000, projects)
+    monthly = forecasting.monthly_planned_revenue(data, projects)
+
+    def forecast():
+        return forecasting.forecast_income(monthly, n_scenarios=size, seed=42)
+
+    quantiles = benchmark(lambda: forecast().quantiles())
+    assert len(quantiles) == len(monthly)
@@ -0,0 +1,29 @@
+"""Benchmarks of importing time tracking data."""
+
+from tuttle import timetracking
+from tuttle.calendar import ICSCalendar
+
+from . import synthetic
+
+
+def test_ics_import(benchmark, size, projects):
+    content = synthetic.create_ics_content(size, projects)
+
+    def import_ics():
+        calendar = ICSCalendar(name="Benchmark", content=content)
+        return timetracking.import_from_calendar(calendar)
+
+    data = benchmark(import_ics)
+    assert len(data) == size
+
+
+def test_spreadsheet_import(benchmark, size, projects, tmp_path):
+    path = tmp_path / "toggl.csv"
+    synthetic.create_toggl_csv(path, size, projects)
+
+    data = benchmark(
+        timetracking.import_from_spreadsheet,
+        path,
+        preset=timetracking.TogglPreset,
+    )
+    assert len(data) == size
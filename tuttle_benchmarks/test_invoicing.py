@@ -0,0 +1,48 @@
+"""Benchmarks of invoice generation and rendering."""
+
+import pytest
+
+from tuttle import invoicing, rendering
+
+from . import synthetic
+
+
+def test_generate_invoice(benchmark, size, project):
+    """Generates an invoice from timesheets with size time tracking items in total"""
+    timesheets = synthetic.create_timesheets(size, project)
+
+    invoice = benchmark(
+        invoicing.generate_invoice,
+        timesheets,
+        contract=project.contract,
+        project=project,
+        number="2022-12-31-1",
+        date=synthetic.PERIOD_END,
+    )
+    assert len(invoice.items) == len(timesheets)
+
+
+def test_render_invoice_html(benchmark, size, project, user):
+    """Renders an invoice with one item per 10 time tracking items"""
+    invoice = synthetic.create_invoice(max(1, size // 10), project)
+
+    html = benchmark(rendering.render_invoice, user, invoice, out_dir=None)
+    assert invoice.number in html
+
+
+def test_render_invoice_pdf(benchmark, size, project, user, tmp_path):
+    """Renders an invoice with one item per 10 time tracking items to PDF"""
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError) as ex:
+        pytest.skip(f"PDF rendering is not available: {ex}")
+    invoice = synthetic.create_invoice(max(1, size // 10), project)
+
+    benchmark(
+        rendering.render_invoice,
+        user,
+        invoice,
+        out_dir=tmp_path,
+        only_final=True,
+    )
+    assert (tmp_path / f"{invoice.prefix}.pdf").exists()
@@ -0,0 +1,74 @@
+"""Benchmarks of converting model items to DataFrames and packing them."""
+
+import pandas
+import pytest
+
+from tuttle import model
+
+from . import synthetic
+
+
+def to_dataframe_by_records(items):
+    """The conversion record by record via item.dict(), for comparison"""
+    return pandas.DataFrame.from_records([item.dict() for item in items])
+
+
+@pytest.fixture
+def time_tracking_items(size, project):
+    (timesheet,) = synthetic.create_timesheets(size, project, items_per_timesheet=size)
+    return list(timesheet.items)
+
+
+@pytest.fixture
+def invoice_items(size, project):
+    return list(synthetic.create_invoice(size, project).items)
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [model.to_dataframe, to_dataframe_by_records],
+    ids=["columns", "records"],
+)
+def test_time_tracking_items_to_dataframe(benchmark, time_tracking_items, convert):
+    table = benchmark(convert, time_tracking_items)
+    assert len(table) == len(time_tracking_items)
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [model.to_dataframe, to_dataframe_by_records],
+    ids=["columns", "records"],
+)
+def test_invoice_items_to_dataframe(benchmark, invoice_items, convert):
+    table = benchmark(convert, invoice_items)
+    assert len(table) == len(invoice_items)
+
+
+@pytest.fixture
+def timesheet(size, project):
+    (timesheet,) = synthetic.create_timesheets(size, project, items_per_timesheet=size)
+    return timesheet
+
+
+def test_pack_timesheet_items(benchmark, timesheet):
+    items = list(timesheet.items)
+
+    def pack():
+        timesheet.items = list(items)
+        timesheet.items_blob = None
+        timesheet.pack_items()
+
+    benchmark(pack)
+    benchmark.extra_info["bytes"] = len(timesheet.items_blob)
+    assert timesheet.items_count == len(items)
+
+
+def test_unpack_timesheet_items(benchmark, timesheet):
+    timesheet.pack_items()
+
+    def unpack():
+        timesheet._invalidate_aggregates()
+        return timesheet.table
+
+    table = benchmark(unpack)
+    assert len(table) == timesheet.items_count
@@ -0,0 +1,54 @@
+"""Benchmarks of the application startup."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# modules the splash screen does without, they are imported when first needed
+DEFERRED_MODULES = ("pandas", "matplotlib", "altair", "pandera", "ics", "faker")
+
+
+def import_app(home: Path, *options: str) -> subprocess.CompletedProcess:
+    """Imports the app module in a fresh interpreter, as it is when the splash screen shows"""
+    environment = dict(
+        os.environ,
+        HOME=str(home),
+        PYTHONPATH=str(ROOT_DIR),
+    )
+    code = (
+        "import sys, app; "
+        f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=ROOT_DIR / "app",
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Cumulative import times in microseconds by module from the output of -X importtime"""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_app(benchmark, tmp_path):
+    """Measures the startup of the app up to the splash screen"""
+    benchmark.pedantic(import_app, args=(tmp_path,), rounds=5)
+
+    process = import_app(tmp_path, "-X", "importtime")
+    import_times = parse_importtime(process.stderr)
+    benchmark.extra_info["import_app_ms"] = import_times["app"] / 1000
+    benchmark.extra_info["import_flet_ms"] = import_times["flet"] / 1000
+    assert process.stdout.split() == []
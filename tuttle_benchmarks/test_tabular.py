@@ -0,0 +1,38 @@
+"""Benchmarks of displaying time tracking data as a table in the app."""
+
+import pytest
+
+from . import synthetic
+
+
+@pytest.fixture
+def data(size, projects):
+    return synthetic.create_time_tracking_data(size, projects).reset_index()
+
+
+def test_data_frame_to_data_table(benchmark, size, data, app_home):
+    from core.tabular import DEFAULT_ROWS_PER_PAGE, data_frame_to_data_table
+
+    table = benchmark(data_frame_to_data_table, data)
+    assert len(table.data_table.rows) == min(size, DEFAULT_ROWS_PER_PAGE)
+
+
+def test_sort_data_table(benchmark, data, app_home):
+    from core.tabular import data_frame_to_data_table
+
+    table = data_frame_to_data_table(data)
+    duration_index = list(data.columns).index("duration")
+
+    benchmark(table.sort_by, duration_index, ascending=False)
+    assert table.visible_rows[0][duration_index] == "0 days 08:00:00"
+
+
+def test_filter_data_table(benchmark, data, projects, app_home):
+    """Filters a table that has been filtered before, the first filter formats all cells"""
+    from core.tabular import data_frame_to_data_table
+
+    table = data_frame_to_data_table(data)
+    table.set_filter(projects[0].tag)
+
+    benchmark(table.set_filter, projects[1].tag)
+    assert table.row_count == (data["tag"] == projects[1].tag).sum()
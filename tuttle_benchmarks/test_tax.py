@@ -0,0 +1,21 @@
+"""Benchmarks of the income tax over many incomes, as in forecasting scenarios."""
+
+import numpy
+import pytest
+
+from tuttle import tax
+
+
+@pytest.fixture
+def incomes(size):
+    return numpy.random.default_rng(42).uniform(0, 300_000, size)
+
+
+def test_income_tax_germany_scalar(benchmark, incomes):
+    taxes = benchmark(lambda: [tax.income_tax_germany(income) for income in incomes])
+    assert len(taxes) == len(incomes)
+
+
+def test_income_tax_germany_vectorized(benchmark, incomes):
+    taxes = benchmark(tax.income_tax_germany_vectorized, incomes)
+    assert len(taxes) == len(incomes)
@@ -0,0 +1,77 @@
+"""Benchmarks of timesheet generation and time tracking rollups."""
+
+import pandas
+import pytest
+
+from tuttle import timetracking
+from tuttle.time import Cycle
+
+from . import synthetic
+
+
+def test_generate_timesheet(benchmark, size, projects, project):
+    data = synthetic.create_time_tracking_data(size, projects)
+
+    timesheet = benchmark(
+        timetracking.generate_timesheet,
+        data,
+        project,
+        period_start=synthetic.PERIOD_START,
+        period_end=synthetic.PERIOD_END,
+    )
+    assert len(timesheet.items) == (data["tag"] == project.tag).sum()
+
+
+def test_generate_monthly_timesheets(benchmark, size, projects, project):
+    data = synthetic.create_time_tracking_data(size, projects)
+    periods = [
+        (
+            synthetic.PERIOD_START.replace(month=month),
+            (pandas.Timestamp(2022, month, 1) + pandas.offsets.MonthEnd()).date(),
+        )
+        for month in range(1, 13)
+    ]
+
+    timesheets = benchmark(timetracking.generate_timesheets, data, project, periods)
+    assert sum(len(timesheet.items) for timesheet in timesheets) == (
+        (data["tag"] == project.tag).sum()
+    )
+
+
+@pytest.mark.parametrize("by", ["tag", "client"])
+def test_rollup(benchmark, size, projects, by):
+    data = synthetic.create_time_tracking_data(size, projects)
+
+    def rollup_all_cycles():
+        rollups = timetracking.TimeTrackingRollups(data, projects)
+        return [
+            rollups.rollup(by=by, cycle=cycle)
+            for cycle in (Cycle.daily, Cycle.weekly, Cycle.monthly, Cycle.quarterly)
+        ]
+
+    daily, *_ = benchmark(rollup_all_cycles)
+    assert daily["duration"].sum() == data["duration"].sum()
+
+
+def test_progress_all(benchmark, size, projects):
+    data = synthetic.create_time_tracking_data(size, projects)
+
+    progress = benchmark(timetracking.progress_all, projects, data)
+    assert progress["time_tracked"].sum() == data["duration"].sum()
+
+
+def test_compact(benchmark, size, projects):
+    data = synthetic.create_time_tracking_data(size, projects)
+
+    compacted = benchmark(timetracking.compact, data)
+    report = timetracking.memory_report(data, compacted)
+    benchmark.extra_info["bytes_before"] = int(report.loc["total", "before"])
+    benchmark.extra_info["bytes_after"] = int(report.loc["total", "after"])
+    assert report.loc["total", "after"] < report.loc["total", "before"]
+
+
+def test_evaluate_time_planning(benchmark, size, projects):
+    data = synthetic.create_time_tracking_data(size, projects)
+
+    evaluation = benchmark(timetracking.evaluate_time_planning, data, projects)
+    assert len(evaluation) == len(data)
@@ -0,0 +1,61 @@
+import json
+
+import numpy
+import pandas
+import pytest
+
+from tuttle import dataviz
+
+
+def create_planning_data(n_entries):
+    rng = numpy.random.default_rng(42)
+    return pandas.DataFrame(
+        {
+            "begin": pandas.date_range(
+                "2022-01-01 08:00", periods=n_entries, freq="h", tz="Europe/Berlin"
+            ),
+            "tag": rng.choice(["#HeatingEngineering", "#HeatingRepair"], n_entries),
+            "revenue": rng.uniform(0, 500, n_entries),
+        }
+    ).set_index("begin")
+
+
+def spec_size(chart):
+    return len(json.dumps(chart.to_dict()))
+
+
+@pytest.mark.parametrize("by", ["project", ("month", "project")])
+def test_plot_eval_time_planning_spec_size(by):
+    small = dataviz.plot_eval_time_planning(create_planning_data(1000), by=by)
+    large = dataviz.plot_eval_time_planning(create_planning_data(20000), by=by)
+
+    # one row per bar, independent of the number of entries
+    assert spec_size(small) < 10_000
+    assert spec_size(large) < 10_000
+
+
+def test_aggregate_time_planning():
+    planning_data = create_planning_data(2000)
+
+    by_project = dataviz.aggregate_time_planning(planning_data, by="project")
+    assert by_project["project"].tolist() == ["#HeatingEngineering", "#HeatingRepair"]
+    assert by_project["revenue"].sum() == pytest.approx(planning_data["revenue"].sum())
+
+    by_month = dataviz.aggregate_time_planning(planning_data, by=("month", "project"))
+    assert len(by_month) == 3 * 2
+    assert by_month["revenue"].sum() == pytest.approx(planning_data["revenue"].sum())
+    with pytest.raises(ValueError):
+        dataviz.aggregate_time_planning(planning_data, by="client")
+
+
+def test_data_transformer_writes_data_to_file(tmp_path):
+    chart = dataviz.plot_eval_time_planning(create_planning_data(1000), by="project")
+    filename = str(tmp_path / "{prefix}-{hash}.{extension}")
+
+    with dataviz.enable_data_transformer("json", filename=filename):
+        spec = chart.to_dict()
+
+    assert "url" in spec["data"]
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    with pytest.raises(ValueError):
+        dataviz.enable_data_transformer("parquet")
@@ -0,0 +1,77 @@
+import numpy
+import pandas
+import pytest
+
+from tuttle import forecasting, tax
+
+
+@pytest.fixture
+def planning_data():
+    return pandas.DataFrame(
+        {
+            "begin": pandas.to_datetime(
+                [
+                    "2022-11-02 08:00",
+                    "2022-11-03 08:00",
+                    "2023-01-05 00:00",
+                    "2023-01-06 08:00",
+                ]
+            ).tz_localize("Europe/Berlin"),
+            "duration": pandas.to_timedelta(["4h", "2h", "24h", "1h"]),
+            "tag": [
+                "#HeatingEngineering",
+                "#HeatingRepair",
+                "#HeatingEngineering",
+                "#Unplanned",
+            ],
+            "all_day": [False, False, True, False],
+        }
+    ).set_index("begin")
+
+
+def test_monthly_planned_revenue(planning_data, demo_projects):
+    monthly = forecasting.monthly_planned_revenue(planning_data, demo_projects)
+
+    assert list(monthly.index.astype(str)) == ["2022-11", "2022-12", "2023-01"]
+    assert list(monthly.columns) == ["#HeatingEngineering", "#HeatingRepair"]
+    assert monthly.loc[pandas.Period("2022-11", "M")].tolist() == [400, 100]
+    assert monthly.loc[pandas.Period("2022-12", "M")].sum() == 0
+    # the all-day entry counts as a workday of 8 hours
+    assert monthly.loc[pandas.Period("2023-01", "M"), "#HeatingEngineering"] == 800
+
+
+def test_forecast_income(planning_data, demo_projects):
+    monthly = forecasting.monthly_planned_revenue(planning_data, demo_projects)
+    forecast = forecasting.forecast_income(
+        monthly * 100, n_scenarios=2000, income_to_date=20000, seed=1
+    )
+
+    assert forecast.revenue.shape == (2000, 3)
+    assert (forecast.revenue <= monthly.sum(axis=1).to_numpy() * 100).all()
+    assert numpy.allclose(
+        forecast.revenue.mean(axis=0), monthly.sum(axis=1) * 100 * 0.9, rtol=0.01
+    )
+    # the tax of each year is the tax on its income, on top of the income to date
+    tax_2022 = tax.income_tax_germany_vectorized(
+        20000 + forecast.revenue[:, :2].sum(axis=1), year=2022
+    ) - tax.income_tax_germany(20000, year=2022)
+    assert numpy.allclose(forecast.tax[:, :2].sum(axis=1), tax_2022)
+    tax_2023 = tax.income_tax_germany_vectorized(forecast.revenue[:, 2], year=2023)
+    assert numpy.allclose(forecast.tax[:, 2], tax_2023)
+
+    quantiles = forecast.quantiles()
+    assert list(quantiles.index) == list(monthly.index)
+    revenue = quantiles["revenue"]
+    assert (revenue[0.05] <= revenue[0.5]).all()
+    assert (revenue[0.5] <= revenue[0.95]).all()
+    assert numpy.allclose(
+        quantiles["disposable_income"][0.5],
+        numpy.median(forecast.revenue - forecast.tax, axis=0),
+    )
+
+    again = forecasting.forecast_income(
+        monthly * 100, n_scenarios=2000, income_to_date=20000, seed=1
+    )
+    assert numpy.array_equal(again.revenue, forecast.revenue)
+    with pytest.raises(ValueError):
+        forecasting.forecast_income(monthly, realization=1.0)
@@ -3,8 +3,11 @@
 import datetime
 from pathlib import Path
 
-from tuttle import invoicing, timetracking, rendering
-from tuttle.model import Invoice, InvoiceItem
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from tuttle import invoicing, model, timetracking, rendering
+from tuttle.model import Contract, Invoice, InvoiceItem
+from tuttle.time import Cycle
 from tuttle.calendar import get_month_start_end
 
 
@@ -69,3 +72,65 @@ def test_generate_invoice(
             number=f"{datetime.date.today().strftime('%Y-%m-%d')}-{i}",
         )
         # assert invoice.total > 0
+
+
+def test_due_billing_periods():
+    contract = Contract(
+        title="Monthly service",
+        start_date=datetime.date(2022, 1, 15),
+        billing_cycle=Cycle.monthly,
+    )
+    today = datetime.date(2022, 4, 10)
+
+    periods = invoicing.due_billing_periods(contract, None, today)
+    assert periods == [
+        (datetime.date(2022, 1, 15), datetime.date(2022, 1, 31)),
+        (datetime.date(2022, 2, 1), datetime.date(2022, 2, 28)),
+        (datetime.date(2022, 3, 1), datetime.date(2022, 3, 31)),
+    ]
+    # nothing due until April is over
+    assert (
+        invoicing.due_billing_periods(contract, datetime.date(2022, 3, 31), today) == []
+    )
+    # the last period of a contract is due once the contract has ended
+    contract.end_date = datetime.date(2022, 4, 5)
+    assert invoicing.due_billing_periods(
+        contract, datetime.date(2022, 3, 31), today
+    ) == [(datetime.date(2022, 4, 1), datetime.date(2022, 4, 5))]
+
+    weeks = invoicing.billing_periods(
+        datetime.date(2022, 1, 1), datetime.date(2022, 1, 16), Cycle.weekly
+    )
+    assert weeks[0] == (datetime.date(2022, 1, 1), datetime.date(2022, 1, 2))
+    assert weeks[-1] == (datetime.date(2022, 1, 10), datetime.date(2022, 1, 16))
+
+
+def test_allocate_invoice_counter():
+    engine = create_engine("sqlite:///")
+    SQLModel.metadata.create_all(engine)
+    date = datetime.date(2022, 10, 3)
+    pattern = "INV-{counter:03}-{date:%Y}"
+
+    def allocate(date=date):
+        with Session(engine) as session:
+            counter = invoicing.allocate_invoice_counter(session, date, pattern)
+            session.commit()
+        return counter
+
+    # invoices numbered before the sequence existed, the second one deleted
+    with Session(engine) as session:
+        for number in ["INV-001-2022", "INV-003-2022", "INV-007-2021", "INV-X-2022"]:
+            session.add(Invoice(number=number, date=date))
+        session.commit()
+
+    assert [allocate() for _ in range(3)] == [4, 5, 6]
+
+    with Session(engine) as session:
+        last = session.exec(select(Invoice).where(Invoice.number == "INV-003-2022"))
+        session.delete(last.one())
+        session.commit()
+    assert allocate() == 7
+    assert [allocate(datetime.date(2023, 1, 2)) for _ in range(2)] == [1, 2]
+    assert model.invoice_number_counter("INV-012-2022", date, pattern) == 12
+    assert model.invoice_number_counter("INV-012-2021", date, pattern) is None
+    assert model.invoice_number_prefix(date, pattern) == "INV-"
@@ -6,6 +6,7 @@ import sqlite3
 from pathlib import Path
 from tracemalloc import stop
 
+import pandas
 import pytest
 from loguru import logger
 from pydantic import EmailStr, ValidationError
@@ -18,6 +19,8 @@ from tuttle.model import (
     Contact,
     Contract,
     Project,
+    TimeTrackingItem,
+    Timesheet,
     User,
     TimeUnit,
     Cycle,
@@ -231,3 +234,129 @@ class TestProject:
                     end_date=datetime.date(2022, 12, 31),
                 )
             )
+
+
+class TestTimesheet:
+    """Tests for the Timesheet model."""
+
+    def make_item(self, day: int, hours: int) -> TimeTrackingItem:
+        begin = datetime.datetime(2022, 10, day, 9)
+        return TimeTrackingItem(
+            begin=begin,
+            end=begin + datetime.timedelta(hours=hours),
+            duration=datetime.timedelta(hours=hours),
+            title="Work",
+            tag="#project_x",
+        )
+
+    def test_aggregates_follow_items(self):
+        timesheet = Timesheet(
+            title="Project X - October",
+            date=datetime.date(2022, 10, 31),
+            period_start=datetime.date(2022, 10, 1),
+            period_end=datetime.date(2022, 10, 31),
+        )
+        assert timesheet.total == datetime.timedelta(0)
+        timesheet.items.append(self.make_item(day=3, hours=4))
+        timesheet.items.append(self.make_item(day=2, hours=2))
+        assert timesheet.total == datetime.timedelta(hours=6)
+        assert timesheet.begin == datetime.datetime(2022, 10, 2, 9)
+        assert timesheet.end == datetime.datetime(2022, 10, 3, 13)
+        assert len(timesheet.table) == 2
+
+        timesheet.items[0].duration = datetime.timedelta(hours=5)
+        assert timesheet.total == datetime.timedelta(hours=7)
+        timesheet.items.pop()
+        assert timesheet.total == datetime.timedelta(hours=5)
+        assert timesheet.begin == datetime.datetime(2022, 10, 3, 9)
+        assert len(timesheet.table) == 1
+
+    def test_aggregates_skip_missing_values(self):
+        timesheet = Timesheet(
+            title="Project X - October",
+            date=datetime.date(2022, 10, 31),
+            period_start=datetime.date(2022, 10, 1),
+            period_end=datetime.date(2022, 10, 31),
+        )
+        incomplete = self.make_item(day=2, hours=2)
+        incomplete.end = None
+        incomplete.duration = None
+        timesheet.items.append(self.make_item(day=3, hours=4))
+        timesheet.items.append(incomplete)
+        assert timesheet.total == datetime.timedelta(hours=4)
+        assert timesheet.begin == datetime.datetime(2022, 10, 2, 9)
+        assert timesheet.end == datetime.datetime(2022, 10, 3, 13)
+        timesheet._invalidate_aggregates()
+        assert timesheet.total == datetime.timedelta(hours=4)
+        assert timesheet.end == datetime.datetime(2022, 10, 3, 13)
+
+    def test_pack_items(self):
+        timesheet = Timesheet(
+            title="Project X - October",
+            date=datetime.date(2022, 10, 31),
+            period_start=datetime.date(2022, 10, 1),
+            period_end=datetime.date(2022, 10, 31),
+        )
+        for day in range(1, 11):
+            timesheet.items.append(self.make_item(day=day, hours=day % 4 + 1))
+        table = timesheet.table
+        total = timesheet.total
+
+        timesheet.pack_items()
+        assert timesheet.packed
+        assert timesheet.items == []
+        assert timesheet.items_count == 10
+        assert timesheet.total == total
+        assert timesheet.begin == datetime.datetime(2022, 10, 1, 9)
+        pandas.testing.assert_frame_equal(
+            timesheet.table, table[model.PACKED_ITEM_COLUMNS]
+        )
+        assert [item.duration for item in timesheet.time_tracking_items] == list(
+            table["duration"]
+        )
+
+        engine = create_engine("sqlite:///")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(timesheet)
+            session.commit()
+        with Session(engine) as session:
+            assert session.exec(select(TimeTrackingItem)).all() == []
+            stored = session.exec(select(Timesheet)).one()
+            assert stored.total == total
+            assert not stored.empty
+            assert len(stored.table) == 10
+
+
+def test_to_dataframe_matches_records():
+    begin = pandas.Timestamp("2022-10-03 09:00", tz="CET")
+    items = [
+        TimeTrackingItem(
+            begin=begin + datetime.timedelta(days=day),
+            end=begin + datetime.timedelta(days=day, hours=2),
+            duration=pandas.Timedelta(hours=2),
+            title="Work",
+            tag="#project_x",
+            description=None if day % 2 else "Details",
+        )
+        for day in range(5)
+    ]
+
+    table = model.to_dataframe(items)
+
+    expected = pandas.DataFrame.from_records([item.dict() for item in items])
+    pandas.testing.assert_frame_equal(table, expected)
+    assert str(table["begin"].dt.tz) == "CET"
+    assert model.to_dataframe([]).empty
+
+
+def test_invoice_number_patterns():
+    date = datetime.date(2022, 10, 3)
+    invoice = model.Invoice(date=date)
+    assert invoice.generate_number(counter=12) == "2022-10-03-12"
+    assert invoice.number == "2022-10-03-12"
+    assert model.invoice_number_sequence_name(date) == "2022-10-03-#"
+
+    pattern = "INV-{date:%Y}-{counter:04}"
+    assert invoice.generate_number(pattern, counter=7) == "INV-2022-0007"
+    assert model.invoice_number_sequence_name(date, pattern) == "INV-2022-#"
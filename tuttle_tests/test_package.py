@@ -0,0 +1,19 @@
+"""Test the tuttle package."""
+
+import subprocess
+import sys
+
+import tuttle
+
+
+def test_import_does_not_load_submodules():
+    code = "import sys, tuttle; print('pandas' in sys.modules, 'tuttle.calendar' in sys.modules)"
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert process.stdout.split() == ["False", "False"]
+
+
+def test_submodules_load_on_access():
+    assert tuttle.timetracking.generate_timesheet is not None
+    assert "timetracking" in dir(tuttle)
@@ -80,6 +80,18 @@ class TestRenderInvoice:
 
         assert isinstance(result, str)
 
+    def test_formats_amounts_in_invoice_currency(self, fake):
+        user = demo.create_fake_user(fake)
+        invoice = demo.create_fake_invoice(fake, render=False)
+
+        invoice.contract.currency = "EUR"
+        html_eur = rendering.render_invoice(user=user, invoice=invoice, out_dir=None)
+        invoice.contract.currency = "USD"
+        html_usd = rendering.render_invoice(user=user, invoice=invoice, out_dir=None)
+
+        assert "$" not in html_eur
+        assert "$" in html_usd
+
     def test_creates_only_final_file(self, fake):
         user = demo.create_fake_user(fake)
         invoice = demo.create_fake_invoice(fake)
@@ -1,6 +1,46 @@
+from decimal import Decimal
+
+import numpy
+import pytest
+
 from tuttle import tax
 
 
 def test_income_tax():
     taxable_income = 42000
     income_tax = tax.income_tax_germany(taxable_income)
+
+
+def test_income_tax_germany_accepts_decimal():
+    assert tax.income_tax_germany(Decimal("42000")) == tax.income_tax_germany(42000)
+
+
+@pytest.mark.parametrize("year", sorted(tax.INCOME_TAX_TARIFFS_GERMANY))
+def test_income_tax_germany_vectorized_matches_scalar(year):
+    tariff = tax.INCOME_TAX_TARIFFS_GERMANY[year]
+    boundaries = numpy.array(
+        [
+            tariff.basic_allowance,
+            tariff.zone_2_end,
+            tariff.zone_3_end,
+            tariff.zone_4_end,
+        ]
+    )
+    incomes = numpy.concatenate(
+        [
+            numpy.random.default_rng(year).uniform(0, 400_000, 10_000),
+            numpy.arange(0, 300_000, 7.5),
+            (boundaries[:, None] + numpy.array([-0.5, 0, 0.5, 1])).ravel(),
+            [-1000],
+        ]
+    )
+
+    vectorized = tax.income_tax_germany_vectorized(incomes, year=year)
+
+    scalar = [tax.income_tax_germany(income, year=year) for income in incomes]
+    numpy.testing.assert_array_equal(vectorized, scalar)
+
+
+def test_income_tax_unknown_year():
+    with pytest.raises(NotImplementedError):
+        tax.income_tax("42000", "Germany", year=1999)
@@ -2,9 +2,12 @@
 from time import time
 import pandas
 import datetime
+import pandera
+import pytest
 
-from tuttle import timetracking
+from tuttle import invoicing, schema, timetracking
 from tuttle.calendar import get_month_start_end
+from tuttle.time import Cycle, TimeUnit
 
 
 def test_timetracking_import_toggl():
@@ -81,3 +84,185 @@ def test_create_timesheet(
     assert timesheet.date == datetime.date.today()
     assert timesheet.total == datetime.timedelta(hours=8)
     assert timesheet.empty == False
+
+
+def test_generate_timesheets_and_invoice(demo_projects):
+    begin = pandas.to_datetime(
+        ["2022-01-03 08:00", "2022-01-31 08:00", "2022-03-01 08:00", "2022-03-02 08:00"]
+    )
+    duration = pandas.to_timedelta(["4h", "2h", "3h", "1h"])
+    timetracking_data = pandas.DataFrame(
+        {
+            "begin": begin,
+            "end": begin + duration,
+            "duration": duration,
+            "title": "Task",
+            "tag": [
+                "#HeatingEngineering",
+                "#HeatingEngineering",
+                "#HeatingEngineering",
+                "#HeatingRepair",
+            ],
+            "description": "",
+            "all_day": False,
+        }
+    ).set_index("begin")
+    project = demo_projects[0]
+    periods = [
+        (datetime.date(2022, 1, 1), datetime.date(2022, 1, 31)),
+        (datetime.date(2022, 2, 1), datetime.date(2022, 2, 28)),
+        (datetime.date(2022, 3, 1), datetime.date(2022, 3, 31)),
+    ]
+
+    timesheets = timetracking.generate_timesheets(timetracking_data, project, periods)
+
+    rollups = timetracking.TimeTrackingRollups(timetracking_data, demo_projects)
+    assert rollups.periods_with_entries(project.tag, periods) == [
+        periods[0],
+        periods[2],
+    ]
+    assert rollups.periods_with_entries("#HeatingRepair", periods) == [periods[2]]
+    # no timesheet for February without entries
+    assert [timesheet.period_start.month for timesheet in timesheets] == [1, 3]
+    assert [timesheet.total for timesheet in timesheets] == [
+        datetime.timedelta(hours=6),
+        datetime.timedelta(hours=3),
+    ]
+    timesheets[1].pack_items()
+    invoice = invoicing.generate_invoice(
+        timesheets=timesheets,
+        contract=project.contract,
+        project=project,
+        number="2022-03-31-01",
+        date=datetime.date(2022, 3, 31),
+    )
+    assert [item.quantity for item in invoice.items] == [6, 3]
+    assert invoice.items[1].start_date == datetime.date(2022, 3, 1)
+    with pytest.raises(ValueError):
+        timetracking.generate_timesheets(timetracking_data, project, periods[1:2])
+
+
+def test_rollups(demo_projects):
+    data = pandas.DataFrame(
+        {
+            "begin": pandas.to_datetime(
+                [
+                    "2022-01-03 08:00",
+                    "2022-01-04 08:00",
+                    "2022-02-01 08:00",
+                    "2022-02-02 00:00",
+                    "2022-02-03 08:00",
+                ]
+            ),
+            "duration": pandas.to_timedelta(["4h", "2h", "3h", "24h", "1h"]),
+            "tag": [
+                "#HeatingEngineering",
+                "#HeatingRepair",
+                "#HeatingEngineering",
+                "#HeatingEngineering",
+                "#Unplanned",
+            ],
+            "all_day": [False, False, False, True, False],
+        }
+    ).set_index("begin")
+    rollups = timetracking.TimeTrackingRollups(data, demo_projects)
+
+    monthly = rollups.rollup(by="project", cycle=Cycle.monthly)
+    engineering = monthly.loc["Heating Engineering"]
+    assert engineering.loc[
+        pandas.Period("2022-01", "M"), "duration"
+    ] == pandas.Timedelta("4h")
+    # the all-day entry counts as a workday of 8 hours
+    assert engineering.loc[
+        pandas.Period("2022-02", "M"), "duration"
+    ] == pandas.Timedelta("11h")
+    assert engineering["billable_amount"].sum() == 15 * 100
+
+    by_tag = rollups.rollup(by="tag", cycle=None)
+    assert by_tag.loc["#Unplanned", "duration"] == pandas.Timedelta("1h")
+    assert pandas.isna(by_tag.loc["#Unplanned", "billable_amount"])
+
+    by_client = timetracking.total_time_tracked(data, demo_projects, by="client")
+    assert by_client["duration"].sum() == pandas.Timedelta("17h")
+    assert by_client["billable_amount"].sum() == 15 * 100 + 2 * 50
+
+    assert rollups.rollup(by="project", cycle=Cycle.monthly) is monthly
+    with pytest.raises(ValueError):
+        rollups.rollup(by="invoice")
+
+
+def test_progress_all(demo_projects):
+    demo_projects[0].contract.volume = 10
+    demo_projects[1].contract.unit = TimeUnit.day
+    demo_projects[1].contract.units_per_workday = 1
+    demo_projects[1].contract.volume = 4
+    data = pandas.DataFrame(
+        {
+            "begin": pandas.to_datetime(
+                ["2022-01-03 08:00", "2022-01-04 08:00", "2022-01-05 00:00"]
+            ),
+            "duration": pandas.to_timedelta(["4h", "3h", "24h"]),
+            "title": ["Design", "Design", "Repair"],
+            "description": ["", "", ""],
+            "tag": ["#HeatingEngineering", "#HeatingEngineering", "#HeatingRepair"],
+            "all_day": [False, False, True],
+        }
+    ).set_index("begin")
+
+    progress = timetracking.progress_all(demo_projects, data)
+
+    assert progress.loc["#HeatingEngineering", "units_tracked"] == 7
+    assert progress.loc["#HeatingEngineering", "progress"] == 0.7
+    # the all-day entry counts as one unit of the day rate contract
+    assert progress.loc["#HeatingRepair", "units_tracked"] == 1
+    assert progress.loc["#HeatingRepair", "progress"] == 0.25
+    assert timetracking.progress(demo_projects[0], data) == 0.7
+
+
+def test_compact(demo_projects):
+    data = timetracking.import_from_spreadsheet(
+        path="tuttle_tests/data/test_time_tracking_toggl.csv",
+        preset=timetracking.TogglPreset,
+    )
+
+    compacted = timetracking.compact(data)
+
+    assert compacted["tag"].dtype == "category"
+    assert compacted["title"].dtype == "category"
+    assert (compacted["tag"].astype(str) == data["tag"]).all()
+    assert compacted["duration"].sum() == data["duration"].sum()
+    report = timetracking.memory_report(data, compacted)
+    assert report.loc["total", "after"] < report.loc["total", "before"]
+    without_description = timetracking.compact(data, description=False)
+    assert without_description["description"].isna().all()
+    # the compact representation passes the schema of time tracking data
+    schema.time_tracking.validate(compacted)
+    schema.time_tracking.validate(without_description)
+    assert timetracking.progress(demo_projects[0], compacted) is not None
+    with pytest.raises(pandera.errors.SchemaError):
+        schema.time_tracking.validate(
+            compacted.assign(tag=pandas.Categorical(range(len(compacted))))
+        )
+
+
+def test_evaluate_time_planning(demo_projects):
+    demo_projects[1].contract.unit = TimeUnit.day
+    demo_projects[1].contract.units_per_workday = 1
+    demo_projects[1].contract.rate = 400
+    data = pandas.DataFrame(
+        {
+            "begin": pandas.to_datetime(
+                ["2022-01-03 08:00", "2022-01-04 00:00", "2022-01-05 00:00"]
+            ),
+            "duration": pandas.to_timedelta(["4h", "24h", "24h"]),
+            "tag": ["#HeatingEngineering", "#HeatingRepair", "#Unplanned"],
+            "all_day": [False, True, True],
+        }
+    ).set_index("begin")
+
+    evaluation = timetracking.evaluate_time_planning(data, demo_projects)
+
+    # the all-day entry counts as one unit of the day rate contract
+    assert evaluation["revenue"].tolist()[:2] == [400, 400]
+    assert pandas.isna(evaluation["revenue"].iloc[2])
+    assert evaluation.index.equals(data.index)
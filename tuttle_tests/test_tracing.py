@@ -0,0 +1,111 @@
+"""Test tracing module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tuttle import tracing
+from tuttle.calendar import ICSCalendar
+
+
+@pytest.fixture
+def enabled_tracing():
+    was_enabled = tracing.is_enabled()
+    tracing.reset()
+    tracing.enable()
+    yield
+    tracing.reset()
+    if not was_enabled:
+        tracing.disable()
+
+
+def test_disabled_tracing_records_nothing():
+    if tracing.is_enabled():
+        pytest.skip("tracing enabled by environment")
+    tracing.reset()
+    with tracing.span("outer"):
+        tracing.count("statements")
+    assert tracing.get_spans() == []
+
+
+def test_spans_nest_and_count(enabled_tracing):
+    with tracing.span("outer", category="test"):
+        tracing.count("statements")
+        with tracing.span("inner", category="test", detail="x"):
+            tracing.count("statements", 2)
+    inner, outer = tracing.get_spans()
+    assert inner.name == "inner" and outer.name == "outer"
+    assert inner.parent_id == outer.id
+    assert outer.parent_id is None
+    assert inner.args == {"detail": "x"}
+    assert inner.counters == {"statements": 2}
+    assert outer.counters == {"statements": 3}
+    assert outer.duration >= inner.duration
+
+
+def test_traced_decorator_records_errors(enabled_tracing):
+    @tracing.traced(category="test")
+    def fails():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        fails()
+    (span,) = tracing.get_spans()
+    assert span.name.endswith("fails")
+    assert span.args["error"] == "ValueError"
+
+
+def test_calendar_import_is_traced(enabled_tracing):
+    cal = ICSCalendar(
+        path=Path("tuttle_tests/data/TuttleDemo-TimeTracking.ics"),
+        name="Test Calendar",
+    )
+    cal.to_data()
+    names = [span.name for span in tracing.get_spans()]
+    assert "ICSCalendar.parse" in names
+    assert "ICSCalendar.to_data" in names
+
+
+def test_chrome_trace_export(enabled_tracing, tmp_path):
+    with tracing.span("outer"):
+        with tracing.span("inner"):
+            pass
+    path = tracing.export_chrome_trace(tmp_path / "trace.json")
+    with open(path) as trace_file:
+        trace = json.load(trace_file)
+    events = trace["traceEvents"]
+    assert [event["name"] for event in events] == ["inner", "outer"]
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+    assert events[0]["args"]["parent_id"] == events[1]["args"]["span_id"]
+    report = tracing.summary_report()
+    assert "outer" in report and "inner" in report
+
+
+def test_toggle_listeners_follow_runtime_enable():
+    was_enabled = tracing.is_enabled()
+    states = []
+    tracing.add_toggle_listener(states.append)
+    try:
+        tracing.enable()
+        tracing.disable()
+        assert states == [True, False]
+    finally:
+        tracing._toggle_listeners.remove(states.append)
+        if was_enabled:
+            tracing.enable()
+
+
+@pytest.mark.parametrize("setting", ["", "0", "false", "No", "OFF", " off "])
+def test_trace_setting_disabled(setting):
+    assert tracing._trace_path(setting) is None
+
+
+@pytest.mark.parametrize("setting", ["1", "true", "YES", "on"])
+def test_trace_setting_default_file(setting):
+    assert tracing._trace_path(setting) == Path("tuttle-trace.json")
+
+
+def test_trace_setting_path(tmp_path):
+    trace_file = tmp_path / "trace.json"
+    assert tracing._trace_path(str(trace_file)) == trace_file